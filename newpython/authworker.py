@@ -0,0 +1,78 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+# bcrypt cost factor for new hashes; each step doubles the hashing time
+bcrypt_rounds = int(os.environ.get('PERIODIC_BCRYPT_ROUNDS', 12))
+
+
+def hash_password(password, rounds=None):
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds or bcrypt_rounds))
+
+
+def check_password(password, hashed_password):
+    return bcrypt.checkpw(password.encode('utf-8'), hashed_password)
+
+
+# Cost factor a hash was made with, e.g. 12 for b'$2b$12$...'
+def hash_rounds(hashed_password):
+    return int(hashed_password.split(b'$')[2])
+
+
+# bcrypt hashes cannot be converted to a new cost without the password, so
+# outdated ones are replaced the next time their user logs in
+def needs_rehash(hashed_password, rounds=None):
+    return hash_rounds(hashed_password) != (rounds or bcrypt_rounds)
+
+
+# Runs slow auth work (bcrypt, database) on a thread pool and hands results back
+# to the Tk thread. Tk widgets may only be touched from the thread running
+# mainloop, so finished jobs are collected by polling with window.after()
+# rather than by callbacks from the worker threads.
+class AuthWorker:
+    def __init__(self, window, max_workers=2, poll_ms=30):
+        self.window = window
+        self.poll_ms = poll_ms
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='auth')
+        self.pending = []
+        self.polling = False
+
+    def busy(self):
+        return bool(self.pending)
+
+    # on_done(result) runs on the Tk thread; on_error(exception) too, if given
+    def submit(self, job, on_done, on_error=None, *args):
+        future = self.executor.submit(job, *args)
+        self.pending.append((future, on_done, on_error))
+        if not self.polling:
+            self.polling = True
+            self.window.after(self.poll_ms, self.poll)
+        return future
+
+    def poll(self):
+        finished = []
+        still_pending = []
+        for item in self.pending:
+            (finished if item[0].done() else still_pending).append(item)
+        self.pending = still_pending
+        for future, on_done, on_error in finished:
+            error = future.exception()
+            if error is None:
+                on_done(future.result())
+            elif on_error is not None:
+                on_error(error)
+            else:
+                raise error
+        if self.pending:
+            self.window.after(self.poll_ms, self.poll)
+        else:
+            self.polling = False
+
+    # For jobs nothing waits on, such as upgrading a password hash after a login
+    def run_later(self, job, *args):
+        return self.executor.submit(job, *args)
+
+    # With wait, queued jobs are finished first; otherwise they are dropped
+    def shutdown(self, wait=False):
+        self.executor.shutdown(wait=wait, cancel_futures=not wait)
@@ -0,0 +1,140 @@
+import http.client
+import json
+import os
+import threading
+import urllib.parse
+
+from authworker import check_password, hash_password, needs_rehash
+from dataset import load_dataset
+from userstore import UserStore
+
+# Classroom server to use instead of local files, e.g. http://teacher-pc:8765
+# (see server.py). Unset means everything is local, as on a single kiosk.
+server_url = os.environ.get('PERIODIC_SERVER')
+
+
+class BackendError(Exception):
+    pass
+
+
+# Elements and compounds are read from the binary dataset built by dataset.py.
+# periodic_data.py holds the editable source; the dataset is rebuilt from it
+# whenever it has been edited.
+def load_local_data():
+    return load_dataset()
+
+
+# Logins and registrations against the SQLite file on this machine
+class LocalBackend:
+    def __init__(self, db_path='user.db'):
+        self.store = UserStore(db_path)
+
+    def load_data(self):
+        return load_local_data()
+
+    # Returns 'ok', 'no_user' or 'bad_password'
+    def check_login(self, username, password):
+        hashed_password = self.store.get_password_hash(username)
+        if not hashed_password:
+            return 'no_user'
+        return 'ok' if check_password(password, hashed_password) else 'bad_password'
+
+    # Re-hashes the password at the current cost if it was stored at another one.
+    # Run as its own job after a successful login, so the login does not wait for it.
+    def upgrade_password(self, username, password):
+        hashed_password = self.store.get_password_hash(username)
+        if hashed_password and needs_rehash(hashed_password):
+            self.store.update_passwords([(username, hash_password(password))])
+
+    # Returns 'ok' or 'exists'
+    def register(self, username, password):
+        if self.store.user_exists(username):
+            return 'exists'
+        hashed = hash_password(password)
+        if not self.store.add_user(username, hashed):  # Taken by another kiosk meanwhile
+            return 'exists'
+        return 'ok'
+
+    def close(self):
+        self.store.close()
+
+
+# The same calls answered by a classroom server. Each thread keeps its own
+# keep-alive connection, since auth calls run on the auth worker threads.
+class RemoteBackend:
+    def __init__(self, url, timeout=10.0):
+        parts = urllib.parse.urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self.local = threading.local()
+
+    def connection(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = self.local.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return conn
+
+    def request(self, method, path, data=None):
+        body = None if data is None else json.dumps(data).encode('utf-8')
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        for attempt in range(2):
+            conn = self.connection()
+            try:
+                conn.request(method, path, body, headers)
+                response = conn.getresponse()
+                payload = response.read()
+                break
+            except (ConnectionError, http.client.HTTPException):
+                # The server drops idle keep-alive connections; retry once on a new one
+                conn.close()
+                self.local.conn = None
+                if attempt:
+                    raise
+        if response.status != 200:
+            raise BackendError(f"{method} {path} failed: {response.status} {response.reason}")
+        return json.loads(payload)
+
+    def load_data(self):
+        elements = self.request('GET', '/elements')
+        for data in elements.values():
+            data['color'] = tuple(data['color'])
+        return elements, self.request('GET', '/compounds')
+
+    def check_login(self, username, password):
+        return self.request('POST', '/login', {'username': username, 'password': password})['result']
+
+    def register(self, username, password):
+        return self.request('POST', '/register', {'username': username, 'password': password})['result']
+
+    # The server upgrades outdated hashes itself when a login succeeds
+    def upgrade_password(self, username, password):
+        pass
+
+    def close(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+
+
+def create_backend(url=None, db_path='user.db'):
+    url = url or server_url
+    if url:
+        return RemoteBackend(url)
+    return LocalBackend(db_path)
+
+
+# Game data from the server if one is configured, falling back to the local
+# dataset if it cannot be reached
+def load_data(url=None):
+    url = url or server_url
+    if url:
+        backend = RemoteBackend(url)
+        try:
+            return backend.load_data()
+        except (OSError, BackendError, ValueError) as error:
+            print(f"Could not load data from {url}, using local data: {error}")
+        finally:
+            backend.close()
+    return load_local_data()
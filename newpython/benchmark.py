@@ -0,0 +1,225 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+# Render into SDL's dummy driver so the benchmark runs on machines without a display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+import gamebasic
+from eventlog import read_log
+from textcache import text_cache
+
+frame_ms = 16  # Simulated time between frames, i.e. a steady 60 FPS
+
+
+def motion(pos):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+
+
+def button(event_type, pos):
+    return pygame.event.Event(event_type, pos=pos, button=1)
+
+
+def path(start, end, steps):
+    (x0, y0), (x1, y1) = start, end
+    return [(x0 + (x1 - x0) * i // steps, y0 + (y1 - y0) * i // steps) for i in range(1, steps + 1)]
+
+
+# Scripted input: every scenario is a list of frames, each a list of events
+def hover_sweep():
+    return [[motion(record.rect.center)] for record in gamebasic.table.cells]
+
+
+def drag_to_merge_area(symbol, game, steps=20):
+    start = gamebasic.table.records[symbol].rect.center
+    end = game.merge_area_rect.center
+    frames = [[motion(start)], [button(pygame.MOUSEBUTTONDOWN, start)]]
+    frames += [[motion(pos)] for pos in path(start, end, steps)]
+    frames.append([button(pygame.MOUSEBUTTONUP, end)])
+    return frames
+
+
+def merge_click(game):
+    return [[button(pygame.MOUSEBUTTONDOWN, game.merge_button.center)], []]
+
+
+def drag_and_merge(game):
+    frames = []
+    for symbol in ('H', 'O', 'H'):
+        frames += drag_to_merge_area(symbol, game)
+    frames += merge_click(game)
+    # A failed merge clears the merge area again
+    frames += drag_to_merge_area('Na', game)
+    frames += drag_to_merge_area('O', game)
+    frames += merge_click(game)
+    return frames
+
+
+def mixed(game):
+    return hover_sweep() + drag_and_merge(game) + hover_sweep()
+
+
+scenarios = {
+    'hover': lambda game: hover_sweep(),
+    'drag': drag_and_merge,
+    'mixed': mixed,
+}
+
+
+# Recorded input as JSON: {"frames": [[{"type": "MOUSEMOTION", "pos": [x, y]}, ...], ...]},
+# or an event log written by gamebasic.py --record
+def load_script(path):
+    if not path.endswith('.json'):
+        return [events for _, events in read_log(path).frames
+                if not any(event.type == pygame.QUIT for event in events)]
+    with open(path) as f:
+        data = json.load(f)
+    frames = []
+    for frame in data['frames']:
+        events = []
+        for spec in frame:
+            attrs = {key: tuple(value) if isinstance(value, list) else value
+                     for key, value in spec.items() if key != 'type'}
+            events.append(pygame.event.Event(getattr(pygame, spec['type']), **attrs))
+        frames.append(events)
+    return frames
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def play(frames, repeat, on_frame=None):
+    game = gamebasic.Game()
+    game.start()
+    for _ in range(repeat):
+        for events in frames:
+            if on_frame:
+                on_frame(True)
+            game.step(events, frame_ms)
+            if on_frame:
+                on_frame(False)
+    gamebasic.notifications.active.clear()
+    return game
+
+
+def measure_times(frames, repeat):
+    times = []
+    started = [0]
+
+    def on_frame(before):
+        if before:
+            started[0] = time.perf_counter_ns()
+        else:
+            times.append(time.perf_counter_ns() - started[0])
+
+    wall_start = time.perf_counter()
+    play(frames, repeat, on_frame)
+    wall = time.perf_counter() - wall_start
+    return times, wall
+
+
+# A separate pass under tracemalloc, which would otherwise distort the timings
+def measure_allocations(frames, repeat):
+    peaks = []
+    blocks = []
+    state = {}
+
+    def on_frame(before):
+        if before:
+            tracemalloc.reset_peak()
+            state['memory'] = tracemalloc.get_traced_memory()[0]
+            state['blocks'] = sys.getallocatedblocks()
+        else:
+            peaks.append(tracemalloc.get_traced_memory()[1] - state['memory'])
+            blocks.append(sys.getallocatedblocks() - state['blocks'])
+
+    tracemalloc.start()
+    try:
+        play(frames, repeat, on_frame)
+    finally:
+        tracemalloc.stop()
+    return peaks, blocks
+
+
+def summarise(values):
+    values = sorted(values)
+    return {
+        'mean': sum(values) / len(values) if values else 0.0,
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+        'max': values[-1] if values else 0.0,
+    }
+
+
+def run_benchmark(name, frames, repeat=3, warmup=1, allocations=True):
+    # Warm-up runs fill the text and shell caches the way a long session would
+    for _ in range(warmup):
+        play(frames, 1)
+    times, wall = measure_times(frames, repeat)
+    result = {
+        'scenario': name,
+        'frames': len(times),
+        'frame_time_ms': {key: value / 1e6 for key, value in summarise(times).items()},
+        'throughput_fps': len(times) / wall if wall else 0.0,
+        'text_cache': text_cache.stats(),
+    }
+    if allocations:
+        peaks, blocks = measure_allocations(frames, 1)
+        result['allocations'] = {
+            'peak_bytes_per_frame': summarise(peaks),
+            'net_blocks_per_frame': summarise(blocks),
+        }
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Headless frame-time benchmark for gamebasic')
+    parser.add_argument('--scenario', choices=sorted(scenarios), action='append',
+                        help='scenario to run (default: all); may be repeated')
+    parser.add_argument('--script', help='JSON script or --record event log to replay')
+    parser.add_argument('--repeat', type=int, default=3, help='timed passes over each scenario')
+    parser.add_argument('--warmup', type=int, default=1, help='untimed passes before measuring')
+    parser.add_argument('--no-allocations', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    parser.add_argument('--renderer', choices=('cpu', 'gpu'), default='cpu',
+                        help="backend to measure; gpu uses SDL's software renderer here")
+    args = parser.parse_args(argv)
+
+    gamebasic.init(args.renderer, software=True)
+    game = gamebasic.Game()
+    runs = []
+    if args.script:
+        runs.append((os.path.basename(args.script), load_script(args.script)))
+    for name in args.scenario or ([] if args.script else sorted(scenarios)):
+        runs.append((name, scenarios[name](game)))
+
+    report = {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'video_driver': pygame.display.get_driver(),
+        'renderer': gamebasic.renderer.name,
+        'results': [run_benchmark(name, frames, args.repeat, args.warmup, not args.no_allocations)
+                    for name, frames in runs],
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
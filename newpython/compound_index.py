@@ -0,0 +1,127 @@
+import math
+from collections import Counter
+
+reachable_cache_size = 4096  # Element sets remembered by reachable()
+
+
+# Canonical form of an element multiset, e.g. ['H', 'O', 'H'] -> (('H', 2), ('O', 1)).
+# Takes a list of symbols or a mapping of symbol -> count.
+def formula_key(symbols):
+    return tuple(sorted(Counter(symbols).items()))
+
+
+# The same multiset with every count divided by their gcd, and the gcd, e.g.
+# H4O2 -> ((('H', 2), ('O', 1)), 2)
+def reduced_key(key):
+    divisor = math.gcd(*(count for _, count in key)) if key else 1
+    return tuple((symbol, count // divisor) for symbol, count in key), divisor
+
+
+# The merge area: element counts rather than a list of tiles, so its size and
+# the cost of matching it do not grow with the number of tiles dropped in
+class MergePool:
+    def __init__(self):
+        self.counts = {}  # symbol -> count, in the order symbols were first added
+        self.total = 0
+        self.last = None  # Most recently added symbol
+
+    def add(self, symbol, count=1):
+        self.counts[symbol] = self.counts.get(symbol, 0) + count
+        self.total += count
+        self.last = symbol
+
+    def clear(self):
+        self.counts = {}
+        self.total = 0
+        self.last = None
+
+    def __len__(self):
+        return self.total
+
+    def items(self):
+        return self.counts.items()
+
+
+# Hash index over the compounds table. Exact merges are a single dict lookup and
+# partial merges are answered from a per-element index of the compounds using it.
+class CompoundIndex:
+    def __init__(self, compounds):
+        self.compounds = compounds
+        self.exact = {}
+        self.by_element = {}
+        self.needs = {}
+        self.reduced = {}
+        for formula, data in compounds.items():
+            key = formula_key(data['elements'])
+            self.needs[formula] = key
+            # Isomers share a multiset; the first one in table order wins, as it
+            # did with the linear scan
+            self.exact.setdefault(key, []).append(formula)
+            base, divisor = reduced_key(key)
+            self.reduced.setdefault(base, []).append((formula, divisor))
+            for symbol, count in key:
+                self.by_element.setdefault(symbol, {})[formula] = count
+
+        self.element_sets = {symbol: frozenset(required) for symbol, required in self.by_element.items()}
+        self.reachable_cache = {}
+
+        # Each compound is filed under its rarest element and grouped by its set
+        # of elements, so buildable() only looks at compounds anchored on an
+        # element of the pool and tests each element set once
+        self.by_anchor = {}
+        for formula, key in self.needs.items():
+            anchor = min((symbol for symbol, _ in key), key=lambda symbol: len(self.by_element[symbol]))
+            signature = frozenset(symbol for symbol, _ in key)
+            self.by_anchor.setdefault(anchor, {}).setdefault(signature, []).append(formula)
+
+    def __len__(self):
+        return len(self.compounds)
+
+    # The compound a merge forms and how many of it: an exact match, or else a
+    # whole multiple of one (H4O2 -> 2 x H2O). Returns (None, 0) if neither.
+    def react(self, symbols):
+        key = formula_key(symbols)
+        formulas = self.exact.get(key)
+        if formulas:
+            return formulas[0], 1
+        base, divisor = reduced_key(key)
+        for formula, compound_divisor in self.reduced.get(base, ()):
+            if divisor % compound_divisor == 0:
+                return formula, divisor // compound_divisor
+        return None, 0
+
+    # Compounds that can still be formed by adding more tiles to the merge area:
+    # those made of at least the elements in it, since any count can grow into
+    # a whole multiple (see react()). Unordered, and cached per element set, so
+    # a merge area that only grows in count costs one lookup.
+    def reachable(self, symbols):
+        signature = frozenset(symbols)
+        found = self.reachable_cache.get(signature)
+        if found is None:
+            sets = sorted((self.element_sets.get(symbol, frozenset()) for symbol in signature), key=len)
+            if not sets:
+                found = frozenset(self.compounds)
+            else:
+                found = sets[0].intersection(*sets[1:])
+            if len(self.reachable_cache) >= reachable_cache_size:
+                self.reachable_cache.clear()
+            self.reachable_cache[signature] = found
+        return found
+
+    # Compounds that can be built from a pool of atoms, each with the most
+    # copies the pool can make of it on its own, as (formula, copies) pairs
+    def buildable(self, symbols, limit=None):
+        counts = Counter(symbols)
+        available = counts.keys()
+        found = []
+        for anchor in counts:
+            for signature, formulas in self.by_anchor.get(anchor, {}).items():
+                if not signature <= available:
+                    continue
+                for formula in formulas:
+                    copies = min(counts[symbol] // count for symbol, count in self.needs[formula])
+                    if copies:
+                        found.append((formula, copies))
+                        if len(found) == limit:
+                            return found
+        return found
@@ -0,0 +1,197 @@
+import bisect
+import math
+import re
+from collections import Counter
+
+formula_token = re.compile(r'([A-Z][a-z]?)(\d*)|([(\[])|([)\]])(\d*)|[·.*](\d*)')
+
+
+# Element counts of a formula, e.g. 'Ca(OH)2' -> {'Ca': 1, 'O': 2, 'H': 2}.
+# Handles nested ( ) and [ ] groups and hydrate dots ('CuSO4·5H2O').
+def parse_formula(formula):
+    stack = [Counter()]
+    multiplier = 1  # Leading count of a hydrate part such as the 5 in ·5H2O
+    pos = 0
+    while pos < len(formula):
+        match = formula_token.match(formula, pos)
+        if match is None:
+            raise ValueError(f"Cannot parse formula {formula!r} at position {pos}")
+        symbol, count, opening, closing, group_count, hydrate_count = match.groups()
+        if symbol:
+            stack[-1][symbol] += int(count or 1) * multiplier
+        elif opening:
+            stack.append(Counter())
+        elif closing:
+            if len(stack) == 1:
+                raise ValueError(f"Unbalanced brackets in formula {formula!r}")
+            group = stack.pop()
+            for element, element_count in group.items():
+                stack[-1][element] += element_count * int(group_count or 1)
+        else:
+            multiplier = int(hydrate_count or 1)
+        pos = match.end()
+    if len(stack) != 1:
+        raise ValueError(f"Unbalanced brackets in formula {formula!r}")
+    return stack[0]
+
+
+def trigrams(text):
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# Search over the compounds table: stoichiometry parsed from each formula, an
+# inverted index from element to compounds, a sorted word list for prefix
+# matches on names, and a trigram index of name words for fuzzy matches.
+class CompoundSearch:
+    def __init__(self, compounds):
+        self.compounds = compounds
+        self.counts = {}
+        self.by_element = {}
+        self.words = []
+        self.name_words = {}
+        self.order = {}
+        # Fuzzy matching works on distinct name words: their formulas, their
+        # trigram counts and, per trigram, the ids of the words that have it
+        self.fuzzy_words = {}
+        self.word_formulas = []
+        self.word_sizes = []
+        self.by_trigram = {}
+        for formula, data in compounds.items():
+            self.order[formula] = len(self.order)
+            try:
+                counts = parse_formula(formula)
+            except ValueError:
+                counts = Counter(data['elements'])
+            self.counts[formula] = counts
+            for symbol in counts:
+                # Dicts keep table order and give O(1) membership tests
+                self.by_element.setdefault(symbol, {})[formula] = None
+            name = data['name'].lower().split()
+            self.name_words[formula] = name + [formula.lower()]
+            for word in self.name_words[formula]:
+                self.words.append((word, formula))
+            for word in name:
+                self.add_fuzzy_word(word, formula)
+        self.words.sort()
+
+    def add_fuzzy_word(self, word, formula):
+        word_id = self.fuzzy_words.get(word)
+        if word_id is None:
+            word_id = self.fuzzy_words[word] = len(self.word_formulas)
+            self.word_formulas.append([])
+            grams = trigrams(word)
+            self.word_sizes.append(len(grams))
+            for gram in grams:
+                self.by_trigram.setdefault(gram, set()).add(word_id)
+        formulas = self.word_formulas[word_id]
+        if not formulas or formulas[-1] != formula:
+            formulas.append(formula)
+
+    def prefix_bounds(self, prefix):
+        start = bisect.bisect_left(self.words, (prefix,))
+        end = bisect.bisect_left(self.words, (prefix + '\uffff',), start)
+        return start, end
+
+    def iter_prefix(self, prefix):
+        start, end = self.prefix_bounds(prefix)
+        seen = set()
+        for i in range(start, end):
+            formula = self.words[i][1]
+            if formula not in seen:
+                seen.add(formula)
+                yield formula
+
+    def has_word_prefix(self, formula, prefix):
+        return any(word.startswith(prefix) for word in self.name_words[formula])
+
+    # Ids of the name words that share enough trigrams with word, best match
+    # first. A word scoring at least threshold (Jaccard) shares at least
+    # ceil(threshold * len(query)) of the query's trigrams, so it has one of the
+    # rarest len(query) - that + 1 of them: only their words are candidates, and
+    # the commoner trigrams are just probed for those.
+    def fuzzy_word_ids(self, word, threshold=0.25):
+        query = trigrams(word.lower())
+        grams = sorted(query, key=lambda gram: len(self.by_trigram.get(gram, ())))
+        rare = len(query) - math.ceil(threshold * len(query)) + 1
+        shared = Counter()
+        for gram in grams[:rare]:
+            shared.update(self.by_trigram.get(gram, ()))
+        for gram in grams[rare:]:
+            word_ids = self.by_trigram.get(gram, ())
+            for word_id in shared:
+                if word_id in word_ids:
+                    shared[word_id] += 1
+        scored = []
+        for word_id, common in shared.items():
+            score = common / (len(query) + self.word_sizes[word_id] - common)
+            if score >= threshold:
+                scored.append((-score, word_id))
+        scored.sort()
+        return [word_id for _, word_id in scored]
+
+    def iter_fuzzy(self, word_ids):
+        seen = set()
+        for word_id in word_ids:
+            for formula in self.word_formulas[word_id]:
+                if formula not in seen:
+                    seen.add(formula)
+                    yield formula
+
+    def has_fuzzy_word(self, formula, word_ids):
+        return any(self.fuzzy_words.get(word) in word_ids for word in self.name_words[formula])
+
+    # Compounds with a name word close to word, best match first
+    def fuzzy(self, word, limit=10):
+        found = []
+        for formula in self.iter_fuzzy(self.fuzzy_word_ids(word)):
+            found.append(formula)
+            if len(found) == limit:
+                break
+        return found
+
+    # Free-text search as typed into the search box. Words that are element
+    # symbols (case as written, e.g. 'Na Cl') keep compounds containing them;
+    # other words match the start of a name word or the formula, or failing
+    # that the name fuzzily. The most selective condition picks the candidates
+    # and the rest are checked per candidate, so the cost follows the result
+    # size rather than the size of the table.
+    def search(self, query, limit=20):
+        symbols = []
+        prefixes = []
+        fuzzy_words = []
+        for word in query.split():
+            if word in self.by_element:
+                symbols.append(word)
+                continue
+            word = word.lower()
+            start, end = self.prefix_bounds(word)
+            (prefixes if end > start else fuzzy_words).append((end - start, word))
+
+        candidates = []
+        if symbols:
+            rarest = min(symbols, key=lambda symbol: len(self.by_element[symbol]))
+            candidates.append((len(self.by_element[rarest]), lambda: self.by_element[rarest]))
+        if prefixes:
+            count, word = min(prefixes)
+            candidates.append((count, lambda: self.iter_prefix(word)))
+        fuzzy_ids = []
+        for _, fuzzy_word in fuzzy_words:
+            word_ids = self.fuzzy_word_ids(fuzzy_word)
+            fuzzy_ids.append((sum(len(self.word_formulas[word_id]) for word_id in word_ids), word_ids))
+        if fuzzy_ids:
+            count, closest = min(fuzzy_ids)
+            candidates.append((count, lambda: self.iter_fuzzy(closest)))
+        fuzzy_sets = [set(word_ids) for _, word_ids in fuzzy_ids]
+        if not candidates:
+            return []
+
+        found = []
+        for formula in min(candidates, key=lambda candidate: candidate[0])[1]():
+            if (all(formula in self.by_element[symbol] for symbol in symbols)
+                    and all(self.has_word_prefix(formula, word) for _, word in prefixes)
+                    and all(self.has_fuzzy_word(formula, word_ids) for word_ids in fuzzy_sets)):
+                found.append(formula)
+                if len(found) == limit:
+                    break
+        return found
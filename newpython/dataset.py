@@ -0,0 +1,262 @@
+import hashlib
+import mmap
+import os
+import runpy
+import struct
+import tempfile
+from collections.abc import Mapping
+
+# Binary dataset layout:
+#   header | element records | compound records | sorted key indexes | string pool
+# Records are fixed width and refer to their strings by (offset, length) into
+# the UTF-8 string pool, so opening the file only maps it and reads the header.
+# periodic_data.py is the source it is built from; the header keeps a hash of
+# that file, and load_dataset() rebuilds the dataset whenever the two differ.
+here = os.path.dirname(os.path.abspath(__file__))
+dataset_path = os.path.join(here, 'periodic.dat')
+source_path = os.path.join(here, 'periodic_data.py')
+
+MAGIC = b'PTDS'
+VERSION = 2
+MAX_SHELLS = 8
+
+# magic, version, element count, compound count, then the offsets of the element
+# records, compound records, element key index, compound key index, string pool,
+# and the SHA-256 of the source file
+HEADER = struct.Struct('<4sHxxII5I32s')
+# symbol, name, electron_config (offset/length pairs), r, g, b, shell count,
+# flags, atomic_number, mass, shells
+ELEMENT_RECORD = struct.Struct('<6I4BBxHd8B')
+# formula, name, uses, properties, elements (offset/length pairs)
+COMPOUND_RECORD = struct.Struct('<10I')
+INDEX_ENTRY = struct.Struct('<I')
+
+MASS_IS_INT = 1
+
+
+class StringPool:
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = {}
+
+    def add(self, text):
+        encoded = text.encode('utf-8')
+        offset = self.offsets.get(encoded)
+        if offset is None:
+            offset = len(self.data)
+            self.offsets[encoded] = offset
+            self.data += encoded
+        return offset, len(encoded)
+
+
+# SHA-256 of the source file, or None if there is none
+def source_digest(path=source_path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).digest()
+    except FileNotFoundError:
+        return None
+
+
+def write_dataset(path, elements, compounds, digest=None):
+    pool = StringPool()
+    element_records = bytearray()
+    for symbol, info in elements.items():
+        shells = list(info['shells'])
+        if len(shells) > MAX_SHELLS:
+            raise ValueError(f"{symbol} has more than {MAX_SHELLS} shells")
+        mass = info['mass']
+        flags = MASS_IS_INT if isinstance(mass, int) else 0
+        element_records += ELEMENT_RECORD.pack(
+            *pool.add(symbol), *pool.add(info['name']), *pool.add(info['electron_config']),
+            *info['color'], len(shells), flags, info['atomic_number'], float(mass),
+            *(shells + [0] * (MAX_SHELLS - len(shells))))
+
+    compound_records = bytearray()
+    for formula, info in compounds.items():
+        compound_records += COMPOUND_RECORD.pack(
+            *pool.add(formula), *pool.add(info['name']), *pool.add(info['uses']),
+            *pool.add(info['properties']), *pool.add(','.join(info['elements'])))
+
+    element_index = b''.join(INDEX_ENTRY.pack(i) for i in sorted(range(len(elements)), key=list(elements).__getitem__))
+    compound_index = b''.join(INDEX_ENTRY.pack(i) for i in sorted(range(len(compounds)), key=list(compounds).__getitem__))
+
+    element_offset = HEADER.size
+    compound_offset = element_offset + len(element_records)
+    element_index_offset = compound_offset + len(compound_records)
+    compound_index_offset = element_index_offset + len(element_index)
+    pool_offset = compound_index_offset + len(compound_index)
+    header = HEADER.pack(MAGIC, VERSION, len(elements), len(compounds), element_offset, compound_offset,
+                         element_index_offset, compound_index_offset, pool_offset, digest or bytes(32))
+
+    # Write to a temporary file first so a running game never maps a half-written
+    # file. Its name is unique, so kiosks rebuilding at once do not share it.
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(element_records)
+            f.write(compound_records)
+            f.write(element_index)
+            f.write(compound_index)
+            f.write(pool.data)
+        os.chmod(temp_path, 0o644)  # mkstemp makes it private to this user
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+# Read-only mapping over one record table. Records are decoded on first access
+# and memoised; lookups binary-search the sorted key index in the file.
+class RecordView(Mapping):
+    def __init__(self, dataset, record, count, records_offset, index_offset, decode):
+        self.dataset = dataset
+        self.record = record
+        self.count = count
+        self.records_offset = records_offset
+        self.index_offset = index_offset
+        self.decode = decode
+        self.decoded = {}
+
+    def __len__(self):
+        return self.count
+
+    def record_fields(self, position):
+        return self.record.unpack_from(self.dataset.buffer, self.records_offset + position * self.record.size)
+
+    def key_at(self, position):
+        fields = self.record_fields(position)
+        return self.dataset.string(fields[0], fields[1])
+
+    def sorted_position(self, i):
+        return INDEX_ENTRY.unpack_from(self.dataset.buffer, self.index_offset + i * INDEX_ENTRY.size)[0]
+
+    def find(self, key):
+        if not isinstance(key, str):
+            return None
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.key_at(self.sorted_position(mid)) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count:
+            position = self.sorted_position(lo)
+            if self.key_at(position) == key:
+                return position
+        return None
+
+    def __getitem__(self, key):
+        value = self.decoded.get(key)
+        if value is not None:
+            return value
+        position = self.find(key)
+        if position is None:
+            raise KeyError(key)
+        value = self.decode(self.dataset, self.record_fields(position))
+        self.decoded[key] = value
+        return value
+
+    def __contains__(self, key):
+        return key in self.decoded or self.find(key) is not None
+
+    # Iteration follows the order the table was written in, like the source dicts
+    def __iter__(self):
+        for position in range(self.count):
+            yield self.key_at(position)
+
+
+def decode_element(dataset, fields):
+    shell_count, flags, atomic_number, mass = fields[9], fields[10], fields[11], fields[12]
+    return {
+        'name': dataset.string(fields[2], fields[3]),
+        'color': tuple(fields[6:9]),
+        'atomic_number': atomic_number,
+        'mass': int(mass) if flags & MASS_IS_INT else mass,
+        'electron_config': dataset.string(fields[4], fields[5]),
+        'shells': list(fields[13:13 + shell_count]),
+    }
+
+
+def decode_compound(dataset, fields):
+    return {
+        'elements': dataset.string(fields[8], fields[9]).split(','),
+        'name': dataset.string(fields[2], fields[3]),
+        'uses': dataset.string(fields[4], fields[5]),
+        'properties': dataset.string(fields[6], fields[7]),
+    }
+
+
+class Dataset:
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        try:
+            self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses empty files
+            self.file.close()
+            raise ValueError(f"{path} is empty")
+        (magic, version, element_count, compound_count, element_offset, compound_offset,
+         element_index_offset, compound_index_offset, self.pool_offset,
+         self.source_digest) = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} periodic table dataset")
+        self.elements = RecordView(self, ELEMENT_RECORD, element_count, element_offset, element_index_offset, decode_element)
+        self.compounds = RecordView(self, COMPOUND_RECORD, compound_count, compound_offset, compound_index_offset, decode_compound)
+
+    def string(self, offset, length):
+        start = self.pool_offset + offset
+        return str(self.buffer[start:start + length], 'utf-8')
+
+    def close(self):
+        self.buffer.close()
+        self.file.close()
+
+
+def open_dataset(path=dataset_path):
+    dataset = Dataset(path)
+    return dataset.elements, dataset.compounds
+
+
+# The elements and compounds defined in a source file like periodic_data.py.
+# Run rather than imported, so an edit made while the program runs is seen.
+def read_source(path=source_path):
+    source = runpy.run_path(path)
+    return source['elements'], source['compounds']
+
+
+# The dataset at path, first rebuilt from the source file if that has changed
+# since the dataset was written. Without a source file the dataset is used as
+# it is; if it cannot be rewritten, the source is used directly.
+def load_dataset(path=dataset_path, source=source_path):
+    digest = source_digest(source)
+    try:
+        dataset = Dataset(path)
+    except (FileNotFoundError, ValueError):
+        if digest is None:
+            raise
+        dataset = None
+    if dataset is not None:
+        if digest is None or dataset.source_digest == digest:
+            return dataset.elements, dataset.compounds
+        dataset.close()
+    elements, compounds = read_source(source)
+    try:
+        write_dataset(path, elements, compounds, digest)
+    except OSError as error:
+        print(f"Could not rebuild {path}: {error}")
+        return elements, compounds
+    return open_dataset(path)
+
+
+# Rebuild the dataset from periodic_data.py: python dataset.py [output path]
+if __name__ == '__main__':
+    import sys
+
+    output = sys.argv[1] if len(sys.argv) > 1 else dataset_path
+    elements, compounds = read_source()
+    write_dataset(output, elements, compounds, source_digest())
+    print(f"Wrote {len(elements)} elements and {len(compounds)} compounds to {output}")
@@ -0,0 +1,220 @@
+import json
+import struct
+import time
+
+import pygame
+
+# Binary event log, little-endian:
+#   header  magic, version, window width and height, starting mouse position
+#   frames  elapsed ms passed to Game.step(), event count, then per event its
+#           type, attribute count and the attributes
+#   footer  a frame with end_marker as its event count, followed by the
+#           game's final state as length-prefixed JSON
+MAGIC = b'PTEV'
+VERSION = 2
+HEADER = struct.Struct('<4sHHHhh')
+FRAME = struct.Struct('<IH')
+EVENT = struct.Struct('<HB')
+LENGTH = struct.Struct('<I')
+FOOTER_LENGTH = struct.Struct('<I')
+# 64 bits, since SDL touch, finger and device ids use the full range
+INT = struct.Struct('<q')
+FLOAT = struct.Struct('<d')
+int_range = range(-2 ** 63, 2 ** 63)
+end_marker = 0xFFFF
+
+# Attribute names get a one-byte code; anything else is written out in full
+attribute_names = ('pos', 'rel', 'buttons', 'button', 'touch', 'key', 'mod', 'unicode', 'scancode', 'w', 'h',
+                   'x', 'y', 'size', 'text', 'start', 'length', 'gain', 'state', 'which', 'flipped',
+                   'precise_x', 'precise_y', 'instance_id')
+attribute_codes = {name: code for code, name in enumerate(attribute_names)}
+inline_name = 0xFF
+
+
+def encode_value(value):
+    if value is None:
+        return b'n'
+    if isinstance(value, bool):
+        return b'b' + bytes([value])
+    if isinstance(value, int):
+        if value not in int_range:
+            # Unsigned 64-bit ids past the signed range are kept as their decimal digits
+            data = str(value).encode('ascii')
+            return b'I' + LENGTH.pack(len(data)) + data
+        return b'i' + INT.pack(value)
+    if isinstance(value, float):
+        return b'f' + FLOAT.pack(value)
+    if isinstance(value, str):
+        data = value.encode('utf-8')
+        return b's' + LENGTH.pack(len(data)) + data
+    if (isinstance(value, (tuple, list)) and len(value) < 256
+            and all(isinstance(item, int) and item in int_range for item in value)):
+        return b't' + bytes([len(value)]) + b''.join(INT.pack(item) for item in value)
+    return None
+
+
+def encode_event(event):
+    attributes = []
+    for name, value in event.__dict__.items():
+        encoded = encode_value(value)
+        if encoded is None:
+            # Window objects and the like cannot be replayed and are left out
+            continue
+        code = attribute_codes.get(name, inline_name)
+        data = bytes([code])
+        if code == inline_name:
+            name_data = name.encode('utf-8')
+            data += bytes([len(name_data)]) + name_data
+        attributes.append(data + encoded)
+    return EVENT.pack(event.type, len(attributes)) + b''.join(attributes)
+
+
+def final_state(game):
+    return {'merge_area': [[symbol, count] for symbol, count in game.merge_area.items()],
+            'info_area': list(game.info_area)}
+
+
+# Writes every frame's events as run() sees them, then the final state
+class EventRecorder:
+    def __init__(self, path, game, size):
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, size[0], size[1], *game.mouse_pos))
+        self.frames = 0
+
+    def frame(self, elapsed_ms, events):
+        self.file.write(FRAME.pack(int(elapsed_ms), len(events)))
+        for event in events:
+            self.file.write(encode_event(event))
+        self.frames += 1
+
+    def finish(self, game):
+        state = json.dumps(final_state(game)).encode('utf-8')
+        self.file.write(FRAME.pack(0, end_marker) + FOOTER_LENGTH.pack(len(state)) + state)
+        self.file.close()
+
+
+class EventLog:
+    def __init__(self, size, mouse_pos, frames, state):
+        self.size = size
+        self.mouse_pos = mouse_pos
+        self.frames = frames  # [(elapsed_ms, [events])]
+        self.state = state  # final_state() at the end of the recording, or None if it was cut short
+
+
+def read_log(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, width, height, mouse_x, mouse_y = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} event log")
+    pos = HEADER.size
+    frames = []
+    state = None
+    while pos < len(data):
+        elapsed, count = FRAME.unpack_from(data, pos)
+        pos += FRAME.size
+        if count == end_marker:
+            length, = FOOTER_LENGTH.unpack_from(data, pos)
+            pos += FOOTER_LENGTH.size
+            state = json.loads(data[pos:pos + length])
+            break
+        events = []
+        for _ in range(count):
+            event_type, attribute_count = EVENT.unpack_from(data, pos)
+            pos += EVENT.size
+            attributes = {}
+            for _ in range(attribute_count):
+                code = data[pos]
+                pos += 1
+                if code == inline_name:
+                    name = data[pos + 1:pos + 1 + data[pos]].decode('utf-8')
+                    pos += 1 + data[pos]
+                else:
+                    name = attribute_names[code]
+                tag = data[pos:pos + 1]
+                pos += 1
+                if tag == b'n':
+                    value = None
+                elif tag == b'b':
+                    value = bool(data[pos])
+                    pos += 1
+                elif tag == b'i':
+                    value, = INT.unpack_from(data, pos)
+                    pos += INT.size
+                elif tag == b'f':
+                    value, = FLOAT.unpack_from(data, pos)
+                    pos += FLOAT.size
+                elif tag in (b's', b'I'):
+                    length, = LENGTH.unpack_from(data, pos)
+                    value = data[pos + LENGTH.size:pos + LENGTH.size + length].decode('utf-8')
+                    if tag == b'I':
+                        value = int(value)
+                    pos += LENGTH.size + length
+                else:
+                    length = data[pos]
+                    value = struct.unpack_from(f'<{length}q', data, pos + 1)
+                    pos += 1 + length * INT.size
+                attributes[name] = value
+            events.append(pygame.event.Event(event_type, attributes))
+        frames.append((elapsed, events))
+    return EventLog((width, height), (mouse_x, mouse_y), frames, state)
+
+
+# Stands in for FrameScheduler and feeds a recorded log back through run().
+# Every frame gets the recorded events and elapsed time, so the game sees
+# exactly what it saw while recording. With fast=True frames follow each other
+# immediately; otherwise they are paced as they were recorded.
+class ReplayScheduler:
+    def __init__(self, log, fast=False):
+        self.log = log
+        self.fast = fast
+        self.index = 0
+        self.started = None
+        self.scheduled_ms = 0
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+
+    def prepare(self, game):
+        game.mouse_pos = self.log.mouse_pos
+        self.started = time.perf_counter()
+
+    def next_events(self, busy):
+        if self.index >= len(self.log.frames):
+            # Cut-short recordings end as if the window had been closed
+            return [pygame.event.Event(pygame.QUIT)]
+        events = self.log.frames[self.index][1]
+        self.index += 1
+        return events
+
+    def frame_done(self, drawn):
+        if drawn:
+            self.frames_drawn += 1
+        else:
+            self.frames_skipped += 1
+
+    def tick(self):
+        if self.index >= len(self.log.frames):
+            return 0
+        elapsed = self.log.frames[self.index][0]
+        self.scheduled_ms += elapsed
+        if not self.fast:
+            delay = self.started + self.scheduled_ms / 1000 - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        return elapsed
+
+    def get_fps(self):
+        seconds = time.perf_counter() - self.started
+        return self.frames_drawn / seconds if seconds > 0 else 0.0
+
+    def stats(self):
+        return {'frames_drawn': self.frames_drawn, 'frames_skipped': self.frames_skipped,
+                'frames_replayed': self.index, 'frames_recorded': len(self.log.frames)}
+
+    # Differences between the game's final state and the recorded one, as lines
+    def verify(self, game):
+        if self.log.state is None:
+            return ["the recording has no final state to compare against"]
+        actual = final_state(game)
+        return [f"{key}: recorded {self.log.state[key]!r}, replayed {actual[key]!r}"
+                for key in self.log.state if self.log.state[key] != actual.get(key)]
@@ -0,0 +1,76 @@
+import json
+import os
+import threading
+
+import pygame
+
+# Resolved system font paths, kept between runs so SysFont's scan of the
+# installed fonts (fc-list on Linux) only happens once per machine
+font_cache_path = os.path.join(os.path.expanduser('~'), '.cache', 'periodic_table', 'fonts.json')
+
+resolve_lock = threading.Lock()
+resolved_paths = None
+
+
+def load_font_cache():
+    try:
+        with open(font_cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_font_cache(paths):
+    try:
+        os.makedirs(os.path.dirname(font_cache_path), exist_ok=True)
+        temp_path = font_cache_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(paths, f)
+        os.replace(temp_path, font_cache_path)
+    except OSError:
+        # A read-only home directory only costs the lookup on the next start
+        pass
+
+
+# Path of a system font by name, or None for pygame's default font, as SysFont would pick
+def resolve_sysfont(name, bold=False, italic=False):
+    global resolved_paths
+    key = f'{name}|{int(bold)}|{int(italic)}'
+    with resolve_lock:
+        if resolved_paths is None:
+            resolved_paths = load_font_cache()
+        if key in resolved_paths:
+            path = resolved_paths[key]
+            if path is None or os.path.exists(path):
+                return path
+        path = pygame.font.match_font(name, bold, italic)
+        resolved_paths[key] = path
+        save_font_cache(resolved_paths)
+        return path
+
+
+# Stands in for a pygame Font and creates the real one the first time it is
+# used, so fonts nobody draws with are never loaded
+class LazyFont:
+    def __init__(self, name, size, bold=False, sysfont=False):
+        self.name = name
+        self.point_size = size
+        self.bold = bold
+        self.sysfont = sysfont
+        self.font = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        with self.lock:
+            if self.font is None:
+                if not pygame.font.get_init():
+                    pygame.font.init()
+                path = resolve_sysfont(self.name) if self.sysfont else self.name
+                font = pygame.font.Font(path, self.point_size)
+                if self.bold:
+                    font.set_bold(True)
+                self.font = font
+        return self.font
+
+    def __getattr__(self, attribute):
+        return getattr(self.font or self.load(), attribute)
@@ -1,13 +1,39 @@
+from profiler import FrameProfiler, StartupTimer
+
+# Startup is measured from here; see --startup-profile
+startup_budget_ms = 400
+startup = StartupTimer(startup_budget_ms)
+
+import argparse
 import pygame
 import sys
-import math
-
-pygame.init()
 
-# Display screen settings
-width, height = 1280, 720
-screen = pygame.display.set_mode((width, height))
-pygame.display.set_caption('Periodic Table')
+from compound_index import MergePool
+from eventlog import EventRecorder, ReplayScheduler, read_log
+from fonts import LazyFont
+from info_panel import InfoPanel
+from notifications import NotificationQueue
+from scheduler import FrameScheduler
+from launcher import Session
+from layout import Layout, base_height, base_width
+from progress import PlayerProgress, ProgressStore
+from renderers import create_renderer
+from shell_diagram import ShellDiagrams, dot_radius
+from snapshot import load_game_data
+from sprites import SpriteLayer
+from table_geometry import (TableGeometry, base_cell_size, base_grid_padding, base_shell_panel_size,
+                            base_table_offset_x, periodic_table_layout)
+from textcache import render_text, text_cache
+from tile_atlas import TileAtlas
+
+startup.mark('imports')
+
+# Display screen settings. Everything is placed on a 1280x720 design canvas
+# that the current Layout scales to the window size (see apply_layout())
+width, height = base_width, base_height
+layout = Layout(width, height)
+renderer = None  # Created by init(); see renderers.py
+screen = None  # What frames are drawn on: the display surface, or the GPU renderer
 
 # Colors
 background = (44, 44, 47)
@@ -15,486 +41,668 @@ white = (255, 255, 255)
 black = (0, 0, 0)
 red = (255, 0, 0)
 element_font_color = (82, 87, 93)
-
-# Colors for element groups
-alkali_metals = (255, 204, 204)
-alkali_earth_metals = (255, 229, 204)
-transition_metals = (255, 255, 204)
-post_transition_metals = (229, 255, 204)
-metalloids = (204, 255, 204)
-nonmetals = (204, 255, 229)
-halogens = (204, 229, 255)
-noble_gas = (229, 204, 255)
-lanthanides = (255, 204, 229)
-actinides = (225, 229, 204)
-
-# Setup fonts
-font = pygame.font.Font(None, 29)
-large_font = pygame.font.Font(None, 36)
-bold_font = pygame.font.Font(None, 33)
-bold_font.set_bold(True)
-element_font = pygame.font.SysFont("arial", 28)
-popup_font = pygame.font.Font(None, 46)
-
-# Element cell size and layout
-cell_size = 53  # Size of each element cell in pixels
-grid_padding = 4  # Padding between cells in pixels
-table_offset_x = 80  # Horizontal offset for the entire periodic table
-
-# Elements
-elements = {
-    'H': {'name': 'Hydrogen', 'color': nonmetals, 'atomic_number': 1, 'mass': 1.008, 'electron_config': '1s1', 'shells': [1]},
-    'He': {'name': 'Helium', 'color': noble_gas, 'atomic_number': 2, 'mass': 4.003, 'electron_config': '1s2', 'shells': [2]},
-    'Li': {'name': 'Lithium', 'color': alkali_metals, 'atomic_number': 3, 'mass': 6.94, 'electron_config': '1s2 2s1', 'shells': [2, 1]},
-    'Be': {'name': 'Beryllium', 'color': alkali_earth_metals, 'atomic_number': 4, 'mass': 9.0122, 'electron_config': '1s2 2s2', 'shells': [2, 2]},
-    'B': {'name': 'Boron', 'color': metalloids, 'atomic_number': 5, 'mass': 10.81, 'electron_config': '1s2 2s2 2p1', 'shells': [2, 3]},
-    'C': {'name': 'Carbon', 'color': nonmetals, 'atomic_number': 6, 'mass': 12.011, 'electron_config': '1s2 2s2 2p2', 'shells': [2, 4]},
-    'N': {'name': 'Nitrogen', 'color': nonmetals, 'atomic_number': 7, 'mass': 14.007, 'electron_config': '1s2 2s2 2p3', 'shells': [2, 5]},
-    'O': {'name': 'Oxygen', 'color': nonmetals, 'atomic_number': 8, 'mass': 15.999, 'electron_config': '1s2 2s2 2p4', 'shells': [2, 6]},
-    'F': {'name': 'Fluorine', 'color': halogens, 'atomic_number': 9, 'mass': 18.998, 'electron_config': '1s2 2s2 2p5', 'shells': [2, 7]},
-    'Ne': {'name': 'Neon', 'color': noble_gas, 'atomic_number': 10, 'mass': 20.180, 'electron_config': '1s2 2s2 2p6', 'shells': [2, 8]},
-    'Na': {'name': 'Sodium', 'color': alkali_metals, 'atomic_number': 11, 'mass': 22.990, 'electron_config': '1s2 2s2 2p6 3s1', 'shells': [2, 8, 1]},
-    'Mg': {'name': 'Magnesium', 'color': alkali_earth_metals, 'atomic_number': 12, 'mass': 24.305, 'electron_config': '1s2 2s2 2p6 3s2', 'shells': [2, 8, 2]},
-    'Al': {'name': 'Aluminum', 'color': post_transition_metals, 'atomic_number': 13, 'mass': 26.982, 'electron_config': '1s2 2s2 2p6 3s2 3p1', 'shells': [2, 8, 3]},
-    'Si': {'name': 'Silicon', 'color': metalloids, 'atomic_number': 14, 'mass': 28.085, 'electron_config': '1s2 2s2 2p6 3s2 3p2', 'shells': [2, 8, 4]},
-    'P': {'name': 'Phosphorus', 'color': nonmetals, 'atomic_number': 15, 'mass': 30.974, 'electron_config': '1s2 2s2 2p6 3s2 3p3', 'shells': [2, 8, 5]},
-    'S': {'name': 'Sulfur', 'color': nonmetals, 'atomic_number': 16, 'mass': 32.06, 'electron_config': '1s2 2s2 2p6 3s2 3p4', 'shells': [2, 8, 6]},
-    'Cl': {'name': 'Chlorine', 'color': halogens, 'atomic_number': 17, 'mass': 35.45, 'electron_config': '1s2 2s2 2p6 3s2 3p5', 'shells': [2, 8, 7]},
-    'Ar': {'name': 'Argon', 'color': noble_gas, 'atomic_number': 18, 'mass': 39.948, 'electron_config': '1s2 2s2 2p6 3s2 3p6', 'shells': [2, 8, 8]},
-    'K': {'name': 'Potassium', 'color': alkali_metals, 'atomic_number': 19, 'mass': 39.098, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s1', 'shells': [2, 8, 8, 1]},
-    'Ca': {'name': 'Calcium', 'color': alkali_earth_metals, 'atomic_number': 20, 'mass': 40.078, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2', 'shells': [2, 8, 8, 2]},
-    'Sc': {'name': 'Scandium', 'color': transition_metals, 'atomic_number': 21, 'mass': 44.956, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d1', 'shells': [2, 8, 9, 1]},
-    'Ti': {'name': 'Titanium', 'color': transition_metals, 'atomic_number': 22, 'mass': 47.867, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d2', 'shells': [2, 8, 10, 2]},
-    'V': {'name': 'Vanadium', 'color': transition_metals, 'atomic_number': 23, 'mass': 50.942, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d3', 'shells': [2, 8, 11, 2]},
-    'Cr': {'name': 'Chromium', 'color': transition_metals, 'atomic_number': 24, 'mass': 51.996, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s1 3d5', 'shells': [2, 8, 13, 1]},
-    'Mn': {'name': 'Manganese', 'color': transition_metals, 'atomic_number': 25, 'mass': 54.938, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d5', 'shells': [2, 8, 13, 2]},
-    'Fe': {'name': 'Iron', 'color': transition_metals, 'atomic_number': 26, 'mass': 55.845, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d6', 'shells': [2, 8, 14, 2]},
-    'Co': {'name': 'Cobalt', 'color': transition_metals, 'atomic_number': 27, 'mass': 58.933, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d7', 'shells': [2, 8, 15, 2]},
-    'Ni': {'name': 'Nickel', 'color': transition_metals, 'atomic_number': 28, 'mass': 58.933, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d8', 'shells': [2, 8, 16, 2]},
-    'Cu': {'name': 'Copper', 'color': transition_metals, 'atomic_number': 29, 'mass': 63.546, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s1 3d10', 'shells': [2, 8, 18, 1]},
-    'Zn': {'name': 'Zinc', 'color': transition_metals, 'atomic_number': 30, 'mass': 65.38, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10', 'shells': [2, 8, 18, 2]},
-    'Ga': {'name': 'Gallium', 'color': post_transition_metals, 'atomic_number': 31, 'mass': 69.723, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p1', 'shells': [2, 8, 18, 3]},
-    'Ge': {'name': 'Germanium', 'color': metalloids, 'atomic_number': 32, 'mass': 72.63, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p2', 'shells': [2, 8, 18, 4]},
-    'As': {'name': 'Arsenic', 'color': metalloids, 'atomic_number': 33, 'mass': 74.922, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p3', 'shells': [2, 8, 18, 5]},
-    'Se': {'name': 'Selenium', 'color': nonmetals, 'atomic_number': 34, 'mass': 78.971, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p4', 'shells': [2, 8, 18, 6]},
-    'Br': {'name': 'Bromine', 'color': halogens, 'atomic_number': 35, 'mass': 79.904, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p5', 'shells': [2, 8, 18, 7]},
-    'Kr': {'name': 'Krypton', 'color': noble_gas, 'atomic_number': 36, 'mass': 83.798, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p6', 'shells': [2, 8, 18, 8]},
-    'Rb': {'name': 'Rubidium', 'color': alkali_metals, 'atomic_number': 37, 'mass': 85.468, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 5s1', 'shells': [2, 8, 18, 8, 1]},
-    'Sr': {'name': 'Strontium', 'color': alkali_earth_metals, 'atomic_number': 38, 'mass': 87.62, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 5s2', 'shells': [2, 8, 18, 8, 2]},
-    'Y': {'name': 'Yttrium', 'color': transition_metals, 'atomic_number': 39, 'mass': 88.906, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 5s1', 'shells': [2, 8, 18, 9, 1]},
-    'Zr': {'name': 'Zirconium', 'color': transition_metals, 'atomic_number': 40, 'mass': 91.224, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 5s2', 'shells': [2, 8, 18, 10, 2]},
-    'Nb': {'name': 'Niobium', 'color': transition_metals, 'atomic_number': 41, 'mass': 92.906, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d4', 'shells': [2, 8, 18, 12, 1]},
-    'Mo': {'name': 'Molybdenum', 'color': transition_metals, 'atomic_number': 42, 'mass': 95.95, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d5', 'shells': [2, 8, 18, 13, 1]},
-    'Tc': {'name': 'Technetium', 'color': transition_metals, 'atomic_number': 43, 'mass': 98, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d5', 'shells': [2, 8, 18, 13, 2]},
-    'Ru': {'name': 'Ruthenium', 'color': transition_metals, 'atomic_number': 44, 'mass': 101.07, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d7', 'shells': [2, 8, 18, 15, 1]},
-    'Rh': {'name': 'Rhodium', 'color': transition_metals, 'atomic_number': 45, 'mass': 102.91, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d8', 'shells': [2, 8, 18, 16, 1]},
-    'Pd': {'name': 'Palladium', 'color': transition_metals, 'atomic_number': 46, 'mass': 106.42, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10', 'shells': [2, 8, 18, 18, 0]},
-    'Ag': {'name': 'Silver', 'color': transition_metals, 'atomic_number': 47, 'mass': 107.87, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s1 4d10', 'shells': [2, 8, 18, 18, 1]},
-    'Cd': {'name': 'Cadmium', 'color': transition_metals, 'atomic_number': 48, 'mass': 112.41, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10', 'shells': [2, 8, 18, 18, 2]},
-    'In': {'name': 'Indium', 'color': post_transition_metals, 'atomic_number': 49, 'mass': 114.82, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5p1', 'shells': [2, 8, 18, 18, 3]},
-    'Sn': {'name': 'Tin', 'color': post_transition_metals, 'atomic_number': 50, 'mass': 118.71, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5p2', 'shells': [2, 8, 18, 18, 4]},
-    'Sb': {'name': 'Antimony', 'color': metalloids, 'atomic_number': 51, 'mass': 121.76, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5p3', 'shells': [2, 8, 18, 18, 5]},
-    'Te': {'name': 'Tellurium', 'color': metalloids, 'atomic_number': 52, 'mass': 127.60, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5p4', 'shells': [2, 8, 18, 18, 6]},
-    'I': {'name': 'Iodine', 'color': halogens, 'atomic_number': 53, 'mass': 126.90, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5p5', 'shells': [2, 8, 18, 18, 7]},
-    'Xe': {'name': 'Xenon', 'color': noble_gas, 'atomic_number': 54, 'mass': 131.29, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5p6', 'shells': [2, 8, 18, 18, 8]},
-    'Cs': {'name': 'Cesium', 'color': alkali_metals, 'atomic_number': 55, 'mass': 132.91, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s1', 'shells': [2, 8, 18, 18, 8, 1]},
-    'Ba': {'name': 'Barium', 'color': alkali_earth_metals, 'atomic_number': 56, 'mass': 137.33, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2', 'shells': [2, 8, 18, 18, 8, 2]},
-    'La': {'name': 'Lanthanum', 'color': lanthanides, 'atomic_number': 57, 'mass': 138.91, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5d1', 'shells': [2, 8, 18, 18, 9]},
-    'Ce': {'name': 'Cerium', 'color': lanthanides, 'atomic_number': 58, 'mass': 140.12, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f1', 'shells': [2, 8, 18, 18, 11]},
-    'Pr': {'name': 'Praseodymium', 'color': lanthanides, 'atomic_number': 59, 'mass': 140.91, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f3', 'shells': [2, 8, 18, 18, 12]},
-    'Nd': {'name': 'Neodymium', 'color': lanthanides, 'atomic_number': 60, 'mass': 144.24, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f4', 'shells': [2, 8, 18, 18, 13]},
-    'Pm': {'name': 'Promethium', 'color': lanthanides, 'atomic_number': 61, 'mass': 145, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f5', 'shells': [2, 8, 18, 18, 14]},
-    'Sm': {'name': 'Samarium', 'color': lanthanides, 'atomic_number': 62, 'mass': 150.36, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f6', 'shells': [2, 8, 18, 18, 15]},
-    'Eu': {'name': 'Europium', 'color': lanthanides, 'atomic_number': 63, 'mass': 151.96, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f7', 'shells': [2, 8, 18, 18, 16]},
-    'Gd': {'name': 'Gadolinium', 'color': lanthanides, 'atomic_number': 64, 'mass': 157.25, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f7', 'shells': [2, 8, 18, 18, 18]},
-    'Tb': {'name': 'Terbium', 'color': lanthanides, 'atomic_number': 65, 'mass': 158.93, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f9', 'shells': [2, 8, 18, 18, 19]},
-    'Dy': {'name': 'Dysprosium', 'color': lanthanides, 'atomic_number': 66, 'mass': 162.50, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f10', 'shells': [2, 8, 18, 18, 20]},
-    'Ho': {'name': 'Holmium', 'color': lanthanides, 'atomic_number': 67, 'mass': 164.93, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f11', 'shells': [2, 8, 18, 18, 21]},
-    'Er': {'name': 'Erbium', 'color': lanthanides, 'atomic_number': 68, 'mass': 167.26, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f12', 'shells': [2, 8, 18, 18, 22]},
-    'Tm': {'name': 'Thulium', 'color': lanthanides, 'atomic_number': 69, 'mass': 168.93, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f13', 'shells': [2, 8, 18, 18, 23]},
-    'Yb': {'name': 'Ytterbium', 'color': lanthanides, 'atomic_number': 70, 'mass': 173.04, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f14', 'shells': [2, 8, 18, 18, 24]},
-    'Lu': {'name': 'Lutetium', 'color': lanthanides, 'atomic_number': 71, 'mass': 174.97, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 4f14 5d1', 'shells': [2, 8, 18, 18, 25]},
-    'Hf': {'name': 'Hafnium', 'color': transition_metals, 'atomic_number': 72, 'mass': 178.49, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5d2', 'shells': [2, 8, 18, 32, 2]},
-    'Ta': {'name': 'Tantalum', 'color': transition_metals, 'atomic_number': 73, 'mass': 180.95, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5d3', 'shells': [2, 8, 18, 32, 3]},
-    'W': {'name': 'Tungsten', 'color': transition_metals, 'atomic_number': 74, 'mass': 183.84, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5d4', 'shells': [2, 8, 18, 32, 4]},
-    'Re': {'name': 'Rhenium', 'color': transition_metals, 'atomic_number': 75, 'mass': 186.21, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5d5', 'shells': [2, 8, 18, 32, 5]},
-    'Os': {'name': 'Osmium', 'color': transition_metals, 'atomic_number': 76, 'mass': 190.23, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5d6', 'shells': [2, 8, 18, 32, 6]},
-    'Ir': {'name': 'Iridium', 'color': transition_metals, 'atomic_number': 77, 'mass': 192.22, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5d7', 'shells': [2, 8, 18, 32, 7]},
-    'Pt': {'name': 'Platinum', 'color': transition_metals, 'atomic_number': 78, 'mass': 195.08, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5d8', 'shells': [2, 8, 18, 32, 8]},
-    'Au': {'name': 'Gold', 'color': transition_metals, 'atomic_number': 79, 'mass': 196.97, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s1 4d10 5s2 5d9', 'shells': [2, 8, 18, 32, 9]},
-    'Hg': {'name': 'Mercury', 'color': transition_metals, 'atomic_number': 80, 'mass': 200.59, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5d10', 'shells': [2, 8, 18, 32, 10]},
-    'Tl': {'name': 'Thallium', 'color': post_transition_metals, 'atomic_number': 81, 'mass': 204.38, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5p1', 'shells': [2, 8, 18, 32, 1]},
-    'Pb': {'name': 'Lead', 'color': post_transition_metals, 'atomic_number': 82, 'mass': 207.2, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5p2', 'shells': [2, 8, 18, 32, 2]},
-    'Bi': {'name': 'Bismuth', 'color': post_transition_metals, 'atomic_number': 83, 'mass': 208.98, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5p3', 'shells': [2, 8, 18, 32, 3]},
-    'Po': {'name': 'Polonium', 'color': metalloids, 'atomic_number': 84, 'mass': 209.98, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5p4', 'shells': [2, 8, 18, 32, 4]},
-    'At': {'name': 'Astatine', 'color': halogens, 'atomic_number': 85, 'mass': 210, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5p5', 'shells': [2, 8, 18, 32, 5]},
-    'Rn': {'name': 'Radon', 'color': noble_gas, 'atomic_number': 86, 'mass': 222, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 5p6', 'shells': [2, 8, 18, 32, 6]},
-    'Fr': {'name': 'Francium', 'color': alkali_metals, 'atomic_number': 87, 'mass': 223, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s1', 'shells': [2, 8, 18, 32, 7, 1]},
-    'Ra': {'name': 'Radium', 'color': alkali_earth_metals, 'atomic_number': 88, 'mass': 226, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2', 'shells': [2, 8, 18, 32, 7, 2]},
-    'Ac': {'name': 'Actinium', 'color': actinides, 'atomic_number': 89, 'mass': 227, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 6d1', 'shells': [2, 8, 18, 32, 8, 1]},
-    'Th': {'name': 'Thorium', 'color': actinides, 'atomic_number': 90, 'mass': 232.04, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f0', 'shells': [2, 8, 18, 32, 9]},
-    'Pa': {'name': 'Protactinium', 'color': actinides, 'atomic_number': 91, 'mass': 231.04, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f1', 'shells': [2, 8, 18, 32, 10]},
-    'U': {'name': 'Uranium', 'color': actinides, 'atomic_number': 92, 'mass': 238.03, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f3', 'shells': [2, 8, 18, 32, 12]},
-    'Np': {'name': 'Neptunium', 'color': actinides, 'atomic_number': 93, 'mass': 237.048, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f4', 'shells': [2, 8, 18, 32, 13]},
-    'Pu': {'name': 'Plutonium', 'color': actinides, 'atomic_number': 94, 'mass': 244, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f6', 'shells': [2, 8, 18, 32, 15]},
-    'Am': {'name': 'Americium', 'color': actinides, 'atomic_number': 95, 'mass': 243, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f7', 'shells': [2, 8, 18, 32, 16]},
-    'Cm': {'name': 'Curium', 'color': actinides, 'atomic_number': 96, 'mass': 247, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f7', 'shells': [2, 8, 18, 32, 17]},
-    'Bk': {'name': 'Berkelium', 'color': actinides, 'atomic_number': 97, 'mass': 247, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f9', 'shells': [2, 8, 18, 32, 19]},
-    'Cf': {'name': 'Californium', 'color': actinides, 'atomic_number': 98, 'mass': 251, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f10', 'shells': [2, 8, 18, 32, 20]},
-    'Es': {'name': 'Einsteinium', 'color': actinides, 'atomic_number': 99, 'mass': 252, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f11', 'shells': [2, 8, 18, 32, 21]},
-    'Fm': {'name': 'Fermium', 'color': actinides, 'atomic_number': 100, 'mass': 257, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f12', 'shells': [2, 8, 18, 32, 22]},
-    'Md': {'name': 'Mendelevium', 'color': actinides, 'atomic_number': 101, 'mass': 258, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f13', 'shells': [2, 8, 18, 32, 23]},
-    'No': {'name': 'Nobelium', 'color': actinides, 'atomic_number': 102, 'mass': 259, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f14', 'shells': [2, 8, 18, 32, 24]},
-    'Lr': {'name': 'Lawrencium', 'color': actinides, 'atomic_number': 103, 'mass': 262, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f14 7s2', 'shells': [2, 8, 18, 32, 24, 2]},
-    'Rf': {'name': 'Rutherfordium', 'color': transition_metals, 'atomic_number': 104, 'mass': 267, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f14 6d2', 'shells': [2, 8, 18, 32, 32, 2]},
-    'Db': {'name': 'Dubnium', 'color': transition_metals, 'atomic_number': 105, 'mass': 270, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f14 6d3', 'shells': [2, 8, 18, 32, 32, 3]},
-    'Sg': {'name': 'Seaborgium', 'color': transition_metals, 'atomic_number': 106, 'mass': 271, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f14 6d4', 'shells': [2, 8, 18, 32, 32, 4]},
-    'Bh': {'name': 'Bohrium', 'color': transition_metals, 'atomic_number': 107, 'mass': 270, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f14 6d5', 'shells': [2, 8, 18, 32, 32, 5]},
-    'Hs': {'name': 'Hassium', 'color': transition_metals, 'atomic_number': 108, 'mass': 277, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 4d10 5s2 6s2 5f14 6d6', 'shells': [2, 8, 18, 32, 32, 6]},
-
-
-    'Mt': {
-        'name': 'Meitnerium',
-        'color': transition_metals,  # Group 9, Transition metal
-        'atomic_number': 109,
-        'mass': 278,
-        'electron_config': '[Rn] 5f14 6d7 7s2',
-        'shells': [2, 8, 18, 32, 32, 15, 2]
-    },
-    'Ds': {
-        'name': 'Darmstadtium',
-        'color': transition_metals,  # Group 10, Transition metal
-        'atomic_number': 110,
-        'mass': 281,
-        'electron_config': '[Rn] 5f14 6d8 7s2',
-        'shells': [2, 8, 18, 32, 32, 16, 2]
-    },
-    'Rg': {
-        'name': 'Roentgenium',
-        'color': transition_metals,  # Group 11, Transition metal
-        'atomic_number': 111,
-        'mass': 282,
-        'electron_config': '[Rn] 5f14 6d9 7s2',
-        'shells': [2, 8, 18, 32, 32, 17, 2]
-    },
-    'Cn': {
-        'name': 'Copernicium',
-        'color': transition_metals,  # Group 12, Transition metal
-        'atomic_number': 112,
-        'mass': 285,
-        'electron_config': '[Rn] 5f14 6d10 7s2',
-        'shells': [2, 8, 18, 32, 32, 18, 2]
-    },
-    'Nh': {
-        'name': 'Nihonium',
-        'color': post_transition_metals,  # Group 13, Post-transition metal
-        'atomic_number': 113,
-        'mass': 286,
-        'electron_config': '[Rn] 5f14 6d10 7s2 7p1',
-        'shells': [2, 8, 18, 32, 32, 18, 3]
-    },
-    'Fl': {
-        'name': 'Flerovium',
-        'color': post_transition_metals,  # Group 14, Post-transition metal
-        'atomic_number': 114,
-        'mass': 289,
-        'electron_config': '[Rn] 5f14 6d10 7s2 7p2',
-        'shells': [2, 8, 18, 32, 32, 18, 4]
-    },
-    'Mc': {
-        'name': 'Moscovium',
-        'color': post_transition_metals,  # Group 15, Post-transition metal
-        'atomic_number': 115,
-        'mass': 290,
-        'electron_config': '[Rn] 5f14 6d10 7s2 7p3',
-        'shells': [2, 8, 18, 32, 32, 18, 5]
-    },
-    'Lv': {
-        'name': 'Livermorium',
-        'color': post_transition_metals,  # Group 16, Post-transition metal
-        'atomic_number': 116,
-        'mass': 293,
-        'electron_config': '[Rn] 5f14 6d10 7s2 7p4',
-        'shells': [2, 8, 18, 32, 32, 18, 6]
-    },
-    'Ts': {
-        'name': 'Tennessine',
-        'color': halogens,  # Group 17, Halogen
-        'atomic_number': 117,
-        'mass': 294,
-        'electron_config': '[Rn] 5f14 6d10 7s2 7p5',
-        'shells': [2, 8, 18, 32, 32, 18, 7]
-    },
-    'Og': {
-        'name': 'Oganesson',
-        'color': noble_gas,  # Group 18, Noble gas
-        'atomic_number': 118,
-        'mass': 294,
-        'electron_config': '[Rn] 5f14 6d10 7s2 7p6',
-        'shells': [2, 8, 18, 32, 32, 18, 8]
-    }
-}
-
-
-
-
-# Compounds
-compounds = {
-    'H2O': {'elements': ['H', 'O', 'H'], 'name': 'Water', 'uses': 'Essential for life, solvent', 'properties': 'Colorless, odorless, liquid'},
-    'CO2': {'elements': ['C', 'O', 'O'], 'name': 'Carbon Dioxide', 'uses': 'Used in carbonation, fire extinguishers, and as a greenhouse gas', 'properties': 'Colorless, odorless gas at room temperature'},
-
-    'NaCl': {
-        'elements': ['Na', 'Cl'],
-        'name': 'Sodium Chloride',
-        'uses': 'Used as table salt, in food preservation, and as a saline solution',
-        'properties': 'White crystalline solid, highly soluble in water'
-    },
-    'C6H12O6': {
-        'elements': ['C', 'H', 'O'],
-        'name': 'Glucose',
-        'uses': 'Primary energy source for cells, used in food and beverages',
-        'properties': 'White crystalline solid, sweet taste, soluble in water'
-    },
-    'NH3': {
-        'elements': ['N', 'H', 'H'],
-        'name': 'Ammonia',
-        'uses': 'Used in fertilizers, cleaning products, and as a refrigerant',
-        'properties': 'Colorless gas with a pungent smell, highly soluble in water'
-    },
-    'C2H5OH': {
-        'elements': ['C', 'H', 'O'],
-        'name': 'Ethanol',
-        'uses': 'Used as an alcohol beverage, in disinfectants, and as a solvent',
-        'properties': 'Colorless liquid with a characteristic odor, flammable, miscible with water'
-    },
-    'CaCO3': {
-        'elements': ['Ca', 'C', 'O'],
-        'name': 'Calcium Carbonate',
-        'uses': 'Used in antacids, calcium supplements, and as a building material',
-        'properties': 'White solid, insoluble in water, reacts with acids'
-    },
-    'CH4': {
-        'elements': ['C', 'H', 'H', 'H', 'H'],
-        'name': 'Methane',
-        'uses': 'Used as a fuel, in chemical synthesis, and as a refrigerant',
-        'properties': 'Colorless, odorless gas, highly flammable'
-    },
-    'C3H8': {
-        'elements': ['C', 'H', 'H', 'H', 'H', 'H'],
-        'name': 'Propane',
-        'uses': 'Used as a fuel for heating and cooking, in gas grills',
-        'properties': 'Colorless gas, odorless, flammable'
-    },
-    'NaHCO3': {
-        'elements': ['Na', 'H', 'C', 'O', 'O', 'O'],
-        'name': 'Sodium Bicarbonate',
-        'uses': 'Used in baking, as an antacid, and in cleaning',
-        'properties': 'White solid, slightly alkaline, soluble in water'
-    },
-    'C2H4': {
-        'elements': ['C', 'C', 'H', 'H', 'H', 'H'],
-        'name': 'Ethylene',
-        'uses': 'Used in the production of plastics, as a plant hormone',
-        'properties': 'Colorless gas with a sweet odor, flammable'
-    },
-    'SiO2': {
-        'elements': ['Si', 'O', 'O'],
-        'name': 'Silicon Dioxide',
-        'uses': 'Used in glassmaking, as a food additive, and in construction',
-        'properties': 'White solid, insoluble in water, occurs in nature as quartz'
-    },
-    'C12H22O11': {
-        'elements': ['C', 'H', 'O'],
-        'name': 'Sucrose',
-        'uses': 'Used as table sugar, in food products and beverages',
-        'properties': 'White crystalline solid, sweet taste, soluble in water'
-    },
-    'SO2': {
-        'elements': ['S', 'O', 'O'],
-        'name': 'Sulfur Dioxide',
-        'uses': 'Used as a preservative, in the production of sulfuric acid',
-        'properties': 'Colorless gas with a pungent smell, soluble in water'
-    },
-    'C6H14': {
-        'elements': ['C', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H'],
-        'name': 'Hexane',
-        'uses': 'Used as a solvent in laboratories and in the extraction of oils',
-        'properties': 'Colorless liquid, highly flammable, insoluble in water'
-    },
-    'HCl': {
-        'elements': ['H', 'Cl'],
-        'name': 'Hydrochloric Acid',
-        'uses': 'Used in cleaning agents, food processing, and pH regulation',
-        'properties': 'Colorless, strong acid, highly corrosive'
-    },
-
-
-
-
-}
-
-# Periodic table layout
-periodic_table_layout = [
-['H','','','','','','','','','','','','','','','','','He'],
- ['Li','Be','','','','','','','','','','','B','C','N','O','F','Ne'],
- ['Na','Mg','','','','','','','','','','','Al','Si','P','S','Cl','Ar'],
-['K','Ca','Sc','Ti','V','Cr','Mn','Fe','Co','Ni','Cu','Zn','Ga','Ge','As','Se','Br','Kr'],
-['Rb','Sr','Y','Zr','Nb','Mo','Tc','Ru','Rh','Pd','Ag','Cd','In','Sn','Sb','Te','I','Xe'],
-['Cs','Ba','La','Hf','Ta','W','Re','Os','Ir','Pt','Au','Hg','Tl','Pb','Bi','Po','At','Rn'],
-['Fr','Ra','Ac','Rf','Db','Sg','Bh','Hs','Mt','Ds','Rg','Cn','Nh','Fl','Mc','Lv','Ts','Og'],
-['','','*','','','','','','','','','','','','','','',''],
-['','','#','','','','','','','','','','','','','','',''],
-['','','*La','Ce','Pr','Nd','Pm','Sm','Eu','Gd','Tb','Dy','Ho','Er','Tm','Yb','Lu',''],
-['','','#Ac','Th','Pa','U','Np','Pu','Am','Cm','Bk','Cf','Es','Fm','Md','No','Lr','']
-
-
-]
-
-def draw_elements(element, x, y, angle=0):
-    if element and element in elements:
-        rect = pygame.Rect(x, y, cell_size, cell_size)
-        pygame.draw.rect(screen, elements[element]['color'], rect)
-        pygame.draw.rect(screen, black, rect, 1)
-        symbol = element_font.render(element, True, black)
-        symbol_rect = symbol.get_rect(center=rect.center)
-        screen.blit(symbol, symbol_rect)
-
-def draw_periodic_table():
-    for row, elements_row in enumerate(periodic_table_layout):
-        for col, element in enumerate(elements_row):
-            x = col * (cell_size + grid_padding) + grid_padding + table_offset_x
-            y = row * (cell_size + grid_padding) + grid_padding
-            draw_elements(element, x, y)
-
-def draw_electron_shells(element, x, y, width, height):
-    shells = elements[element]['shells']
-    center_x, center_y = x + width / 2, y + height / 2
-    for i, electrons in enumerate(shells):
-        radius = (i + 1) * (min(width, height) // (2 * len(shells)))
-        angle_step = 360 / electrons
-        for j in range(electrons):
-            angle = math.radians(j * angle_step)
-            ex = center_x + int(radius * math.cos(angle))
-            ey = center_y + int(radius * math.sin(angle))
-            pygame.draw.circle(screen, white, (ex, ey), 2)
+highlight = (255, 215, 0)
+grey = (150, 150, 150)
+
+# Setup fonts, sized for the current scale. Each is loaded the first time
+# something is drawn with it, and the Arial lookup is cached on disk between
+# runs (see fonts.py)
+def scale_fonts():
+    global font, large_font, bold_font, element_font, popup_font, count_font
+    font = LazyFont(None, layout.size(29))
+    large_font = LazyFont(None, layout.size(36))
+    bold_font = LazyFont(None, layout.size(33), bold=True)
+    element_font = LazyFont("arial", layout.size(28), sysfont=True)
+    popup_font = LazyFont(None, layout.size(46))
+    count_font = LazyFont(None, layout.size(20))
+
+scale_fonts()
+
+def load_fonts():
+    for lazy_font in (font, element_font, popup_font):
+        lazy_font.load()
+
+# Renders the element tile atlas ahead of the first frame
+def prerender_symbols():
+    get_atlas()
+
+# Opens the window. Only the display and font subsystems are started; audio
+# and joystick are never used. backend is 'cpu' or 'gpu' and software asks the
+# GPU backend for SDL's software renderer. Safe to call more than once; run()
+# calls it for you.
+def init(backend='cpu', software=False):
+    global renderer, screen
+    if screen is None or not pygame.display.get_init():
+        pygame.display.init()
+        pygame.font.init()
+        renderer = create_renderer(backend, (width, height), 'Periodic Table', software=software)
+        screen = renderer.canvas
+        startup.mark('display')
+    renderer.set_title('Periodic Table')
+    return screen
+
+# Element cell size and layout on the design canvas (see table_geometry.py),
+# scaled to the window by apply_layout()
+cell_size = base_cell_size
+grid_padding = base_grid_padding
+table_offset_x, table_offset_y = base_table_offset_x, 0
+shell_panel_size = base_shell_panel_size
+
+# Elements and compounds come from the classroom server if PERIODIC_SERVER is
+# set, else from the local dataset (see backends.py). Merges are matched here
+# against that table, so a frame never waits on the network. Local data, its
+# indexes and the table geometry for the design canvas are loaded from the
+# precompiled snapshot, rebuilt whenever the sources change (see snapshot.py).
+game_data = load_game_data()
+elements, compounds = game_data.elements, game_data.compounds
+compound_index = game_data.compound_index
+compound_search = game_data.compound_search
+
+# Element records, cell rects and hit-test grid for the current layout
+table = game_data.table
+startup.mark('dataset and index')
+
+atlas = None  # Element tiles at the current cell size, built by get_atlas()
+
+def get_atlas():
+    global atlas
+    if atlas is None:
+        atlas = TileAtlas(table.records.values(), cell_size, element_font, black, black)
+    atlas.convert()
+    return atlas
+
+shell_diagrams = ShellDiagrams(shell_panel_size)
+
+# Recomputes every size and position for a new window size. Fonts, the tile
+# atlas and cached text and shell diagrams are only rebuilt if the scale changed.
+def apply_layout(new_width, new_height):
+    global width, height, layout, cell_size, grid_padding, table_offset_x, table_offset_y
+    global shell_panel_size, table, atlas, shell_diagrams
+    old_scale = layout.scale
+    width, height = new_width, new_height
+    layout = Layout(width, height)
+    cell_size = layout.size(base_cell_size)
+    grid_padding = layout.size(base_grid_padding)
+    table_offset_x, table_offset_y = layout.point(base_table_offset_x, 0)
+    shell_panel_size = (layout.size(base_shell_panel_size[0]), layout.size(base_shell_panel_size[1]))
+    table = TableGeometry(elements, periodic_table_layout, cell_size, grid_padding, table_offset_x,
+                          table_offset_y, shell_panel_size=shell_panel_size)
+    if layout.scale != old_scale:
+        scale_fonts()
+        text_cache.clear()
+        atlas = None
+        shell_diagrams = ShellDiagrams(shell_panel_size)
+        info_panel.clear()
+    notifications.anchor = layout.point(base_width // 2, base_height - 260)
+
+# Follows the window after a resize; returns whether the size changed
+def resize_display(new_width, new_height):
+    global screen
+    new_size = renderer.resize((new_width, new_height))
+    screen = renderer.canvas
+    if new_size == (width, height):
+        return False
+    apply_layout(*new_size)
+    return True
+
+def draw_tile(surface, record, rect):
+    return get_atlas().blit(surface, record.symbol, rect.topleft)
+
+def draw_periodic_table(surface=None):
+    if surface is None:
+        surface = screen
+    for record in table.cells:
+        draw_tile(surface, record, record.rect)
+
+# The table, panel borders and merge button never change, so they are drawn
+# once into an off-screen surface and blitted back wherever a frame drew over them
+def build_background(merge_area_rect, electron_shell_rect, merge_button, search_rect):
+    surface = renderer.convert(pygame.Surface((width, height)))
+    surface.fill(background)
+    draw_periodic_table(surface)
+    pygame.draw.rect(surface, white, merge_area_rect, layout.size(2))
+    pygame.draw.rect(surface, white, electron_shell_rect, layout.size(2))
+    pygame.draw.rect(surface, white, merge_button)
+    merge_text = render_text(font, "Merge", black)
+    surface.blit(merge_text, (merge_button.x + layout.size(70), merge_button.y + layout.size(8)))
+    pygame.draw.rect(surface, white, search_rect, 1)
+    return surface
+
+# Search matches are outlined on a copy of the background, so the outlines cost
+# nothing per frame and are only redrawn when the results change
+def build_highlighted_background(base, symbols):
+    surface = base.copy()
+    for symbol in symbols:
+        record = table.records.get(symbol)
+        if record is not None and record.rect is not None:
+            pygame.draw.rect(surface, highlight, record.rect, layout.size(3))
+    return surface
+
+def describe_results(results, max_length=60):
+    if not results:
+        return "No matching compounds"
+    names = ", ".join(f"{compounds[formula]['name']} ({formula})" for formula in results)
+    if len(names) > max_length:
+        names = names[:max_length - 3] + "..."
+    return f"{len(results)} match{'es' if len(results) != 1 else ''}: {names}"
+
+animate_shells = False  # Toggled with the A key
+shell_rotation_speed = 0.0015  # Radians per millisecond for the innermost shell
+
+# The shell diagram of element as a sprite item; images are padded by the dot radius
+def electron_shell_item(element, rect):
+    record = table.records[element]
+    pad = dot_radius + 1
+    if animate_shells:
+        phase = pygame.time.get_ticks() * shell_rotation_speed
+        image = shell_diagrams.rotating_image(record, rect.width, rect.height, phase)
+    else:
+        image = shell_diagrams.image(record, rect.width, rect.height)
+    return image, (rect.x - pad, rect.y - pad)
 
 def create_tooltip(element):
-    info = elements[element]
-    tooltip_text = f"{info['name']}"
-    tooltip = font.render(tooltip_text, True, (44, 44, 47), (200, 229, 229))
+    tooltip_text = table.records[element].name
+    tooltip = render_text(font, tooltip_text, (44, 44, 47), (200, 229, 229))
     return tooltip
 
-def draw_tooltip(screen, tooltip, pos):
-    screen.blit(tooltip, (pos[0] + 15, pos[1] + 15))
+def tooltip_pos(pos):
+    return pos[0] + layout.size(15), pos[1] + layout.size(15)
+
+# Composed info panel images, reused until the lines shown change
+info_panel = InfoPanel()
 
 def show_element_info(element):
-    info = elements[element]
+    if element in compounds:
+        info = compounds[element]
+        return [
+            f"Name: {info['name']}",
+            f"Formula: {element}",
+            f"Uses: {info['uses']}",
+            f"Properties: {info['properties']}"
+        ]
+    record = table.records[element]
     lines = [
-        f"Name: {info['name']}",
-        f"Atomic Number: {info['atomic_number']}",
-        f"Mass: {info['mass']}",
-        f"Electron Configuration: {info['electron_config']}"
+        f"Name: {record.name}",
+        f"Atomic Number: {record.atomic_number}",
+        f"Mass: {record.mass}",
+        f"Electron Configuration: {record.electron_config}"
     ]
     return lines
 
-def show_compound(element):
-    elements_sorted = sorted(elements.keys())
-    for compound, data in compounds.items():
-        if elements_sorted == sorted(data['elements']):
-            return compound, data['name']
-    return None, None
+# The compound the merge area forms and how many of it, or (None, 0)
+def show_compound(merge_area):
+    return compound_index.react(merge_area.counts)
+
+# What a failed merge could have made instead, for the info panel
+def show_buildable(merge_area, limit=3):
+    buildable = compound_index.buildable(merge_area.counts, limit=limit)
+    if not buildable:
+        return []
+    return ["Could make:"] + [f"{copies} x {compounds[formula]['name']} ({formula})" for formula, copies in buildable]
+
+# Sprite items for the merge area: one tile per element with its count, so
+# any number of tiles fits the panel; elements beyond the last slot are
+# summarised as "+N"
+def merge_area_items(merge_area, merge_area_rect):
+    step = layout.size(40)
+    slots = max(1, (merge_area_rect.width - layout.size(20) - cell_size) // step + 1)
+    counts = list(merge_area.items())
+    shown = counts if len(counts) <= slots else counts[:slots - 1]
+    x, y = merge_area_rect.x + layout.size(10), merge_area_rect.y + layout.size(10)
+    tiles = get_atlas()
+    items = [(tiles.tile(symbol), (x + i * step, y)) for i, (symbol, _) in enumerate(shown)]
+    # Counts go on top of every tile, since the tiles overlap
+    for i, (_, count) in enumerate(shown):
+        if count > 1:
+            badge = render_text(count_font, f"x{count}", black, white)
+            items.append((badge, (x + i * step, y + cell_size - badge.get_height())))
+    if len(shown) < len(counts):
+        more = render_text(font, f"+{len(counts) - len(shown)}", white)
+        items.append((more, more.get_rect(center=(x + len(shown) * step + cell_size // 2, y + cell_size // 2)).topleft))
+    return items
+
+# possible is how many compounds the merge area can still grow into, or None when it is empty
+def compound_hint_items(possible, merge_area_rect):
+    if possible is None:
+        return []
+    if possible:
+        hint = f"Possible: {possible}"
+        color = white
+    else:
+        hint = "Possible: none"
+        color = red
+    hint_text = render_text(font, hint, color)
+    return [(hint_text, (merge_area_rect.x + layout.size(10), merge_area_rect.bottom - layout.size(28)))]
+
+# Popups are queued and drawn by the main loop, so showing one never blocks input
+notifications = NotificationQueue(layout.point(base_width // 2, base_height - 260))
 
 def show_popup(message, color):
-    popup = popup_font.render(message, True, color)
-    popup_rect = popup.get_rect(center=(width // 2, height - 260))
-    screen.blit(popup, popup_rect)
-    pygame.display.flip()
-    pygame.time.wait(1500)
+    notifications.push(render_text(popup_font, message, color))
 
 def get_element_at_pos(pos):
-    x, y = pos
-    col = (x - table_offset_x) // (cell_size + grid_padding)
-    row = y // (cell_size + grid_padding)
-    if 0 <= row < len(periodic_table_layout) and 0 <= col < len(periodic_table_layout[row]):
-        return periodic_table_layout[row][col]
-    return None
-
-def main():
-    clock = pygame.time.Clock()
-    dragging = False
-    dragged_element = None
-    merge_area = []
-    merge_area_rect = pygame.Rect(width - 200, height - 150, 180, 100)
-    electron_shell_rect = pygame.Rect(width - 200, height - 260, 180, 100)
-    merge_button = pygame.Rect(width - 200, height - 40, 180, 30)
-
-    info_area = []
-    hover_element = None
-    tooltip = None
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if merge_button.collidepoint(event.pos):
-                    compound, name = show_compound(merge_area)
-                    if compound:
+    record = table.element_at(pos)
+    return record.symbol if record else None
+
+# Progress is saved next to the users, in the login window's database
+progress_db_path = 'user.db'
+
+# A few leaderboard rows for the info panel. The query is an index scan on a
+# WAL database, so running it on the game thread does not stall a frame.
+def describe_leaderboard(rows):
+    if not rows:
+        return ["No scores yet"]
+    return [f"{rank}. {username}: {discoveries} found, {merges} merges"
+            for rank, (username, discoveries, merges) in enumerate(rows, 1)]
+
+low_power_frame_rate = 20
+
+# Phases of a frame timed by the profiler, in the order they run
+frame_phases = ('events', 'merge', 'shells', 'info', 'tooltip', 'overlay', 'composite', 'display')
+profile_csv_path = 'profile.csv'
+profile_trace_path = 'profile_trace.json'
+
+def performance_hud_items(profiler, fps, scheduler_stats=None):
+    lines = [f"FPS: {fps:.1f}"]
+    if scheduler_stats:
+        lines.append(f"drawn: {scheduler_stats['frames_drawn']}")
+        lines.append(f"skipped: {scheduler_stats['frames_skipped']}")
+    lines += [f"{phase}: {ms:.2f} ms" for phase, ms in profiler.averages().items()]
+    items = []
+    x, y = width - layout.size(165), layout.size(10)
+    for line in lines:
+        # Rendered directly: the numbers change every frame and would flush the text cache
+        text = font.render(line, True, white, background)
+        items.append((text, (x, y)))
+        y += text.get_height() + 2
+    return items
+
+# Events that can change what is on screen; anything else (timers, focus
+# changes) does not wake the renderer
+expose_events = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+resize_events = (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED)
+finger_events = (pygame.FINGERDOWN, pygame.FINGERMOTION, pygame.FINGERUP)
+redraw_events = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP) + resize_events + expose_events
+
+# Sprite layers, bottom to top
+panel_layer = 1
+tooltip_layer = 5
+popup_layer = 6
+drag_layer = 7
+hud_layer = 8
+
+# All state of one running game. main() feeds it events and asks it to draw a
+# frame; keeping the loop body here lets tools drive the game without a window.
+class Game:
+    def __init__(self):
+        # Tiles being dragged, as pointer -> [symbol, position]. The pointer is
+        # 'mouse' or ('finger', touch_id, finger_id), so every finger on a touch
+        # screen can drag its own tile at the same time.
+        self.drags = {}
+        self.merge_area = MergePool()
+        self.possible = None  # Compounds the merge area can still grow into; see merge_changed()
+
+        self.search_text = ''
+        self.search_active = False
+        self.search_results = []
+        self.highlighted = frozenset()
+
+        self.info_area = []
+        self.hover_element = None
+        self.tooltip = None
+        # Mouse position as last reported by events, so scripted input works headless
+        self.mouse_pos = pygame.mouse.get_pos()
+
+        # Everything drawn over the background; only what changes is repainted
+        self.sprites = SpriteLayer()
+        self.merge_sprites = self.sprites.group(panel_layer)
+        self.hint_sprites = self.sprites.group(panel_layer)
+        self.shell_sprites = self.sprites.group(panel_layer)
+        self.info_sprites = self.sprites.group(panel_layer)
+        self.search_sprites = self.sprites.group(panel_layer)
+        self.tooltip_sprites = self.sprites.group(tooltip_layer)
+        self.popup_sprites = self.sprites.group(popup_layer)
+        self.drag_sprites = self.sprites.group(drag_layer)
+        self.hud_sprites = self.sprites.group(hud_layer)
+        self.layout_panels()
+
+        # F3 shows the timing overlay, F4 writes the buffered timings to disk
+        self.profiler = FrameProfiler(frame_phases)
+        self.show_hud = False
+        self.fps = 0.0
+        self.scheduler = None
+        self.session = None
+        self.progress = None  # PlayerProgress when a player is logged in
+        self.replay_mismatches = None  # Set by run() at the end of a replay
+        # Set whenever something on screen may have changed; see wants_frame()
+        self.dirty = True
+
+    # Panel positions on the design canvas, scaled to the current layout
+    def layout_panels(self):
+        self.merge_area_rect = layout.rect(base_width - 200, base_height - 150, 180, 100)
+        self.electron_shell_rect = pygame.Rect(layout.point(base_width - 200, base_height - 260), shell_panel_size)
+        self.merge_button = layout.rect(base_width - 200, base_height - 40, 180, 30)
+        # The free column left of the lanthanides and actinides; long compound uses
+        # and properties are word-wrapped to its width
+        self.info_rect = layout.rect(10, base_height - 300, 235, 290)
+        # Fonts may have been rescaled, so the tooltip is rebuilt on the next frame
+        self.hover_element = None
+        self.tooltip = None
+        # The search box sits in the empty rows above the lanthanides and actinides
+        pitch = base_cell_size + base_grid_padding
+        self.search_rect = layout.rect(base_table_offset_x + 3 * pitch + base_grid_padding, 7 * pitch + base_grid_padding + 10, 400, 34)
+
+        self.table_background = build_background(self.merge_area_rect, self.electron_shell_rect, self.merge_button,
+                                                  self.search_rect)
+        if self.highlighted:
+            self.background_surface = build_highlighted_background(self.table_background, self.highlighted)
+        else:
+            self.background_surface = self.table_background
+        if screen is not None:
+            self.sprites.repaint(screen.get_rect())
+
+    def start(self):
+        full = [screen.get_rect()]
+        renderer.restore(self.background_surface, full)
+        renderer.present(full)
+
+    # The hint only changes when the merge area does, so it is counted here
+    # rather than every frame
+    def merge_changed(self):
+        self.possible = len(compound_index.reachable(self.merge_area.counts)) if self.merge_area else None
+
+    def update_search(self, text):
+        self.search_text = text
+        self.search_results = compound_search.search(text) if text.strip() else []
+        symbols = frozenset(symbol for formula in self.search_results for symbol in compound_search.counts[formula])
+        if symbols != self.highlighted:
+            self.highlighted = symbols
+            if symbols:
+                self.background_surface = build_highlighted_background(self.table_background, symbols)
+            else:
+                self.background_surface = self.table_background
+            # Repaint the whole background on the next frame
+            self.sprites.repaint(screen.get_rect())
+
+    def handle_search_key(self, event):
+        if event.key == pygame.K_ESCAPE:
+            self.search_active = False
+            self.update_search('')
+        elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+            self.search_active = False
+        elif event.key == pygame.K_BACKSPACE:
+            self.update_search(self.search_text[:-1])
+        elif event.unicode and event.unicode.isprintable():
+            self.update_search(self.search_text + event.unicode)
+
+    # A tile dropped at pos goes into the merge area if it landed there
+    def drop(self, pointer, pos):
+        symbol = self.drags.pop(pointer)[0]
+        if self.merge_area_rect.collidepoint(pos):
+            self.merge_area.add(symbol)
+            self.merge_changed()
+        else:
+            show_popup(table.records[symbol].name, white)
+
+    # Touches drag tiles only; taps on buttons and the search box arrive as the
+    # mouse events SDL synthesizes for the first finger
+    def handle_finger(self, event):
+        pointer = ('finger', event.touch_id, event.finger_id)
+        pos = (int(event.x * width), int(event.y * height))
+        if event.type == pygame.FINGERDOWN:
+            element = get_element_at_pos(pos)
+            if element and element in elements:
+                self.drags[pointer] = [element, pos]
+                self.info_area = show_element_info(element)
+                self.dirty = True
+        elif pointer in self.drags:
+            self.dirty = True
+            if event.type == pygame.FINGERMOTION:
+                self.drags[pointer][1] = pos
+            else:
+                self.drop(pointer, pos)
+
+    def handle_event(self, event):
+        global animate_shells
+        if event.type in finger_events:
+            self.handle_finger(event)
+            return
+        if hasattr(event, 'pos'):
+            self.mouse_pos = event.pos
+        if event.type == pygame.MOUSEMOTION:
+            if 'mouse' in self.drags:
+                self.drags['mouse'][1] = event.pos
+                self.dirty = True
+            # Plain hovering only matters if it moves the tooltip or changes its element
+            hover = get_element_at_pos(event.pos)
+            if hover != self.hover_element or hover in elements:
+                self.dirty = True
+            return
+        if event.type in redraw_events:
+            self.dirty = True
+        if event.type in resize_events:
+            # The GPU renderer's window only reports WINDOWSIZECHANGED
+            new_size = (event.w, event.h) if event.type == pygame.VIDEORESIZE else (event.x, event.y)
+            if resize_display(*new_size):
+                self.layout_panels()
+        elif event.type in expose_events:
+            self.sprites.repaint(screen.get_rect())
+        elif event.type == pygame.KEYDOWN and self.search_active and event.key not in (pygame.K_F3, pygame.K_F4):
+            self.handle_search_key(event)
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_a:
+            animate_shells = not animate_shells
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_l and self.progress is not None:
+            self.info_area = describe_leaderboard(self.progress.store.leaderboard(4))
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.show_hud = not self.show_hud
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+            self.profiler.export_csv(profile_csv_path)
+            self.profiler.export_chrome_trace(profile_trace_path)
+            show_popup(f"Saved {profile_csv_path} and {profile_trace_path}", white)
+        elif event.type == pygame.MOUSEBUTTONDOWN and self.search_rect.collidepoint(event.pos):
+            self.search_active = True
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self.search_active = False
+            if self.merge_button.collidepoint(event.pos):
+                compound, copies = show_compound(self.merge_area)
+                # Clicks on an empty merge area are not merge attempts worth recording
+                recorded = self.progress is not None and self.merge_area
+                discovered = recorded and self.progress.merge(self.merge_area.counts, compound, copies)
+                if discovered:
+                    show_popup("New discovery!", highlight)
+                if compound:
+                    name = compounds[compound]['name']
+                    if copies == 1:
                         show_popup(f"Created {name} ({compound})", white)
-                        info_area = show_element_info(compound)
                     else:
-                        show_popup("No compound formed", red)
-                        merge_area = []
+                        show_popup(f"Created {copies} x {name} ({compound})", white)
+                    self.info_area = show_element_info(compound)
                 else:
-                    element = get_element_at_pos(event.pos)
-                    if element and element in elements:
-                        dragging = True
-                        dragged_element = element
-                        info_area = show_element_info(element)
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if dragging:
-                    dragging = False
-                    if merge_area_rect.collidepoint(event.pos) and dragged_element:
-                        merge_area.append(dragged_element)
-                    else:
-                        show_popup(f"{elements[dragged_element]['name']}", white)
-                    dragged_element = None
-
-        screen.fill(background)
-        draw_periodic_table()
-        pygame.draw.rect(screen, white, merge_area_rect, 2)
-        for i, elem in enumerate(merge_area):
-            draw_elements(elem, merge_area_rect.x + 10 + i * 40, merge_area_rect.y + 10)
-
-        pygame.draw.rect(screen, white, electron_shell_rect, 2)
-        if merge_area:
-            draw_electron_shells(merge_area[-1], electron_shell_rect.x, electron_shell_rect.y, electron_shell_rect.width, electron_shell_rect.height)
-
-        pygame.draw.rect(screen, white, merge_button)
-        merge_text = font.render("Merge", True, black)
-        screen.blit(merge_text, (merge_button.x + 70, merge_button.y + 8))
-
-        info_rect = pygame.Rect(10, height - 150, 300, 140)
-        for i, line in enumerate(info_area):
-            info_text = font.render(line, True, white)
-            screen.blit(info_text, (info_rect.x, info_rect.y + i * 30))
-
-        mouse_pos = pygame.mouse.get_pos()
-        hover_element = get_element_at_pos(mouse_pos)
-        if hover_element and hover_element in elements:
-            tooltip = create_tooltip(hover_element)
+                    show_popup("No compound formed", red)
+                    self.info_area = show_buildable(self.merge_area) or self.info_area
+                    self.merge_area.clear()
+                    self.merge_changed()
+            elif not getattr(event, 'touch', False):
+                element = get_element_at_pos(event.pos)
+                if element and element in elements:
+                    self.drags['mouse'] = [element, event.pos]
+                    self.info_area = show_element_info(element)
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if 'mouse' in self.drags:
+                self.drop('mouse', event.pos)
+
+    def draw(self):
+        profiler = self.profiler
+        self.merge_sprites.show(merge_area_items(self.merge_area, self.merge_area_rect))
+        self.hint_sprites.show(compound_hint_items(self.possible, self.merge_area_rect))
+        profiler.mark('merge')
+
+        if self.merge_area:
+            self.shell_sprites.show([electron_shell_item(self.merge_area.last, self.electron_shell_rect)])
         else:
-            tooltip = None
-        if tooltip:
-            draw_tooltip(screen, tooltip, mouse_pos)
+            self.shell_sprites.show([])
+        profiler.mark('shells')
 
-        if dragging and dragged_element:
-            x, y = pygame.mouse.get_pos()
-            draw_elements(dragged_element, x - cell_size // 2, y - cell_size // 2)
+        if self.info_area:
+            info_image = info_panel.render(self.info_area, font, white, self.info_rect.size, layout.size(30))
+            self.info_sprites.show([(info_image, self.info_rect.topleft)])
+        else:
+            self.info_sprites.show([])
+        if self.search_text or self.search_active:
+            search_text = render_text(font, self.search_text + ('|' if self.search_active else ''), white)
+        else:
+            search_text = render_text(font, "Search compounds...", grey)
+        search_items = [(search_text, (self.search_rect.x + layout.size(8), self.search_rect.y + layout.size(8)))]
+        if self.search_text.strip():
+            results_text = render_text(font, describe_results(self.search_results), white)
+            search_items.append((results_text, (self.search_rect.x, self.search_rect.bottom + layout.size(8))))
+        self.search_sprites.show(search_items)
+        profiler.mark('info')
+
+        hover = get_element_at_pos(self.mouse_pos)
+        if hover != self.hover_element:
+            self.hover_element = hover
+            self.tooltip = create_tooltip(hover) if hover else None
+        self.tooltip_sprites.show([(self.tooltip, tooltip_pos(self.mouse_pos))] if self.tooltip else [])
+        profiler.mark('tooltip')
+
+        # Popups fade by changing their alpha in place, so they are redrawn every frame
+        self.popup_sprites.show(notifications.placed())
+        self.popup_sprites.touch()
+
+        tiles = get_atlas()
+        self.drag_sprites.show([(tiles.tile(symbol), (x - cell_size // 2, y - cell_size // 2))
+                                for symbol, (x, y) in self.drags.values()])
+
+        if self.show_hud:
+            stats = self.scheduler.stats() if self.scheduler else None
+            self.hud_sprites.show(performance_hud_items(profiler, self.fps, stats))
+        else:
+            self.hud_sprites.show([])
+        profiler.mark('overlay')
+
+        areas = self.sprites.draw(renderer, self.background_surface)
+        profiler.mark('composite')
+        renderer.present(areas)
+        self.dirty = False
+        profiler.mark('display')
+
+    # Whether the next pass of the loop has anything new to show
+    def wants_frame(self):
+        return bool(self.dirty or len(notifications) or self.show_hud or (animate_shells and self.merge_area))
+
+    # One pass of the main loop without the frame limiter. Unless forced, the
+    # frame is only drawn if something changed; returns whether it was drawn.
+    def step(self, events, elapsed_ms, force=True):
+        self.profiler.begin_frame()
+        for event in events:
+            self.handle_event(event)
+        self.profiler.mark('events')
+        drawn = force or self.wants_frame()
+        if drawn:
+            self.draw()
+            self.profiler.end_frame()
+        else:
+            self.profiler.discard_frame()
+        if notifications.advance(elapsed_ms):
+            self.dirty = True
+        return drawn
+
+# Plays the game until the window is closed. session is the logged-in user's
+# session from the launcher, or None when the game is started on its own.
+# frame_rate caps the frame rate while something is changing; low_power
+# swaps in the lower low_power_frame_rate cap for battery-powered kiosks.
+# record writes every frame's input to an event log (see eventlog.py); replay
+# plays one back instead of reading input, paced as recorded unless
+# replay_fast, and sets game.replay_mismatches to how the final state differed.
+def run(session=None, startup_profile=False, frame_rate=60, low_power=False, size=None, backend='cpu',
+        software=False, record=None, replay=None, replay_fast=False):
+    if replay is not None:
+        log = read_log(replay)
+        # Recorded positions only line up at the recorded window size
+        size = log.size
+    if size is not None:
+        apply_layout(*size)
+    init(backend, software)
+    if session is not None:
+        renderer.set_title(f'Periodic Table - {session.username}')
+    if replay is not None:
+        scheduler = ReplayScheduler(log, replay_fast)
+    else:
+        scheduler = FrameScheduler(frame_rate, low_power_frame_rate, low_power)
+    game = Game()
+    game.session = session
+    game.scheduler = scheduler
+    store = None
+    if session is not None:
+        store = ProgressStore(progress_db_path)
+        game.progress = PlayerProgress(store, session)
+    startup.mark('fonts and background')
+    game.start()
+    recorder = EventRecorder(record, game, (width, height)) if record else None
+    if replay is not None:
+        scheduler.prepare(game)
+    elapsed = 0
+    first_frame = True
+    while True:
+        events = scheduler.next_events(game.wants_frame())
+        if recorder is not None:
+            recorder.frame(elapsed, events)
+        for event in events:
+            if event.type == pygame.QUIT:
+                if recorder is not None:
+                    recorder.finish(game)
+                if replay is not None:
+                    game.replay_mismatches = scheduler.verify(game)
+                pygame.quit()
+                if store is not None:
+                    game.progress.finish()
+                    # Flushes the writes still queued
+                    store.close()
+                return game
+        scheduler.frame_done(game.step(events, elapsed, force=first_frame))
+        if first_frame:
+            first_frame = False
+            startup.mark('first frame')
+            if startup_profile:
+                print(startup.report())
+        elapsed = scheduler.tick()
+        game.fps = scheduler.get_fps()
+
+def window_size(text):
+    try:
+        w, h = (int(part) for part in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {text!r}")
+    return w, h
 
-        pygame.display.flip()
-        clock.tick(60)
+def main():
+    parser = argparse.ArgumentParser(description='Periodic table game')
+    parser.add_argument('--startup-profile', action='store_true', help='print startup timings after the first frame')
+    parser.add_argument('--fps', type=int, default=60, help='frame rate cap while the screen is changing')
+    parser.add_argument('--low-power', action='store_true', help=f'cap the frame rate at {low_power_frame_rate} FPS')
+    parser.add_argument('--size', type=window_size, help='initial window size, e.g. 1920x1080')
+    parser.add_argument('--renderer', choices=('cpu', 'gpu'), default='cpu',
+                        help='draw with CPU blits or with GPU textures (falls back to cpu if unavailable)')
+    parser.add_argument('--software', action='store_true', help="use SDL's software renderer for --renderer gpu")
+    parser.add_argument('--user', help='record progress for this player without going through the login window')
+    parser.add_argument('--record', metavar='LOG', help='record all input to this event log')
+    parser.add_argument('--replay', metavar='LOG', help='play back an event log and check the final state matches')
+    parser.add_argument('--fast', action='store_true', help='with --replay, run frames back to back instead of in real time')
+    args = parser.parse_args()
+    session = Session(args.user) if args.user else None
+    game = run(session, startup_profile=args.startup_profile, frame_rate=args.fps, low_power=args.low_power,
+               size=args.size, backend=args.renderer, software=args.software, record=args.record,
+               replay=args.replay, replay_fast=args.fast)
+    if args.replay:
+        if game.replay_mismatches:
+            print("Replay diverged from the recording:")
+            for line in game.replay_mismatches:
+                print(f"  {line}")
+            sys.exit(1)
+        stats = game.scheduler.stats()
+        print(f"Replay matched the recording ({stats['frames_replayed']} frames)")
+    sys.exit()
 
 if __name__ == "__main__":
     main()
-
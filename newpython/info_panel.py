@@ -0,0 +1,68 @@
+import functools
+from collections import OrderedDict
+
+import pygame
+
+
+# Lines of text no wider than max_width, breaking between words (a word wider
+# than the whole line gets a line to itself). Computed once per font, string
+# and width.
+@functools.lru_cache(maxsize=2048)
+def wrap_text(font, text, max_width):
+    lines = []
+    line = ''
+    for word in text.split():
+        candidate = f'{line} {word}' if line else word
+        if line and font.size(candidate)[0] > max_width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    lines.append(line)
+    return tuple(lines)
+
+
+# The info panel composed into one surface per set of lines and panel size.
+# Frames reuse the last image while the lines are unchanged, and switching back
+# to an element or compound seen before reuses its cached image.
+class InfoPanel:
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.images = OrderedDict()
+        self.lines = None
+        self.key = None
+        self.image = None
+        self.composed = 0
+
+    # paragraph_spacing separates the given lines; wrapped continuations use the
+    # font's own line height. Text past the bottom of the panel is cut off.
+    def render(self, lines, font, color, size, paragraph_spacing):
+        if lines is self.lines and self.key[1:] == (font, color, size, paragraph_spacing):
+            return self.image
+        key = (tuple(lines), font, color, size, paragraph_spacing)
+        image = self.images.get(key)
+        if image is None:
+            image = self.compose(key)
+            self.images[key] = image
+            if len(self.images) > self.max_size:
+                self.images.popitem(last=False)
+        else:
+            self.images.move_to_end(key)
+        self.lines, self.key, self.image = lines, key, image
+        return image
+
+    def compose(self, key):
+        lines, font, color, size, paragraph_spacing = key
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        y = 0
+        for text in lines:
+            wrapped = wrap_text(font, text, size[0])
+            for i, line in enumerate(wrapped):
+                image.blit(font.render(line, True, color), (0, y))
+                y += font.get_linesize() if i < len(wrapped) - 1 else paragraph_spacing
+        self.composed += 1
+        return image
+
+    def clear(self):
+        self.images.clear()
+        self.lines = self.key = self.image = None
@@ -0,0 +1,43 @@
+import threading
+import time
+import uuid
+
+
+# The logged-in player, handed from the login window to the game
+class Session:
+    def __init__(self, username):
+        self.username = username
+        self.login_time = time.time()
+        self.id = uuid.uuid4().hex
+
+
+# Starts the game in this process instead of a fresh interpreter. prewarm()
+# imports pygame and gamebasic and loads the fonts on a background thread while
+# the login form is still open; the window itself is only opened by launch(),
+# on the main thread, because SDL needs the display owned by that thread.
+class GameLauncher:
+    def __init__(self):
+        self.thread = None
+        self.error = None
+
+    def prewarm(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.warm_up, name='game-prewarm', daemon=True)
+            self.thread.start()
+
+    def warm_up(self):
+        try:
+            import gamebasic
+            gamebasic.load_fonts()
+            gamebasic.prerender_symbols()
+        except Exception as error:
+            # Reported, and retried on the main thread, by launch()
+            self.error = error
+
+    def launch(self, session=None):
+        if self.thread is not None:
+            self.thread.join()
+        if self.error is not None:
+            print(f"Game warm-up failed, loading on launch instead: {self.error}")
+        import gamebasic
+        return gamebasic.run(session)
@@ -0,0 +1,25 @@
+import pygame
+
+# Everything is positioned on this design canvas and scaled to the window
+base_width, base_height = 1280, 720
+
+
+# Uniform scale from the design canvas to a window of any size. The canvas is
+# fitted inside the window and centred, so nothing is stretched or cut off.
+class Layout:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.scale = min(width / base_width, height / base_height)
+        self.origin_x = (width - round(base_width * self.scale)) // 2
+        self.origin_y = (height - round(base_height * self.scale)) // 2
+
+    # A design-canvas length in window pixels, never less than one pixel
+    def size(self, length):
+        return max(1, round(length * self.scale))
+
+    def point(self, x, y):
+        return self.origin_x + round(x * self.scale), self.origin_y + round(y * self.scale)
+
+    def rect(self, x, y, w, h):
+        return pygame.Rect(self.point(x, y), (self.size(w), self.size(h)))
@@ -0,0 +1,130 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+import urllib.parse
+
+from periodic_data import compounds, elements
+from server import default_port
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+
+def request_bytes(method, path, host, data=None):
+    body = b'' if data is None else json.dumps(data).encode('utf-8')
+    head = f'{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(body)}\r\n'
+    if data is not None:
+        head += 'Content-Type: application/json\r\n'
+    return (head + '\r\n').encode('latin-1') + body
+
+
+# Requests a simulated client picks from, as (name, method, path, body, weight).
+# Merges are random pools of tiles, mostly real compounds.
+def request_mix(rng, logins, username=None, password=None):
+    tables = list(compounds.values())
+    symbols = list(elements)
+    mix = [('elements', 'GET', '/elements', None, 1),
+           ('element', 'GET', f'/elements/{rng.choice(symbols)}', None, 2)]
+    for _ in range(200):
+        if rng.random() < 0.7:
+            tiles = list(rng.choice(tables)['elements'])
+        else:
+            tiles = rng.choices(symbols, k=rng.randint(1, 6))
+        mix.append(('merge', 'POST', '/merge', {'elements': tiles}, 40 / 200))
+    if logins:
+        mix.append(('login', 'POST', '/login', {'username': username, 'password': password}, logins))
+    return mix
+
+
+async def read_response(reader):
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+# One keep-alive connection sending requests back to back until the deadline
+async def client(host, port, mix, deadline, latencies, errors, seed):
+    rng = random.Random(seed)
+    weights = [item[4] for item in mix]
+    encoded = [(name, request_bytes(method, path, host, data)) for name, method, path, data, _ in mix]
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            name, data = rng.choices(encoded, weights)[0]
+            started = time.perf_counter()
+            writer.write(data)
+            status = await read_response(reader)
+            latencies.setdefault(name, []).append((time.perf_counter() - started) * 1000)
+            if status != 200:
+                errors[name] = errors.get(name, 0) + 1
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, connections, duration, logins, seed, username=None, password=None):
+    rng = random.Random(seed)
+    if logins:
+        # Make sure the login user exists; 'exists' is fine too
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(request_bytes('POST', '/register', host, {'username': username, 'password': password}))
+        await read_response(reader)
+        writer.close()
+    mix = request_mix(rng, logins, username, password)
+    latencies = {}
+    errors = {}
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(client(host, port, mix, deadline, latencies, errors, seed + i)
+                           for i in range(connections)))
+    return time.perf_counter() - started, latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test a running server.py')
+    parser.add_argument('--url', default=f'http://127.0.0.1:{default_port}')
+    parser.add_argument('--connections', type=int, default=50, help='concurrent keep-alive connections')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds to run')
+    parser.add_argument('--logins', type=float, default=0.0,
+                        help='weight of bcrypt logins in the mix, relative to 43 for everything else')
+    parser.add_argument('--username', help='account used for --logins; it is registered if it does not exist, '
+                                               'so point the server at a scratch --db')
+    parser.add_argument('--password', help='password of the --username account')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    if args.logins and not (args.username and args.password):
+        parser.error('--logins needs --username and --password')
+    parts = urllib.parse.urlsplit(args.url)
+
+    wall, latencies, errors = asyncio.run(run_load(parts.hostname, parts.port or 80, args.connections,
+                                                   args.duration, args.logins, args.seed, args.username,
+                                                   args.password))
+    total = sum(len(times) for times in latencies.values())
+    print(f"{total} requests over {args.connections} connections in {wall:.1f} s: {total / wall:.0f} req/s")
+    print(f"{'endpoint':<10}{'count':>8}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}{'errors':>8}")
+    everything = []
+    for name, times in sorted(latencies.items()):
+        times.sort()
+        everything += times
+        print(f"{name:<10}{len(times):>8}{percentile(times, 50):>9.2f}{percentile(times, 90):>9.2f}"
+              f"{percentile(times, 99):>9.2f}{times[-1]:>9.2f}{errors.get(name, 0):>8}")
+    everything.sort()
+    if everything:
+        print(f"{'all':<10}{len(everything):>8}{percentile(everything, 50):>9.2f}{percentile(everything, 90):>9.2f}"
+              f"{percentile(everything, 99):>9.2f}{everything[-1]:>9.2f}{sum(errors.values()):>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+import argparse
+import json
+import random
+import time
+
+from compound_index import CompoundIndex, MergePool
+from periodic_data import compounds as table_compounds, elements
+
+budget_ms = 1.0  # Per-merge latency target
+
+
+# A compounds table of the given size with random but plausible formulas: the
+# first twenty elements are picked far more often, as in real chemistry
+def synthetic_compounds(count, seed=0):
+    rng = random.Random(seed)
+    symbols = list(elements)
+    weights = [20 if elements[symbol]['atomic_number'] <= 20 else 1 for symbol in symbols]
+    generated = dict(table_compounds)
+    while len(generated) < count:
+        distinct = rng.choice((1, 2, 2, 3, 3, 3, 4, 4, 5))
+        chosen = set()
+        while len(chosen) < distinct:
+            chosen.add(rng.choices(symbols, weights)[0])
+        parts = [(symbol, rng.randint(1, 6)) for symbol in sorted(chosen)]
+        formula = ''.join(symbol + (str(n) if n > 1 else '') for symbol, n in parts)
+        if formula in generated:
+            continue
+        generated[formula] = {
+            'elements': [symbol for symbol, n in parts for _ in range(n)],
+            'name': f'Compound {len(generated)}',
+            'uses': '',
+            'properties': '',
+        }
+    return generated
+
+
+# Merge areas to replay, each a list of tiles dropped one at a time
+def pools(index, rng, count):
+    table = list(index.compounds)
+    common = [symbol for symbol in elements if elements[symbol]['atomic_number'] <= 20]
+    scripts = {
+        # Exactly the tiles of some compound
+        'exact': [list(index.compounds[rng.choice(table)]['elements']) for _ in range(count)],
+        # A few random common elements
+        'small': [rng.choices(common, k=rng.randint(2, 6)) for _ in range(count)],
+        # Thousands of tiles dropped in a single merge area
+        'huge': [rng.choices(common, k=2000) for _ in range(max(1, count // 50))],
+    }
+    return scripts
+
+
+# Times what the game does per merge: add the tile, check for a compound,
+# refresh the "Possible" hint and list what the pool could build
+def time_merge(index, tiles):
+    times = []
+    pool = MergePool()
+    for symbol in tiles:
+        started = time.perf_counter()
+        pool.add(symbol)
+        index.react(pool.counts)
+        len(index.reachable(pool.counts))
+        index.buildable(pool.counts, limit=3)
+        times.append((time.perf_counter() - started) * 1000)
+    return times
+
+
+def summarise(times):
+    times = sorted(times)
+    return {
+        'merges': len(times),
+        'mean_ms': sum(times) / len(times),
+        'p99_ms': times[min(len(times) - 1, int(len(times) * 0.99))],
+        'max_ms': times[-1],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Per-merge latency of the combination engine')
+    parser.add_argument('--compounds', type=int, default=50000, help='size of the synthetic compounds table')
+    parser.add_argument('--pools', type=int, default=500, help='merge areas per scenario')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    compounds = synthetic_compounds(args.compounds, args.seed)
+    started = time.perf_counter()
+    index = CompoundIndex(compounds)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    rng = random.Random(args.seed)
+    results = {}
+    for name, scripts in pools(index, rng, args.pools).items():
+        times = []
+        for tiles in scripts:
+            times += time_merge(index, tiles)
+        results[name] = summarise(times)
+    report = {'compounds': len(index), 'index_build_ms': build_ms, 'budget_ms': budget_ms, 'results': results}
+    print(json.dumps(report, indent=2))
+    over = [name for name, result in results.items() if result['p99_ms'] > budget_ms]
+    if over:
+        print(f"OVER the {budget_ms} ms budget at p99: {', '.join(over)}")
+        return 1
+    print(f"p99 within the {budget_ms} ms budget")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+import pygame
+
+
+class Notification:
+    def __init__(self, image, duration, fade):
+        self.image = image
+        self.age = 0
+        self.duration = duration
+        self.fade = fade
+
+    def expired(self):
+        return self.age >= self.duration
+
+    def alpha(self):
+        fade_in = self.age / self.fade if self.fade else 1
+        fade_out = (self.duration - self.age) / self.fade if self.fade else 1
+        return int(255 * max(0, min(1, fade_in, fade_out)))
+
+
+# Timed popup messages owned by the main loop. The newest message is centred on
+# the anchor and older ones stack above it; they fade in and out and expire as
+# the loop advances the clock, so nothing here ever waits.
+class NotificationQueue:
+    def __init__(self, anchor, duration=1500, fade=200, spacing=6, max_visible=4):
+        self.anchor = anchor
+        self.duration = duration
+        self.fade = fade
+        self.spacing = spacing
+        self.max_visible = max_visible
+        self.active = []
+
+    def push(self, image, duration=None):
+        # Each notification gets its own copy so fading never touches a cached surface
+        image = image.convert_alpha() if pygame.display.get_surface() else image.copy()
+        self.active.append(Notification(image, duration or self.duration, self.fade))
+        if len(self.active) > self.max_visible:
+            del self.active[:-self.max_visible]
+
+    # Returns how many notifications expired, so the caller can erase them
+    def advance(self, elapsed_ms):
+        for notification in self.active:
+            notification.age += elapsed_ms
+        count = len(self.active)
+        self.active = [notification for notification in self.active if not notification.expired()]
+        return count - len(self.active)
+
+    def __len__(self):
+        return len(self.active)
+
+    # (image, position) of each visible notification, with its current fade applied
+    def placed(self):
+        items = []
+        bottom = None
+        for notification in reversed(self.active):
+            image = notification.image
+            image.set_alpha(notification.alpha())
+            if bottom is None:
+                rect = image.get_rect(center=self.anchor)
+            else:
+                rect = image.get_rect(midbottom=(self.anchor[0], bottom))
+            items.append((image, rect.topleft))
+            bottom = rect.top - self.spacing
+        return items
@@ -0,0 +1,303 @@
+# Colors for element groups
+alkali_metals = (255, 204, 204)
+alkali_earth_metals = (255, 229, 204)
+transition_metals = (255, 255, 204)
+post_transition_metals = (229, 255, 204)
+metalloids = (204, 255, 204)
+nonmetals = (204, 255, 229)
+halogens = (204, 229, 255)
+noble_gas = (229, 204, 255)
+lanthanides = (255, 204, 229)
+actinides = (225, 229, 204)
+
+# Elements
+elements = {
+    'H': {'name': 'Hydrogen', 'color': nonmetals, 'atomic_number': 1, 'mass': 1.008, 'electron_config': '1s1', 'shells': [1]},
+    'He': {'name': 'Helium', 'color': noble_gas, 'atomic_number': 2, 'mass': 4.003, 'electron_config': '1s2', 'shells': [2]},
+    'Li': {'name': 'Lithium', 'color': alkali_metals, 'atomic_number': 3, 'mass': 6.94, 'electron_config': '1s2 2s1', 'shells': [2, 1]},
+    'Be': {'name': 'Beryllium', 'color': alkali_earth_metals, 'atomic_number': 4, 'mass': 9.0122, 'electron_config': '1s2 2s2', 'shells': [2, 2]},
+    'B': {'name': 'Boron', 'color': metalloids, 'atomic_number': 5, 'mass': 10.81, 'electron_config': '1s2 2s2 2p1', 'shells': [2, 3]},
+    'C': {'name': 'Carbon', 'color': nonmetals, 'atomic_number': 6, 'mass': 12.011, 'electron_config': '1s2 2s2 2p2', 'shells': [2, 4]},
+    'N': {'name': 'Nitrogen', 'color': nonmetals, 'atomic_number': 7, 'mass': 14.007, 'electron_config': '1s2 2s2 2p3', 'shells': [2, 5]},
+    'O': {'name': 'Oxygen', 'color': nonmetals, 'atomic_number': 8, 'mass': 15.999, 'electron_config': '1s2 2s2 2p4', 'shells': [2, 6]},
+    'F': {'name': 'Fluorine', 'color': halogens, 'atomic_number': 9, 'mass': 18.998, 'electron_config': '1s2 2s2 2p5', 'shells': [2, 7]},
+    'Ne': {'name': 'Neon', 'color': noble_gas, 'atomic_number': 10, 'mass': 20.180, 'electron_config': '1s2 2s2 2p6', 'shells': [2, 8]},
+    'Na': {'name': 'Sodium', 'color': alkali_metals, 'atomic_number': 11, 'mass': 22.990, 'electron_config': '1s2 2s2 2p6 3s1', 'shells': [2, 8, 1]},
+    'Mg': {'name': 'Magnesium', 'color': alkali_earth_metals, 'atomic_number': 12, 'mass': 24.305, 'electron_config': '1s2 2s2 2p6 3s2', 'shells': [2, 8, 2]},
+    'Al': {'name': 'Aluminum', 'color': post_transition_metals, 'atomic_number': 13, 'mass': 26.982, 'electron_config': '1s2 2s2 2p6 3s2 3p1', 'shells': [2, 8, 3]},
+    'Si': {'name': 'Silicon', 'color': metalloids, 'atomic_number': 14, 'mass': 28.085, 'electron_config': '1s2 2s2 2p6 3s2 3p2', 'shells': [2, 8, 4]},
+    'P': {'name': 'Phosphorus', 'color': nonmetals, 'atomic_number': 15, 'mass': 30.974, 'electron_config': '1s2 2s2 2p6 3s2 3p3', 'shells': [2, 8, 5]},
+    'S': {'name': 'Sulfur', 'color': nonmetals, 'atomic_number': 16, 'mass': 32.06, 'electron_config': '1s2 2s2 2p6 3s2 3p4', 'shells': [2, 8, 6]},
+    'Cl': {'name': 'Chlorine', 'color': halogens, 'atomic_number': 17, 'mass': 35.45, 'electron_config': '1s2 2s2 2p6 3s2 3p5', 'shells': [2, 8, 7]},
+    'Ar': {'name': 'Argon', 'color': noble_gas, 'atomic_number': 18, 'mass': 39.948, 'electron_config': '1s2 2s2 2p6 3s2 3p6', 'shells': [2, 8, 8]},
+    'K': {'name': 'Potassium', 'color': alkali_metals, 'atomic_number': 19, 'mass': 39.098, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s1', 'shells': [2, 8, 8, 1]},
+    'Ca': {'name': 'Calcium', 'color': alkali_earth_metals, 'atomic_number': 20, 'mass': 40.078, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2', 'shells': [2, 8, 8, 2]},
+    'Sc': {'name': 'Scandium', 'color': transition_metals, 'atomic_number': 21, 'mass': 44.956, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d1', 'shells': [2, 8, 9, 2]},
+    'Ti': {'name': 'Titanium', 'color': transition_metals, 'atomic_number': 22, 'mass': 47.867, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d2', 'shells': [2, 8, 10, 2]},
+    'V': {'name': 'Vanadium', 'color': transition_metals, 'atomic_number': 23, 'mass': 50.942, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d3', 'shells': [2, 8, 11, 2]},
+    'Cr': {'name': 'Chromium', 'color': transition_metals, 'atomic_number': 24, 'mass': 51.996, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s1 3d5', 'shells': [2, 8, 13, 1]},
+    'Mn': {'name': 'Manganese', 'color': transition_metals, 'atomic_number': 25, 'mass': 54.938, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d5', 'shells': [2, 8, 13, 2]},
+    'Fe': {'name': 'Iron', 'color': transition_metals, 'atomic_number': 26, 'mass': 55.845, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d6', 'shells': [2, 8, 14, 2]},
+    'Co': {'name': 'Cobalt', 'color': transition_metals, 'atomic_number': 27, 'mass': 58.933, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d7', 'shells': [2, 8, 15, 2]},
+    'Ni': {'name': 'Nickel', 'color': transition_metals, 'atomic_number': 28, 'mass': 58.933, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d8', 'shells': [2, 8, 16, 2]},
+    'Cu': {'name': 'Copper', 'color': transition_metals, 'atomic_number': 29, 'mass': 63.546, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s1 3d10', 'shells': [2, 8, 18, 1]},
+    'Zn': {'name': 'Zinc', 'color': transition_metals, 'atomic_number': 30, 'mass': 65.38, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10', 'shells': [2, 8, 18, 2]},
+    'Ga': {'name': 'Gallium', 'color': post_transition_metals, 'atomic_number': 31, 'mass': 69.723, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p1', 'shells': [2, 8, 18, 3]},
+    'Ge': {'name': 'Germanium', 'color': metalloids, 'atomic_number': 32, 'mass': 72.63, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p2', 'shells': [2, 8, 18, 4]},
+    'As': {'name': 'Arsenic', 'color': metalloids, 'atomic_number': 33, 'mass': 74.922, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p3', 'shells': [2, 8, 18, 5]},
+    'Se': {'name': 'Selenium', 'color': nonmetals, 'atomic_number': 34, 'mass': 78.971, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p4', 'shells': [2, 8, 18, 6]},
+    'Br': {'name': 'Bromine', 'color': halogens, 'atomic_number': 35, 'mass': 79.904, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p5', 'shells': [2, 8, 18, 7]},
+    'Kr': {'name': 'Krypton', 'color': noble_gas, 'atomic_number': 36, 'mass': 83.798, 'electron_config': '1s2 2s2 2p6 3s2 3p6 4s2 3d10 4p6', 'shells': [2, 8, 18, 8]},
+    'Rb': {'name': 'Rubidium', 'color': alkali_metals, 'atomic_number': 37, 'mass': 85.468, 'electron_config': '[Kr] 5s1', 'shells': [2, 8, 18, 8, 1]},
+    'Sr': {'name': 'Strontium', 'color': alkali_earth_metals, 'atomic_number': 38, 'mass': 87.62, 'electron_config': '[Kr] 5s2', 'shells': [2, 8, 18, 8, 2]},
+    'Y': {'name': 'Yttrium', 'color': transition_metals, 'atomic_number': 39, 'mass': 88.906, 'electron_config': '[Kr] 5s2 4d1', 'shells': [2, 8, 18, 9, 2]},
+    'Zr': {'name': 'Zirconium', 'color': transition_metals, 'atomic_number': 40, 'mass': 91.224, 'electron_config': '[Kr] 5s2 4d2', 'shells': [2, 8, 18, 10, 2]},
+    'Nb': {'name': 'Niobium', 'color': transition_metals, 'atomic_number': 41, 'mass': 92.906, 'electron_config': '[Kr] 5s1 4d4', 'shells': [2, 8, 18, 12, 1]},
+    'Mo': {'name': 'Molybdenum', 'color': transition_metals, 'atomic_number': 42, 'mass': 95.95, 'electron_config': '[Kr] 5s1 4d5', 'shells': [2, 8, 18, 13, 1]},
+    'Tc': {'name': 'Technetium', 'color': transition_metals, 'atomic_number': 43, 'mass': 98, 'electron_config': '[Kr] 5s2 4d5', 'shells': [2, 8, 18, 13, 2]},
+    'Ru': {'name': 'Ruthenium', 'color': transition_metals, 'atomic_number': 44, 'mass': 101.07, 'electron_config': '[Kr] 5s1 4d7', 'shells': [2, 8, 18, 15, 1]},
+    'Rh': {'name': 'Rhodium', 'color': transition_metals, 'atomic_number': 45, 'mass': 102.91, 'electron_config': '[Kr] 5s1 4d8', 'shells': [2, 8, 18, 16, 1]},
+    'Pd': {'name': 'Palladium', 'color': transition_metals, 'atomic_number': 46, 'mass': 106.42, 'electron_config': '[Kr] 4d10', 'shells': [2, 8, 18, 18]},
+    'Ag': {'name': 'Silver', 'color': transition_metals, 'atomic_number': 47, 'mass': 107.87, 'electron_config': '[Kr] 5s1 4d10', 'shells': [2, 8, 18, 18, 1]},
+    'Cd': {'name': 'Cadmium', 'color': transition_metals, 'atomic_number': 48, 'mass': 112.41, 'electron_config': '[Kr] 5s2 4d10', 'shells': [2, 8, 18, 18, 2]},
+    'In': {'name': 'Indium', 'color': post_transition_metals, 'atomic_number': 49, 'mass': 114.82, 'electron_config': '[Kr] 5s2 4d10 5p1', 'shells': [2, 8, 18, 18, 3]},
+    'Sn': {'name': 'Tin', 'color': post_transition_metals, 'atomic_number': 50, 'mass': 118.71, 'electron_config': '[Kr] 5s2 4d10 5p2', 'shells': [2, 8, 18, 18, 4]},
+    'Sb': {'name': 'Antimony', 'color': metalloids, 'atomic_number': 51, 'mass': 121.76, 'electron_config': '[Kr] 5s2 4d10 5p3', 'shells': [2, 8, 18, 18, 5]},
+    'Te': {'name': 'Tellurium', 'color': metalloids, 'atomic_number': 52, 'mass': 127.60, 'electron_config': '[Kr] 5s2 4d10 5p4', 'shells': [2, 8, 18, 18, 6]},
+    'I': {'name': 'Iodine', 'color': halogens, 'atomic_number': 53, 'mass': 126.90, 'electron_config': '[Kr] 5s2 4d10 5p5', 'shells': [2, 8, 18, 18, 7]},
+    'Xe': {'name': 'Xenon', 'color': noble_gas, 'atomic_number': 54, 'mass': 131.29, 'electron_config': '[Kr] 5s2 4d10 5p6', 'shells': [2, 8, 18, 18, 8]},
+    'Cs': {'name': 'Cesium', 'color': alkali_metals, 'atomic_number': 55, 'mass': 132.91, 'electron_config': '[Xe] 6s1', 'shells': [2, 8, 18, 18, 8, 1]},
+    'Ba': {'name': 'Barium', 'color': alkali_earth_metals, 'atomic_number': 56, 'mass': 137.33, 'electron_config': '[Xe] 6s2', 'shells': [2, 8, 18, 18, 8, 2]},
+    'La': {'name': 'Lanthanum', 'color': lanthanides, 'atomic_number': 57, 'mass': 138.91, 'electron_config': '[Xe] 6s2 5d1', 'shells': [2, 8, 18, 18, 9, 2]},
+    'Ce': {'name': 'Cerium', 'color': lanthanides, 'atomic_number': 58, 'mass': 140.12, 'electron_config': '[Xe] 6s2 4f1 5d1', 'shells': [2, 8, 18, 19, 9, 2]},
+    'Pr': {'name': 'Praseodymium', 'color': lanthanides, 'atomic_number': 59, 'mass': 140.91, 'electron_config': '[Xe] 6s2 4f3', 'shells': [2, 8, 18, 21, 8, 2]},
+    'Nd': {'name': 'Neodymium', 'color': lanthanides, 'atomic_number': 60, 'mass': 144.24, 'electron_config': '[Xe] 6s2 4f4', 'shells': [2, 8, 18, 22, 8, 2]},
+    'Pm': {'name': 'Promethium', 'color': lanthanides, 'atomic_number': 61, 'mass': 145, 'electron_config': '[Xe] 6s2 4f5', 'shells': [2, 8, 18, 23, 8, 2]},
+    'Sm': {'name': 'Samarium', 'color': lanthanides, 'atomic_number': 62, 'mass': 150.36, 'electron_config': '[Xe] 6s2 4f6', 'shells': [2, 8, 18, 24, 8, 2]},
+    'Eu': {'name': 'Europium', 'color': lanthanides, 'atomic_number': 63, 'mass': 151.96, 'electron_config': '[Xe] 6s2 4f7', 'shells': [2, 8, 18, 25, 8, 2]},
+    'Gd': {'name': 'Gadolinium', 'color': lanthanides, 'atomic_number': 64, 'mass': 157.25, 'electron_config': '[Xe] 6s2 4f7 5d1', 'shells': [2, 8, 18, 25, 9, 2]},
+    'Tb': {'name': 'Terbium', 'color': lanthanides, 'atomic_number': 65, 'mass': 158.93, 'electron_config': '[Xe] 6s2 4f9', 'shells': [2, 8, 18, 27, 8, 2]},
+    'Dy': {'name': 'Dysprosium', 'color': lanthanides, 'atomic_number': 66, 'mass': 162.50, 'electron_config': '[Xe] 6s2 4f10', 'shells': [2, 8, 18, 28, 8, 2]},
+    'Ho': {'name': 'Holmium', 'color': lanthanides, 'atomic_number': 67, 'mass': 164.93, 'electron_config': '[Xe] 6s2 4f11', 'shells': [2, 8, 18, 29, 8, 2]},
+    'Er': {'name': 'Erbium', 'color': lanthanides, 'atomic_number': 68, 'mass': 167.26, 'electron_config': '[Xe] 6s2 4f12', 'shells': [2, 8, 18, 30, 8, 2]},
+    'Tm': {'name': 'Thulium', 'color': lanthanides, 'atomic_number': 69, 'mass': 168.93, 'electron_config': '[Xe] 6s2 4f13', 'shells': [2, 8, 18, 31, 8, 2]},
+    'Yb': {'name': 'Ytterbium', 'color': lanthanides, 'atomic_number': 70, 'mass': 173.04, 'electron_config': '[Xe] 6s2 4f14', 'shells': [2, 8, 18, 32, 8, 2]},
+    'Lu': {'name': 'Lutetium', 'color': lanthanides, 'atomic_number': 71, 'mass': 174.97, 'electron_config': '[Xe] 6s2 4f14 5d1', 'shells': [2, 8, 18, 32, 9, 2]},
+    'Hf': {'name': 'Hafnium', 'color': transition_metals, 'atomic_number': 72, 'mass': 178.49, 'electron_config': '[Xe] 6s2 4f14 5d2', 'shells': [2, 8, 18, 32, 10, 2]},
+    'Ta': {'name': 'Tantalum', 'color': transition_metals, 'atomic_number': 73, 'mass': 180.95, 'electron_config': '[Xe] 6s2 4f14 5d3', 'shells': [2, 8, 18, 32, 11, 2]},
+    'W': {'name': 'Tungsten', 'color': transition_metals, 'atomic_number': 74, 'mass': 183.84, 'electron_config': '[Xe] 6s2 4f14 5d4', 'shells': [2, 8, 18, 32, 12, 2]},
+    'Re': {'name': 'Rhenium', 'color': transition_metals, 'atomic_number': 75, 'mass': 186.21, 'electron_config': '[Xe] 6s2 4f14 5d5', 'shells': [2, 8, 18, 32, 13, 2]},
+    'Os': {'name': 'Osmium', 'color': transition_metals, 'atomic_number': 76, 'mass': 190.23, 'electron_config': '[Xe] 6s2 4f14 5d6', 'shells': [2, 8, 18, 32, 14, 2]},
+    'Ir': {'name': 'Iridium', 'color': transition_metals, 'atomic_number': 77, 'mass': 192.22, 'electron_config': '[Xe] 6s2 4f14 5d7', 'shells': [2, 8, 18, 32, 15, 2]},
+    'Pt': {'name': 'Platinum', 'color': transition_metals, 'atomic_number': 78, 'mass': 195.08, 'electron_config': '[Xe] 6s1 4f14 5d9', 'shells': [2, 8, 18, 32, 17, 1]},
+    'Au': {'name': 'Gold', 'color': transition_metals, 'atomic_number': 79, 'mass': 196.97, 'electron_config': '[Xe] 6s1 4f14 5d10', 'shells': [2, 8, 18, 32, 18, 1]},
+    'Hg': {'name': 'Mercury', 'color': transition_metals, 'atomic_number': 80, 'mass': 200.59, 'electron_config': '[Xe] 6s2 4f14 5d10', 'shells': [2, 8, 18, 32, 18, 2]},
+    'Tl': {'name': 'Thallium', 'color': post_transition_metals, 'atomic_number': 81, 'mass': 204.38, 'electron_config': '[Xe] 6s2 4f14 5d10 6p1', 'shells': [2, 8, 18, 32, 18, 3]},
+    'Pb': {'name': 'Lead', 'color': post_transition_metals, 'atomic_number': 82, 'mass': 207.2, 'electron_config': '[Xe] 6s2 4f14 5d10 6p2', 'shells': [2, 8, 18, 32, 18, 4]},
+    'Bi': {'name': 'Bismuth', 'color': post_transition_metals, 'atomic_number': 83, 'mass': 208.98, 'electron_config': '[Xe] 6s2 4f14 5d10 6p3', 'shells': [2, 8, 18, 32, 18, 5]},
+    'Po': {'name': 'Polonium', 'color': metalloids, 'atomic_number': 84, 'mass': 209.98, 'electron_config': '[Xe] 6s2 4f14 5d10 6p4', 'shells': [2, 8, 18, 32, 18, 6]},
+    'At': {'name': 'Astatine', 'color': halogens, 'atomic_number': 85, 'mass': 210, 'electron_config': '[Xe] 6s2 4f14 5d10 6p5', 'shells': [2, 8, 18, 32, 18, 7]},
+    'Rn': {'name': 'Radon', 'color': noble_gas, 'atomic_number': 86, 'mass': 222, 'electron_config': '[Xe] 6s2 4f14 5d10 6p6', 'shells': [2, 8, 18, 32, 18, 8]},
+    'Fr': {'name': 'Francium', 'color': alkali_metals, 'atomic_number': 87, 'mass': 223, 'electron_config': '[Rn] 7s1', 'shells': [2, 8, 18, 32, 18, 8, 1]},
+    'Ra': {'name': 'Radium', 'color': alkali_earth_metals, 'atomic_number': 88, 'mass': 226, 'electron_config': '[Rn] 7s2', 'shells': [2, 8, 18, 32, 18, 8, 2]},
+    'Ac': {'name': 'Actinium', 'color': actinides, 'atomic_number': 89, 'mass': 227, 'electron_config': '[Rn] 7s2 6d1', 'shells': [2, 8, 18, 32, 18, 9, 2]},
+    'Th': {'name': 'Thorium', 'color': actinides, 'atomic_number': 90, 'mass': 232.04, 'electron_config': '[Rn] 7s2 6d2', 'shells': [2, 8, 18, 32, 18, 10, 2]},
+    'Pa': {'name': 'Protactinium', 'color': actinides, 'atomic_number': 91, 'mass': 231.04, 'electron_config': '[Rn] 7s2 5f2 6d1', 'shells': [2, 8, 18, 32, 20, 9, 2]},
+    'U': {'name': 'Uranium', 'color': actinides, 'atomic_number': 92, 'mass': 238.03, 'electron_config': '[Rn] 7s2 5f3 6d1', 'shells': [2, 8, 18, 32, 21, 9, 2]},
+    'Np': {'name': 'Neptunium', 'color': actinides, 'atomic_number': 93, 'mass': 237.048, 'electron_config': '[Rn] 7s2 5f4 6d1', 'shells': [2, 8, 18, 32, 22, 9, 2]},
+    'Pu': {'name': 'Plutonium', 'color': actinides, 'atomic_number': 94, 'mass': 244, 'electron_config': '[Rn] 7s2 5f6', 'shells': [2, 8, 18, 32, 24, 8, 2]},
+    'Am': {'name': 'Americium', 'color': actinides, 'atomic_number': 95, 'mass': 243, 'electron_config': '[Rn] 7s2 5f7', 'shells': [2, 8, 18, 32, 25, 8, 2]},
+    'Cm': {'name': 'Curium', 'color': actinides, 'atomic_number': 96, 'mass': 247, 'electron_config': '[Rn] 7s2 5f7 6d1', 'shells': [2, 8, 18, 32, 25, 9, 2]},
+    'Bk': {'name': 'Berkelium', 'color': actinides, 'atomic_number': 97, 'mass': 247, 'electron_config': '[Rn] 7s2 5f9', 'shells': [2, 8, 18, 32, 27, 8, 2]},
+    'Cf': {'name': 'Californium', 'color': actinides, 'atomic_number': 98, 'mass': 251, 'electron_config': '[Rn] 7s2 5f10', 'shells': [2, 8, 18, 32, 28, 8, 2]},
+    'Es': {'name': 'Einsteinium', 'color': actinides, 'atomic_number': 99, 'mass': 252, 'electron_config': '[Rn] 7s2 5f11', 'shells': [2, 8, 18, 32, 29, 8, 2]},
+    'Fm': {'name': 'Fermium', 'color': actinides, 'atomic_number': 100, 'mass': 257, 'electron_config': '[Rn] 7s2 5f12', 'shells': [2, 8, 18, 32, 30, 8, 2]},
+    'Md': {'name': 'Mendelevium', 'color': actinides, 'atomic_number': 101, 'mass': 258, 'electron_config': '[Rn] 7s2 5f13', 'shells': [2, 8, 18, 32, 31, 8, 2]},
+    'No': {'name': 'Nobelium', 'color': actinides, 'atomic_number': 102, 'mass': 259, 'electron_config': '[Rn] 7s2 5f14', 'shells': [2, 8, 18, 32, 32, 8, 2]},
+    'Lr': {'name': 'Lawrencium', 'color': actinides, 'atomic_number': 103, 'mass': 262, 'electron_config': '[Rn] 7s2 5f14 7p1', 'shells': [2, 8, 18, 32, 32, 8, 3]},
+    'Rf': {'name': 'Rutherfordium', 'color': transition_metals, 'atomic_number': 104, 'mass': 267, 'electron_config': '[Rn] 7s2 5f14 6d2', 'shells': [2, 8, 18, 32, 32, 10, 2]},
+    'Db': {'name': 'Dubnium', 'color': transition_metals, 'atomic_number': 105, 'mass': 270, 'electron_config': '[Rn] 7s2 5f14 6d3', 'shells': [2, 8, 18, 32, 32, 11, 2]},
+    'Sg': {'name': 'Seaborgium', 'color': transition_metals, 'atomic_number': 106, 'mass': 271, 'electron_config': '[Rn] 7s2 5f14 6d4', 'shells': [2, 8, 18, 32, 32, 12, 2]},
+    'Bh': {'name': 'Bohrium', 'color': transition_metals, 'atomic_number': 107, 'mass': 270, 'electron_config': '[Rn] 7s2 5f14 6d5', 'shells': [2, 8, 18, 32, 32, 13, 2]},
+    'Hs': {'name': 'Hassium', 'color': transition_metals, 'atomic_number': 108, 'mass': 277, 'electron_config': '[Rn] 7s2 5f14 6d6', 'shells': [2, 8, 18, 32, 32, 14, 2]},
+
+
+    'Mt': {
+        'name': 'Meitnerium',
+        'color': transition_metals,  # Group 9, Transition metal
+        'atomic_number': 109,
+        'mass': 278,
+        'electron_config': '[Rn] 5f14 6d7 7s2',
+        'shells': [2, 8, 18, 32, 32, 15, 2]
+    },
+    'Ds': {
+        'name': 'Darmstadtium',
+        'color': transition_metals,  # Group 10, Transition metal
+        'atomic_number': 110,
+        'mass': 281,
+        'electron_config': '[Rn] 5f14 6d8 7s2',
+        'shells': [2, 8, 18, 32, 32, 16, 2]
+    },
+    'Rg': {
+        'name': 'Roentgenium',
+        'color': transition_metals,  # Group 11, Transition metal
+        'atomic_number': 111,
+        'mass': 282,
+        'electron_config': '[Rn] 5f14 6d9 7s2',
+        'shells': [2, 8, 18, 32, 32, 17, 2]
+    },
+    'Cn': {
+        'name': 'Copernicium',
+        'color': transition_metals,  # Group 12, Transition metal
+        'atomic_number': 112,
+        'mass': 285,
+        'electron_config': '[Rn] 5f14 6d10 7s2',
+        'shells': [2, 8, 18, 32, 32, 18, 2]
+    },
+    'Nh': {
+        'name': 'Nihonium',
+        'color': post_transition_metals,  # Group 13, Post-transition metal
+        'atomic_number': 113,
+        'mass': 286,
+        'electron_config': '[Rn] 5f14 6d10 7s2 7p1',
+        'shells': [2, 8, 18, 32, 32, 18, 3]
+    },
+    'Fl': {
+        'name': 'Flerovium',
+        'color': post_transition_metals,  # Group 14, Post-transition metal
+        'atomic_number': 114,
+        'mass': 289,
+        'electron_config': '[Rn] 5f14 6d10 7s2 7p2',
+        'shells': [2, 8, 18, 32, 32, 18, 4]
+    },
+    'Mc': {
+        'name': 'Moscovium',
+        'color': post_transition_metals,  # Group 15, Post-transition metal
+        'atomic_number': 115,
+        'mass': 290,
+        'electron_config': '[Rn] 5f14 6d10 7s2 7p3',
+        'shells': [2, 8, 18, 32, 32, 18, 5]
+    },
+    'Lv': {
+        'name': 'Livermorium',
+        'color': post_transition_metals,  # Group 16, Post-transition metal
+        'atomic_number': 116,
+        'mass': 293,
+        'electron_config': '[Rn] 5f14 6d10 7s2 7p4',
+        'shells': [2, 8, 18, 32, 32, 18, 6]
+    },
+    'Ts': {
+        'name': 'Tennessine',
+        'color': halogens,  # Group 17, Halogen
+        'atomic_number': 117,
+        'mass': 294,
+        'electron_config': '[Rn] 5f14 6d10 7s2 7p5',
+        'shells': [2, 8, 18, 32, 32, 18, 7]
+    },
+    'Og': {
+        'name': 'Oganesson',
+        'color': noble_gas,  # Group 18, Noble gas
+        'atomic_number': 118,
+        'mass': 294,
+        'electron_config': '[Rn] 5f14 6d10 7s2 7p6',
+        'shells': [2, 8, 18, 32, 32, 18, 8]
+    }
+}
+
+
+
+
+# Compounds
+compounds = {
+    'H2O': {'elements': ['H', 'O', 'H'], 'name': 'Water', 'uses': 'Essential for life, solvent', 'properties': 'Colorless, odorless, liquid'},
+    'CO2': {'elements': ['C', 'O', 'O'], 'name': 'Carbon Dioxide', 'uses': 'Used in carbonation, fire extinguishers, and as a greenhouse gas', 'properties': 'Colorless, odorless gas at room temperature'},
+
+    'NaCl': {
+        'elements': ['Na', 'Cl'],
+        'name': 'Sodium Chloride',
+        'uses': 'Used as table salt, in food preservation, and as a saline solution',
+        'properties': 'White crystalline solid, highly soluble in water'
+    },
+    'C6H12O6': {
+        'elements': ['C', 'C', 'C', 'C', 'C', 'C', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'O', 'O', 'O', 'O', 'O', 'O'],
+        'name': 'Glucose',
+        'uses': 'Primary energy source for cells, used in food and beverages',
+        'properties': 'White crystalline solid, sweet taste, soluble in water'
+    },
+    'NH3': {
+        'elements': ['N', 'H', 'H', 'H'],
+        'name': 'Ammonia',
+        'uses': 'Used in fertilizers, cleaning products, and as a refrigerant',
+        'properties': 'Colorless gas with a pungent smell, highly soluble in water'
+    },
+    'C2H5OH': {
+        'elements': ['C', 'C', 'H', 'H', 'H', 'H', 'H', 'H', 'O'],
+        'name': 'Ethanol',
+        'uses': 'Used as an alcohol beverage, in disinfectants, and as a solvent',
+        'properties': 'Colorless liquid with a characteristic odor, flammable, miscible with water'
+    },
+    'CaCO3': {
+        'elements': ['Ca', 'C', 'O', 'O', 'O'],
+        'name': 'Calcium Carbonate',
+        'uses': 'Used in antacids, calcium supplements, and as a building material',
+        'properties': 'White solid, insoluble in water, reacts with acids'
+    },
+    'CH4': {
+        'elements': ['C', 'H', 'H', 'H', 'H'],
+        'name': 'Methane',
+        'uses': 'Used as a fuel, in chemical synthesis, and as a refrigerant',
+        'properties': 'Colorless, odorless gas, highly flammable'
+    },
+    'C3H8': {
+        'elements': ['C', 'C', 'C', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H'],
+        'name': 'Propane',
+        'uses': 'Used as a fuel for heating and cooking, in gas grills',
+        'properties': 'Colorless gas, odorless, flammable'
+    },
+    'NaHCO3': {
+        'elements': ['Na', 'H', 'C', 'O', 'O', 'O'],
+        'name': 'Sodium Bicarbonate',
+        'uses': 'Used in baking, as an antacid, and in cleaning',
+        'properties': 'White solid, slightly alkaline, soluble in water'
+    },
+    'C2H4': {
+        'elements': ['C', 'C', 'H', 'H', 'H', 'H'],
+        'name': 'Ethylene',
+        'uses': 'Used in the production of plastics, as a plant hormone',
+        'properties': 'Colorless gas with a sweet odor, flammable'
+    },
+    'SiO2': {
+        'elements': ['Si', 'O', 'O'],
+        'name': 'Silicon Dioxide',
+        'uses': 'Used in glassmaking, as a food additive, and in construction',
+        'properties': 'White solid, insoluble in water, occurs in nature as quartz'
+    },
+    'C12H22O11': {
+        'elements': ['C', 'C', 'C', 'C', 'C', 'C', 'C', 'C', 'C', 'C', 'C', 'C', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O', 'O'],
+        'name': 'Sucrose',
+        'uses': 'Used as table sugar, in food products and beverages',
+        'properties': 'White crystalline solid, sweet taste, soluble in water'
+    },
+    'SO2': {
+        'elements': ['S', 'O', 'O'],
+        'name': 'Sulfur Dioxide',
+        'uses': 'Used as a preservative, in the production of sulfuric acid',
+        'properties': 'Colorless gas with a pungent smell, soluble in water'
+    },
+    'C6H14': {
+        'elements': ['C', 'C', 'C', 'C', 'C', 'C', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H', 'H'],
+        'name': 'Hexane',
+        'uses': 'Used as a solvent in laboratories and in the extraction of oils',
+        'properties': 'Colorless liquid, highly flammable, insoluble in water'
+    },
+    'HCl': {
+        'elements': ['H', 'Cl'],
+        'name': 'Hydrochloric Acid',
+        'uses': 'Used in cleaning agents, food processing, and pH regulation',
+        'properties': 'Colorless, strong acid, highly corrosive'
+    },
+
+
+
+
+}
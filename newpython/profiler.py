@@ -0,0 +1,89 @@
+import csv
+import json
+import time
+from collections import deque
+
+
+# Per-phase frame timings. The loop calls begin_frame(), then mark(phase) as
+# each phase finishes; a phase's time is the gap since the previous mark. The
+# last `capacity` frames are kept in a ring buffer.
+class FrameProfiler:
+    def __init__(self, phases, capacity=600):
+        self.phases = tuple(phases)
+        self.index = {phase: i for i, phase in enumerate(self.phases)}
+        self.frames = deque(maxlen=capacity)
+        self.current = None
+        self.frame_start = 0
+        self.last_mark = 0
+
+    def begin_frame(self):
+        self.frame_start = self.last_mark = time.perf_counter_ns()
+        self.current = [0] * len(self.phases)
+
+    def mark(self, phase):
+        now = time.perf_counter_ns()
+        if self.current is not None:
+            self.current[self.index[phase]] += now - self.last_mark
+        self.last_mark = now
+
+    # Drops the frame in progress, for loop passes that did not draw
+    def discard_frame(self):
+        self.current = None
+
+    def end_frame(self):
+        if self.current is not None:
+            self.frames.append((self.frame_start, tuple(self.current)))
+            self.current = None
+
+    # Mean milliseconds per phase over the buffered frames
+    def averages(self):
+        if not self.frames:
+            return {phase: 0.0 for phase in self.phases}
+        totals = [0] * len(self.phases)
+        for _, durations in self.frames:
+            for i, duration in enumerate(durations):
+                totals[i] += duration
+        return {phase: totals[i] / len(self.frames) / 1e6 for i, phase in enumerate(self.phases)}
+
+    def export_csv(self, path):
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame_start_ns'] + [f'{phase}_ns' for phase in self.phases])
+            for start, durations in self.frames:
+                writer.writerow([start, *durations])
+
+    # Chrome trace-event format, viewable in chrome://tracing or Perfetto
+    def export_chrome_trace(self, path):
+        events = []
+        for start, durations in self.frames:
+            ts = start
+            for phase, duration in zip(self.phases, durations):
+                events.append({'name': phase, 'cat': 'frame', 'ph': 'X', 'pid': 1, 'tid': 1,
+                               'ts': ts / 1000, 'dur': duration / 1000})
+                ts += duration
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+# Wall-clock checkpoints from process start to the first frame, for --startup-profile
+class StartupTimer:
+    def __init__(self, budget_ms):
+        self.budget_ms = budget_ms
+        self.started = time.perf_counter()
+        self.last = self.started
+        self.steps = []
+
+    def mark(self, step):
+        now = time.perf_counter()
+        self.steps.append((step, (now - self.last) * 1000))
+        self.last = now
+
+    def total_ms(self):
+        return (self.last - self.started) * 1000
+
+    def report(self):
+        lines = [f"{step:<24}{ms:8.1f} ms" for step, ms in self.steps]
+        total = self.total_ms()
+        verdict = 'within' if total <= self.budget_ms else 'OVER'
+        lines.append(f"{'total':<24}{total:8.1f} ms ({verdict} the {self.budget_ms} ms budget)")
+        return '\n'.join(lines)
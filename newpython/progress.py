@@ -0,0 +1,197 @@
+import argparse
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS SESSIONS(id TEXT PRIMARY KEY, username TEXT NOT NULL, started REAL NOT NULL, ended REAL)',
+    'CREATE TABLE IF NOT EXISTS MERGES(session_id TEXT NOT NULL, username TEXT NOT NULL, time REAL NOT NULL, '
+    'elements TEXT NOT NULL, compound TEXT, copies INTEGER NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS merges_username ON MERGES(username, time)',
+    # One row per player and compound: the first time they made it
+    'CREATE TABLE IF NOT EXISTS DISCOVERIES(username TEXT NOT NULL, formula TEXT NOT NULL, session_id TEXT NOT NULL, '
+    'time REAL NOT NULL, seconds REAL NOT NULL, PRIMARY KEY(username, formula))',
+    'CREATE INDEX IF NOT EXISTS discoveries_formula ON DISCOVERIES(formula, seconds)',
+    # Running totals kept next to the raw rows, so the leaderboard is an index
+    # scan instead of a GROUP BY over every merge ever made
+    'CREATE TABLE IF NOT EXISTS PLAYERS(username TEXT PRIMARY KEY, discoveries INTEGER NOT NULL DEFAULT 0, '
+    'merges INTEGER NOT NULL DEFAULT 0, last_discovery REAL)',
+    'CREATE INDEX IF NOT EXISTS players_rank ON PLAYERS(discoveries DESC, last_discovery)',
+)
+
+INSERT_SESSION = 'INSERT OR IGNORE INTO SESSIONS(id, username, started) VALUES(?, ?, ?)'
+INSERT_PLAYER = 'INSERT OR IGNORE INTO PLAYERS(username) VALUES(?)'
+END_SESSION = 'UPDATE SESSIONS SET ended=? WHERE id=?'
+INSERT_MERGE = 'INSERT INTO MERGES(session_id, username, time, elements, compound, copies) VALUES(?, ?, ?, ?, ?, ?)'
+COUNT_MERGE = 'UPDATE PLAYERS SET merges=merges + 1 WHERE username=?'
+INSERT_DISCOVERY = ('INSERT OR IGNORE INTO DISCOVERIES(username, formula, session_id, time, seconds) '
+                    'VALUES(?, ?, ?, ?, ?)')
+COUNT_DISCOVERIES = ('UPDATE PLAYERS SET discoveries=(SELECT COUNT(*) FROM DISCOVERIES WHERE username=?), '
+                     'last_discovery=? WHERE username=?')
+SELECT_DISCOVERED = 'SELECT formula FROM DISCOVERIES WHERE username=?'
+SELECT_LEADERBOARD = ('SELECT username, discoveries, merges FROM PLAYERS '
+                      'ORDER BY discoveries DESC, last_discovery LIMIT ?')
+SELECT_FASTEST = 'SELECT username, seconds FROM DISCOVERIES WHERE formula=? ORDER BY seconds LIMIT ?'
+
+
+# Applies queued writes on its own thread. Whatever has queued up by the time
+# the thread gets to it (up to batch_size statements, waiting at most
+# flush_interval for more) is committed as one transaction, so a burst of
+# merges costs one fsync and the game never waits on the disk.
+class BatchWriter:
+    def __init__(self, path, batch_size=500, flush_interval=0.25, busy_timeout=5.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.busy_timeout = busy_timeout
+        self.queue = queue.Queue()
+        self.batches = 0
+        self.statements = 0
+        self.stopping = object()
+        self.thread = threading.Thread(target=self.run, name='progress-writer', daemon=True)
+        self.thread.start()
+
+    def write(self, sql, params):
+        self.queue.put((sql, params))
+
+    def run(self):
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        stopping = False
+        while not stopping:
+            item = self.queue.get()
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is self.stopping:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self.queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if batch:
+                self.flush(conn, batch)
+        conn.close()
+
+    def flush(self, conn, batch):
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            for sql, params in batch:
+                conn.execute(sql, params)
+            conn.execute('COMMIT')
+        except sqlite3.Error as error:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            # Progress is nice to have; losing a batch must not take the game down
+            print(f"Could not save progress: {error}")
+            return
+        self.batches += 1
+        self.statements += len(batch)
+
+    # Writes everything still queued, then stops the thread
+    def close(self):
+        self.queue.put(self.stopping)
+        self.thread.join()
+
+
+# Sessions, merge attempts and discoveries for every player, in the same SQLite
+# file as the users. Writes go through a BatchWriter; reads use their own
+# connection, which WAL mode never makes wait for the writer.
+class ProgressStore:
+    def __init__(self, path='user.db', busy_timeout=5.0):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=busy_timeout, check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('BEGIN IMMEDIATE')
+        for statement in SCHEMA:
+            self.conn.execute(statement)
+        self.conn.execute('COMMIT')
+        self.lock = threading.Lock()
+        self.writer = BatchWriter(path, busy_timeout=busy_timeout)
+
+    def discovered(self, username):
+        with self.lock:
+            return {row[0] for row in self.conn.execute(SELECT_DISCOVERED, (username,))}
+
+    # Top players by compounds discovered; ties go to whoever got there first
+    def leaderboard(self, limit=10):
+        with self.lock:
+            return self.conn.execute(SELECT_LEADERBOARD, (limit,)).fetchall()
+
+    # Quickest players to discover a compound, in seconds into their session
+    def fastest(self, formula, limit=10):
+        with self.lock:
+            return self.conn.execute(SELECT_FASTEST, (formula, limit)).fetchall()
+
+    def start_session(self, session):
+        self.writer.write(INSERT_PLAYER, (session.username,))
+        self.writer.write(INSERT_SESSION, (session.id, session.username, session.login_time))
+
+    def end_session(self, session):
+        self.writer.write(END_SESSION, (time.time(), session.id))
+
+    def record_merge(self, session, counts, compound, copies, now):
+        elements = ' '.join(f'{symbol}{count}' for symbol, count in sorted(counts.items()))
+        self.writer.write(INSERT_MERGE, (session.id, session.username, now, elements, compound, copies))
+        self.writer.write(COUNT_MERGE, (session.username,))
+
+    def record_discovery(self, session, formula, now):
+        self.writer.write(INSERT_DISCOVERY, (session.username, formula, session.id, now, now - session.login_time))
+        self.writer.write(COUNT_DISCOVERIES, (session.username, now, session.username))
+
+    def close(self):
+        self.writer.close()
+        self.conn.close()
+
+
+# One player's progress while the game runs. Knows what they have already
+# discovered, so telling a new discovery apart needs no database round trip.
+class PlayerProgress:
+    def __init__(self, store, session):
+        self.store = store
+        self.session = session
+        self.known = store.discovered(session.username)
+        self.merges = 0
+        store.start_session(session)
+
+    # Records a merge attempt; returns True if it made a compound for the first time
+    def merge(self, counts, compound, copies=1):
+        now = time.time()
+        self.merges += 1
+        self.store.record_merge(self.session, counts, compound, copies, now)
+        if compound is None or compound in self.known:
+            return False
+        self.known.add(compound)
+        self.store.record_discovery(self.session, compound, now)
+        return True
+
+    def finish(self):
+        self.store.end_session(self.session)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Show the periodic table leaderboard')
+    parser.add_argument('--db', default='user.db', help='SQLite database shared with the login window')
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--compound', help='show the fastest discoverers of this formula instead')
+    args = parser.parse_args()
+    store = ProgressStore(args.db)
+    try:
+        if args.compound:
+            for rank, (username, seconds) in enumerate(store.fastest(args.compound, args.limit), 1):
+                print(f"{rank:3}. {username:<24}{seconds:10.1f} s")
+        else:
+            for rank, (username, discoveries, merges) in enumerate(store.leaderboard(args.limit), 1):
+                print(f"{rank:3}. {username:<24}{discoveries:5} discovered {merges:7} merges")
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
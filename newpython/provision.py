@@ -0,0 +1,142 @@
+import argparse
+import csv
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from authworker import bcrypt_rounds, hash_password, hash_rounds
+from userstore import UserStore
+
+
+# Prints how far a long job has got, at most every interval seconds, on one line
+class ProgressReport:
+    def __init__(self, total, label, interval=0.5, stream=sys.stderr):
+        self.total = total
+        self.label = label
+        self.interval = interval
+        self.stream = stream
+        self.done = 0
+        self.started = time.perf_counter()
+        self.last_report = self.started
+
+    def rate(self):
+        seconds = time.perf_counter() - self.started
+        return self.done / seconds if seconds > 0 else 0.0
+
+    def advance(self, count=1):
+        self.done += count
+        now = time.perf_counter()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.stream.write(f"\r{self.label}: {self.done}/{self.total} ({self.rate():.0f} users/s)")
+            self.stream.flush()
+
+    def finish(self):
+        seconds = time.perf_counter() - self.started
+        self.stream.write(f"\r{self.label}: {self.done}/{self.total} in {seconds:.1f} s ({self.rate():.0f} users/s)\n")
+        self.stream.flush()
+
+
+# (username, password) rows of a CSV file with username and password columns.
+# Blank rows are dropped and a username repeated in the file keeps its first row;
+# returns the rows and how many were skipped.
+def read_users(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        missing = {'username', 'password'} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path} has no {' or '.join(sorted(missing))} column")
+        users = {}
+        skipped = 0
+        for row in reader:
+            username = (row['username'] or '').strip()
+            password = row['password'] or ''
+            if not username or not password or username in users:
+                skipped += 1
+                continue
+            users[username] = password
+    return list(users.items()), skipped
+
+
+# Hashes every password at the PERIODIC_BCRYPT_ROUNDS cost on a pool of
+# processes, one per core by default, and yields (username, hash) in the order
+# given. Hashes arrive while later ones are still being computed, so the caller
+# can write them to the database meanwhile. There is no per-import cost: logins
+# would re-hash any other cost back to this one (see needs_rehash()).
+def hash_users(users, workers=None):
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        passwords = (password for _, password in users)
+        hashes = pool.map(hash_password, passwords, chunksize=8)
+        for (username, _), hashed in zip(users, hashes):
+            yield username, hashed
+
+
+# Adds the users from a CSV file. Users that already exist are skipped before
+# hashing, unless update is set, in which case their password is replaced.
+def import_csv(store, path, workers=None, batch_size=1000, update=False):
+    users, skipped = read_users(path)
+    existing = store.usernames()
+    new_users = [user for user in users if user[0] not in existing]
+    updates = [user for user in users if user[0] in existing] if update else []
+    print(f"{len(users)} users in {path}: {len(new_users)} new, {len(users) - len(new_users)} existing, "
+          f"{skipped} rows skipped")
+    added = updated = 0
+    if new_users:
+        progress = ProgressReport(len(new_users), 'Imported')
+        added = store.import_users(hash_users(new_users, workers), batch_size, progress.advance)
+        progress.finish()
+    if updates:
+        progress = ProgressReport(len(updates), 'Updated')
+        updated = store.update_passwords(hash_users(updates, workers), batch_size, progress.advance)
+        progress.finish()
+    return added, updated
+
+
+# How many stored hashes use each cost factor
+def hash_costs(store):
+    costs = Counter()
+    for hashed in store.password_hashes().values():
+        if isinstance(hashed, str):
+            hashed = hashed.encode('utf-8')
+        costs[hash_rounds(hashed)] += 1
+    return costs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Provision periodic table users in bulk. Passwords are hashed '
+                                                 'at the bcrypt cost set by PERIODIC_BCRYPT_ROUNDS '
+                                                 f'(currently {bcrypt_rounds}).')
+    parser.add_argument('--db', default='user.db', help='SQLite database shared with the login window')
+    commands = parser.add_subparsers(dest='command', required=True)
+    importer = commands.add_parser('import', help='add users from a CSV file with username and password columns')
+    importer.add_argument('csv')
+    importer.add_argument('--workers', type=int, help='hashing processes (default: one per CPU)')
+    importer.add_argument('--batch-size', type=int, default=1000, help='users per transaction')
+    importer.add_argument('--update', action='store_true',
+                          help='also set the password of users that already exist, hashed at the current cost')
+    commands.add_parser('status', help='count users by bcrypt cost factor')
+    args = parser.parse_args()
+
+    store = UserStore(args.db)
+    try:
+        if args.command == 'import':
+            try:
+                added, updated = import_csv(store, args.csv, args.workers, args.batch_size, args.update)
+            except (OSError, ValueError) as error:
+                sys.exit(f"Cannot import: {error}")
+            print(f"Added {added} users" + (f", updated {updated}" if args.update else ""))
+        else:
+            costs = hash_costs(store)
+            for rounds, count in sorted(costs.items()):
+                print(f"cost {rounds:2}: {count} users")
+            outdated = sum(count for rounds, count in costs.items() if rounds != bcrypt_rounds)
+            # Hashes cannot be converted without the password; logins upgrade them (see needs_rehash())
+            print(f"{outdated} users will be re-hashed at cost {bcrypt_rounds} (PERIODIC_BCRYPT_ROUNDS) "
+                  f"when they next log in")
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+import weakref
+
+import pygame
+
+try:
+    from pygame._sdl2.video import Renderer, Texture, Window
+except ImportError:
+    Renderer = Texture = Window = None
+
+# SDL_BLENDMODE_NONE / SDL_BLENDMODE_BLEND
+blend_none = 0
+blend_alpha = 1
+
+
+# The classic backend: everything is blitted by the CPU onto the
+# pygame.display surface and only the changed rects are pushed to the window
+class SurfaceRenderer:
+    name = 'cpu'
+    full_redraw = False  # The display surface keeps last frame's pixels
+
+    def __init__(self, size, title):
+        self.canvas = pygame.display.set_mode(size, pygame.RESIZABLE)
+        pygame.display.set_caption(title)
+
+    def set_title(self, title):
+        pygame.display.set_caption(title)
+
+    # Puts the background back under the rects drawn over last frame
+    def restore(self, background, rects):
+        for rect in rects:
+            self.canvas.blit(background, rect, rect)
+
+    def present(self, rects):
+        pygame.display.update(rects)
+
+    # Follows the window after a resize; SDL2 resizes the display surface
+    # itself, older drivers need set_mode() again
+    def resize(self, size):
+        self.canvas = pygame.display.get_surface()
+        if self.canvas.get_size() != tuple(size):
+            self.canvas = pygame.display.set_mode(size, pygame.RESIZABLE)
+        return self.canvas.get_size()
+
+    def convert(self, surface):
+        return surface.convert()
+
+
+# GPU backend on SDL2's Renderer. Surfaces handed to blit() are uploaded to a
+# texture the first time they are seen and drawn as textured quads from then
+# on; since cached text, the tile atlas and the background are long-lived
+# surfaces, a frame is almost entirely texture draws. software=True asks SDL
+# for its software renderer, which works without a GPU (or a display, with the
+# dummy video driver).
+class TextureRenderer:
+    name = 'gpu'
+    full_redraw = True  # See restore()
+
+    def __init__(self, size, title, software=False, vsync=False):
+        if Renderer is None:
+            raise pygame.error("pygame._sdl2 is not available in this pygame build")
+        self.window = Window(title, size, resizable=True)
+        self.renderer = Renderer(self.window, accelerated=0 if software else -1, vsync=vsync)
+        # Keyed on the surface itself, so a texture goes when its surface does
+        self.textures = weakref.WeakKeyDictionary()
+        self.canvas = self
+        self.uploads = 0
+
+    def set_title(self, title):
+        self.window.title = title
+
+    def texture(self, surface):
+        texture = self.textures.get(surface)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, surface)
+            self.textures[surface] = texture
+            self.uploads += 1
+        return texture
+
+    # Surface-compatible drawing so the game's draw code runs unchanged
+    def blit(self, source, dest, area=None, special_flags=0):
+        texture = self.texture(source)
+        if area is None:
+            area = source.get_rect()
+        else:
+            area = pygame.Rect(area).clip(source.get_rect())
+        dest_rect = pygame.Rect(dest[0], dest[1], area.width, area.height)
+        alpha = source.get_alpha()
+        texture.alpha = 255 if alpha is None else alpha
+        if alpha is not None or source.get_flags() & pygame.SRCALPHA:
+            texture.blend_mode = blend_alpha
+        else:
+            texture.blend_mode = blend_none
+        texture.draw(srcrect=area, dstrect=dest_rect)
+        return dest_rect.clip(self.get_rect())
+
+    def blits(self, blit_sequence, doreturn=True):
+        rects = [self.blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+    def get_size(self):
+        return self.renderer.get_viewport().size
+
+    def get_rect(self):
+        return pygame.Rect((0, 0), self.get_size())
+
+    # The back buffer is undefined after present(), so every frame starts from
+    # the whole background; it is a single texture, so that is one quad
+    def restore(self, background, rects):
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        self.blit(background, (0, 0))
+
+    def present(self, rects):
+        self.renderer.present()
+
+    def resize(self, size):
+        return self.get_size()
+
+    # Textures are converted by SDL on upload
+    def convert(self, surface):
+        return surface
+
+
+# The renderer named by --renderer, falling back to the CPU one if the GPU
+# backend cannot start
+def create_renderer(name, size, title, software=False, vsync=False):
+    if name == 'gpu':
+        try:
+            return TextureRenderer(size, title, software=software, vsync=vsync)
+        except pygame.error as error:
+            print(f"GPU renderer unavailable, using the CPU renderer: {error}")
+    return SurfaceRenderer(size, title)
@@ -0,0 +1,70 @@
+import time
+
+import pygame
+
+
+# Keeps only the last of each run of consecutive MOUSEMOTION events; clicks in
+# between keep their own positions, so nothing but intermediate hovers is lost
+def coalesce_motion(events):
+    coalesced = []
+    for event in events:
+        if event.type == pygame.MOUSEMOTION and coalesced and coalesced[-1].type == pygame.MOUSEMOTION:
+            coalesced[-1] = event
+        else:
+            coalesced.append(event)
+    return coalesced
+
+
+# Drives the main loop. While something is changing it runs at the frame rate
+# cap; when nothing is, it blocks in pygame.event.wait() instead of spinning,
+# so an idle kiosk uses no CPU.
+class FrameScheduler:
+    def __init__(self, frame_rate=60, low_power_frame_rate=20, low_power=False, idle_timeout_ms=1000):
+        self.clock = pygame.time.Clock()
+        self.normal_frame_rate = frame_rate
+        self.low_power_frame_rate = low_power_frame_rate
+        self.low_power = low_power
+        self.idle_timeout_ms = idle_timeout_ms
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+        self.motion_coalesced = 0
+        self.idle_ms = 0.0
+
+    def frame_rate(self):
+        return self.low_power_frame_rate if self.low_power else self.normal_frame_rate
+
+    # Events for the next pass of the loop. busy says whether the game has
+    # anything to draw; if not and no input is queued, this blocks until input
+    # arrives or idle_timeout_ms passes.
+    def next_events(self, busy):
+        events = pygame.event.get()
+        if not events and not busy:
+            started = time.perf_counter()
+            event = pygame.event.wait(self.idle_timeout_ms)
+            self.idle_ms += (time.perf_counter() - started) * 1000
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events += pygame.event.get()
+        coalesced = coalesce_motion(events)
+        self.motion_coalesced += len(events) - len(coalesced)
+        return coalesced
+
+    def frame_done(self, drawn):
+        if drawn:
+            self.frames_drawn += 1
+        else:
+            self.frames_skipped += 1
+
+    # Sleeps to honour the frame rate cap; returns milliseconds since the last tick
+    def tick(self):
+        return self.clock.tick(self.frame_rate())
+
+    def get_fps(self):
+        return self.clock.get_fps()
+
+    def stats(self):
+        return {
+            'frames_drawn': self.frames_drawn,
+            'frames_skipped': self.frames_skipped,
+            'motion_coalesced': self.motion_coalesced,
+            'idle_ms': round(self.idle_ms),
+        }
@@ -0,0 +1,240 @@
+import argparse
+import asyncio
+import functools
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+
+from authworker import check_password, hash_password, needs_rehash
+from backends import load_local_data
+from compound_index import CompoundIndex
+from userstore import UserStore
+
+default_port = 8765
+# Largest request body accepted; merges, logins and registrations are far smaller
+max_body_size = 64 * 1024
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message=None):
+        super().__init__(message or status.phrase)
+        self.status = status
+
+
+def json_bytes(data):
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+# A fixed JSON body with its ETag, built once
+class CachedResponse:
+    def __init__(self, data):
+        self.body = json_bytes(data)
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest() + '"'
+
+
+# Shared data and auth backend for classroom clients, as JSON over HTTP/1.1.
+#
+#   GET  /elements, /elements/<symbol>, /compounds
+#   POST /merge     {"elements": ["H", "H", "O"]} or {"counts": {"H": 2, "O": 1}}
+#   POST /login     {"username": ..., "password": ...} -> {"result": "ok" | "no_user" | "bad_password"}
+#   POST /register  {"username": ..., "password": ...} -> {"result": "ok" | "exists"}
+#
+# Connections are kept alive between requests. The data endpoints are served
+# from pre-encoded bodies (with ETags) and merge results from an LRU cache;
+# bcrypt runs in a process pool so hashing never holds up the event loop, and
+# SQLite calls run on a small thread pool.
+class PeriodicServer:
+    def __init__(self, db_path='user.db', hash_workers=None, idle_timeout=30.0, merge_cache_size=4096):
+        self.elements, self.compounds = load_local_data()
+        self.index = CompoundIndex(self.compounds)
+        self.store = UserStore(db_path)
+        self.hash_pool = ProcessPoolExecutor(max_workers=hash_workers or os.cpu_count())
+        self.db_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='db')
+        self.idle_timeout = idle_timeout
+        self.requests = 0
+        self.rehash_tasks = set()  # Password upgrades still running; see login()
+
+        self.cached = {
+            '/elements': CachedResponse({symbol: dict(data) for symbol, data in self.elements.items()}),
+            '/compounds': CachedResponse({formula: dict(data) for formula, data in self.compounds.items()}),
+        }
+        for symbol, data in self.elements.items():
+            self.cached[f'/elements/{symbol}'] = CachedResponse(dict(data))
+        self.merge_body = functools.lru_cache(maxsize=merge_cache_size)(self.merge_body)
+
+    async def serve(self, host='127.0.0.1', port=default_port):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def run_in(self, pool, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(pool, function, *args)
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self.respond(writer, HTTPStatus.BAD_REQUEST, json_bytes({'error': 'bad request line'}))
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = headers.get('content-length', '0')
+                if not length.isdigit():
+                    # The body cannot be skipped without its length, so the connection ends here
+                    await self.respond(writer, HTTPStatus.BAD_REQUEST, json_bytes({'error': 'bad Content-Length'}))
+                    break
+                if int(length) > max_body_size:
+                    await self.respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                       json_bytes({'error': f'bodies are limited to {max_body_size} bytes'}))
+                    break
+                body = await reader.readexactly(int(length))
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+
+                self.requests += 1
+                try:
+                    status, payload, extra = await self.dispatch(method, target.split('?')[0], headers, body)
+                except HTTPError as error:
+                    status, payload, extra = error.status, json_bytes({'error': str(error)}), {}
+                except Exception as error:
+                    print(f"Error handling {method} {target}: {error!r}")
+                    status, payload, extra = HTTPStatus.INTERNAL_SERVER_ERROR, json_bytes({'error': 'internal error'}), {}
+                await self.respond(writer, status, payload, extra, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, payload, extra=None, keep_alive=False):
+        head = [f'HTTP/1.1 {status.value} {status.phrase}',
+                'Content-Type: application/json',
+                f'Content-Length: {len(payload)}',
+                'Connection: ' + ('keep-alive' if keep_alive else 'close')]
+        head += [f'{name}: {value}' for name, value in (extra or {}).items()]
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + payload)
+        await writer.drain()
+
+    async def dispatch(self, method, path, headers, body):
+        cached = self.cached.get(path)
+        if cached is not None:
+            if method != 'GET':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            extra = {'ETag': cached.etag, 'Cache-Control': 'max-age=3600'}
+            if headers.get('if-none-match') == cached.etag:
+                return HTTPStatus.NOT_MODIFIED, b'', extra
+            return HTTPStatus.OK, cached.body, extra
+
+        handler = {'/merge': self.merge, '/login': self.login, '/register': self.register}.get(path)
+        if handler is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND)
+        if method != 'POST':
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+        try:
+            request = json.loads(body or b'{}')
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, 'body is not JSON')
+        if not isinstance(request, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, 'body must be a JSON object')
+        return HTTPStatus.OK, await handler(request), {}
+
+    async def merge(self, request):
+        if 'counts' in request:
+            counts = request['counts']
+            if not isinstance(counts, dict) or not all(isinstance(n, int) and n > 0 for n in counts.values()):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, 'counts must map symbols to positive integers')
+        else:
+            tiles = request.get('elements')
+            if not isinstance(tiles, list) or not all(isinstance(symbol, str) for symbol in tiles):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, 'elements must be a list of symbols')
+            counts = {}
+            for symbol in tiles:
+                counts[symbol] = counts.get(symbol, 0) + 1
+        return self.merge_body(tuple(sorted(counts.items())))
+
+    # Cached per element multiset (see __init__)
+    def merge_body(self, key):
+        counts = dict(key)
+        compound, copies = self.index.react(counts)
+        return json_bytes({
+            'compound': compound,
+            'name': self.compounds[compound]['name'] if compound else None,
+            'copies': copies,
+            'possible': len(self.index.reachable(counts)),
+        })
+
+    def credentials(self, request):
+        username = request.get('username')
+        password = request.get('password')
+        if not isinstance(username, str) or not isinstance(password, str) or not username or not password:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, 'username and password are required')
+        return username, password
+
+    async def login(self, request):
+        username, password = self.credentials(request)
+        hashed_password = await self.run_in(self.db_pool, self.store.get_password_hash, username)
+        if not hashed_password:
+            result = 'no_user'
+        elif await self.run_in(self.hash_pool, check_password, password, hashed_password):
+            result = 'ok'
+            if needs_rehash(hashed_password):
+                # Upgraded after the response, so the login is not held up by a second hash
+                task = asyncio.get_running_loop().create_task(self.rehash(username, password))
+                self.rehash_tasks.add(task)
+                task.add_done_callback(self.rehash_tasks.discard)
+        else:
+            result = 'bad_password'
+        return json_bytes({'result': result})
+
+    async def rehash(self, username, password):
+        hashed = await self.run_in(self.hash_pool, hash_password, password)
+        await self.run_in(self.db_pool, self.store.update_passwords, [(username, hashed)])
+
+    async def register(self, request):
+        username, password = self.credentials(request)
+        if await self.run_in(self.db_pool, self.store.user_exists, username):
+            return json_bytes({'result': 'exists'})
+        hashed = await self.run_in(self.hash_pool, hash_password, password)
+        added = await self.run_in(self.db_pool, self.store.add_user, username, hashed)
+        return json_bytes({'result': 'ok' if added else 'exists'})
+
+    def close(self):
+        self.hash_pool.shutdown()
+        self.db_pool.shutdown()
+        self.store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the periodic table data and logins to classroom clients')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on (0.0.0.0 for the whole network)')
+    parser.add_argument('--port', type=int, default=default_port)
+    parser.add_argument('--db', default='user.db', help='SQLite user database')
+    parser.add_argument('--hash-workers', type=int, help='bcrypt processes (default: one per CPU)')
+    args = parser.parse_args()
+    server = PeriodicServer(args.db, args.hash_workers)
+    print(f"Serving on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
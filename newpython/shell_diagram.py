@@ -0,0 +1,126 @@
+import math
+
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+dot_radius = 2
+dot_color = (255, 255, 255)
+
+
+# Radius and angle of every electron dot for a width x height panel. Radii are
+# whole pixels and angles evenly spaced per shell, as the diagram has always been drawn
+def shell_polar(shells, width, height):
+    radii = []
+    angles = []
+    for i, electrons in enumerate(shells):
+        if not electrons:
+            continue
+        radius = (i + 1) * (min(width, height) // (2 * len(shells)))
+        angle_step = 360 / electrons
+        for j in range(electrons):
+            radii.append(radius)
+            angles.append(math.radians(j * angle_step))
+    return radii, angles
+
+
+# Offsets of every dot from the panel centre, truncated to whole pixels
+def shell_dot_offsets(shells, width, height):
+    radii, angles = shell_polar(shells, width, height)
+    if numpy is not None and radii:
+        radii = numpy.array(radii, dtype=float)
+        angles = numpy.array(angles)
+        xs = (radii * numpy.cos(angles)).astype(int)
+        ys = (radii * numpy.sin(angles)).astype(int)
+        return tuple(zip(xs.tolist(), ys.tolist()))
+    return tuple((int(r * math.cos(a)), int(r * math.sin(a))) for r, a in zip(radii, angles))
+
+
+# Per-dot data for the animated diagram: each shell's dots as (radius, cos, sin)
+# columns plus the shell each dot belongs to, so a frame only needs one cos/sin
+# per shell instead of one per dot
+class ShellRotation:
+    def __init__(self, shells, width, height):
+        radii, angles = shell_polar(shells, width, height)
+        self.shell_of_dot = [i for i, electrons in enumerate(shells) if electrons for _ in range(electrons)]
+        self.shell_count = len(shells)
+        if numpy is not None and radii:
+            self.radii = numpy.array(radii, dtype=float)
+            self.cos = numpy.cos(angles)
+            self.sin = numpy.sin(angles)
+            self.shell_of_dot = numpy.array(self.shell_of_dot)
+        else:
+            self.radii = radii
+            self.cos = [math.cos(a) for a in angles]
+            self.sin = [math.sin(a) for a in angles]
+
+    # Inner shells turn faster; phase is in radians for the innermost shell
+    def offsets(self, phase):
+        turns = [phase / (i + 1) for i in range(self.shell_count)]
+        if numpy is not None and isinstance(self.radii, numpy.ndarray):
+            turns = numpy.array(turns)
+            turn_cos = numpy.cos(turns)[self.shell_of_dot]
+            turn_sin = numpy.sin(turns)[self.shell_of_dot]
+            xs = (self.radii * (self.cos * turn_cos - self.sin * turn_sin)).astype(int)
+            ys = (self.radii * (self.sin * turn_cos + self.cos * turn_sin)).astype(int)
+            return zip(xs.tolist(), ys.tolist())
+        turn_cos = [math.cos(t) for t in turns]
+        turn_sin = [math.sin(t) for t in turns]
+        return [(int(r * (c * turn_cos[i] - s * turn_sin[i])), int(r * (s * turn_cos[i] + c * turn_sin[i])))
+                for r, c, s, i in zip(self.radii, self.cos, self.sin, self.shell_of_dot)]
+
+
+# Ready-to-blit shell diagrams, one per element and panel size. Records carry
+# their dot offsets for the default panel size, so those are reused as is
+class ShellDiagrams:
+    def __init__(self, panel_size):
+        self.panel_size = tuple(panel_size)
+        self.surfaces = {}
+        self.rotations = {}
+        self.dot = None
+
+    def dot_image(self):
+        if self.dot is None:
+            size = dot_radius * 2 + 1
+            self.dot = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(self.dot, dot_color, (dot_radius, dot_radius), dot_radius)
+        return self.dot
+
+    def image(self, record, width, height):
+        key = (record.symbol, width, height)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            # Outer dots can overhang the panel by their radius, so pad the surface
+            pad = dot_radius + 1
+            surface = pygame.Surface((width + 2 * pad, height + 2 * pad), pygame.SRCALPHA)
+            center_x, center_y = pad + width / 2, pad + height / 2
+            if (width, height) == self.panel_size:
+                dots = record.shell_dots
+            else:
+                dots = shell_dot_offsets(record.shells, width, height)
+            for dx, dy in dots:
+                pygame.draw.circle(surface, dot_color, (center_x + dx, center_y + dy), dot_radius)
+            self.surfaces[key] = surface
+        return surface
+
+    # One frame of the animated diagram, padded like image(). A new surface
+    # each time, so sprites and texture caches see that it changed.
+    def rotating_image(self, record, width, height, phase):
+        pad = dot_radius + 1
+        surface = pygame.Surface((width + 2 * pad, height + 2 * pad), pygame.SRCALPHA)
+        self.draw_rotating(surface, record, pygame.Rect(pad, pad, width, height), phase)
+        return surface
+
+    def draw_rotating(self, target, record, rect, phase):
+        key = (record.symbol, rect.width, rect.height)
+        rotation = self.rotations.get(key)
+        if rotation is None:
+            rotation = self.rotations[key] = ShellRotation(record.shells, rect.width, rect.height)
+        dot = self.dot_image()
+        center_x = rect.x + rect.width // 2 - dot_radius
+        center_y = rect.y + rect.height // 2 - dot_radius
+        target.blits([(dot, (center_x + dx, center_y + dy)) for dx, dy in rotation.offsets(phase)], False)
+        return rect.inflate(2 * (dot_radius + 1), 2 * (dot_radius + 1))
@@ -1,20 +1,27 @@
+import functools
 from tkinter import *
 from PIL import Image, ImageTk
 from tkinter import messagebox
-import sqlite3
-import bcrypt
-import subprocess
+from authworker import AuthWorker
+from backends import create_backend
+from launcher import GameLauncher, Session
 
-# Initialize the SQLite database
-conn = sqlite3.connect('user.db')
-cursor = conn.cursor()
-cursor.execute('CREATE TABLE IF NOT EXISTS USERS(username TEXT NOT NULL, password TEXT NOT NULL)')
+# The shared user database, or the classroom server if PERIODIC_SERVER is set
+backend = create_backend()
 
 # Initialize the main window
 window = Tk()
 window.title("Sign up and Login")
 window.geometry('1300x700+100+100')
 
+# bcrypt and database work run here so button callbacks return immediately
+auth = AuthWorker(window)
+
+# Load the game in the background while the user types; it starts after login
+launcher = GameLauncher()
+launcher.prewarm()
+session = None
+
 # Initialize position for the frame
 x = 100
 
@@ -39,51 +46,55 @@ def move_right():
     headinglabel.configure(text='Login')
     signintopframebutton.configure(text='Login', command=login_user)
 
+def set_busy(busy):
+    # Shown while bcrypt runs on the auth worker; the window keeps animating meanwhile
+    busylabel.configure(text='Please wait...' if busy else '')
+    signintopframebutton.configure(state=DISABLED if busy else NORMAL)
+    window.configure(cursor='watch' if busy else '')
+
+def auth_failed(error):
+    set_busy(False)
+    messagebox.showerror('Error', f'Something went wrong: {error}')
+
+# name and secret are what was checked, as the fields may have been edited since
+def login_done(name, secret, result):
+    global session
+    set_busy(False)
+    if result == 'ok':
+        auth.run_later(backend.upgrade_password, name, secret)
+        messagebox.showinfo('Success', 'Login Successful')
+        session = Session(name)
+        window.destroy()  # Ends mainloop; the game starts below
+    elif result == 'bad_password':
+        messagebox.showerror('Error', 'Invalid Password')
+    else:
+        messagebox.showerror('Error', 'Invalid Username')
+
 def login_user():
     if username.get() == '' or password.get() == '':
         messagebox.showwarning('Warning', 'Please fill all fields')
+    elif not auth.busy():
+        set_busy(True)
+        name, secret = username.get(), password.get()
+        auth.submit(backend.check_login, functools.partial(login_done, name, secret), auth_failed, name, secret)
+
+def register_done(result):
+    set_busy(False)
+    if result == 'exists':
+        messagebox.showwarning('Warning', 'Username already exists')
     else:
-        cursor.execute('SELECT password FROM USERS WHERE username=?', (username.get(),))
-        result_password = cursor.fetchone()
-
-        if result_password:
-            hashed_password = result_password[0]
-
-            print("Hashed password retrieved:", hashed_password)
-
-
-            if isinstance(hashed_password, str):
-                hashed_password = hashed_password.encode('utf-8')
-
-
-            print("Checking password...")
-            if bcrypt.checkpw(password.get().encode('utf-8'), hashed_password):
-                messagebox.showinfo('Success', 'Login Successful')
-                window.destroy()
-                subprocess.run(["python", "gamebasic.py"])  # Adjusted to correct script name
-            else:
-                messagebox.showerror('Error', 'Invalid Password')
-        else:
-            messagebox.showerror('Error', 'Invalid Username')
+        messagebox.showinfo('Success', 'Registration is Successful')
+        move_right()
+        username.delete(0, END)
+        password.delete(0, END)
+        window.focus()
 
 def reg_click():
     if username.get() == '' or password.get() == '':
         messagebox.showwarning('Warning', 'Please fill all fields')
-    else:
-        cursor.execute('SELECT username FROM USERS WHERE username=?', (username.get(),))
-        if cursor.fetchone() is not None:  # Check if username exists
-            messagebox.showwarning('Warning', 'Username already exists')
-            print(f"Invalid username: {username.get()}")  # Print invalid username message
-        else:
-            encode_password = password.get().encode('utf-8')  # Encode the plain password
-            hash_password = bcrypt.hashpw(encode_password, bcrypt.gensalt())  # Hash it
-            cursor.execute('INSERT INTO USERS(username, password) VALUES(?, ?)', (username.get(), hash_password))
-            conn.commit()
-            messagebox.showinfo('Success', 'Registration is Successful')
-            move_right()
-            username.delete(0, END)
-            password.delete(0, END)
-            window.focus()
+    elif not auth.busy():
+        set_busy(True)
+        auth.submit(backend.register, register_done, auth_failed, username.get(), password.get())
 
 # Main frame
 mainframe = Frame(window, bg='black', width=1300, height=630)
@@ -131,8 +142,17 @@ signintopframebutton = Button(topframe, text='Sign Up', bg='blue4', font=('Arial
                               fg='white', bd=1, command=reg_click)
 signintopframebutton.place(x=200, y=450)
 
+# Busy indicator for logins and registrations in progress
+busylabel = Label(topframe, text='', font=('Arial', 14), bg='white', fg='blue4')
+busylabel.place(x=200, y=520)
+
 # Run the application
 window.mainloop()
 
-# Close the database connection when the application closes
-conn.close()
+if session is not None:
+    launcher.launch(session)
+
+# Close the database connections when the application closes, once a password
+# upgrade queued by the login has finished
+auth.shutdown(wait=True)
+backend.close()
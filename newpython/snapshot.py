@@ -0,0 +1,208 @@
+import hashlib
+import os
+import pickle
+import re
+import sys
+import tempfile
+from collections import Counter
+
+from backends import load_data, load_local_data, server_url
+from compound_index import CompoundIndex
+from compound_search import CompoundSearch, parse_formula
+from table_geometry import (TableGeometry, base_cell_size, base_grid_padding, base_shell_panel_size,
+                            base_table_offset_x, layout_markers, periodic_table_layout)
+
+# Precompiled game data: the elements and compounds as plain dicts, the compound
+# index, the search index and the table geometry with its hit-test grid on the
+# design canvas, pickled together. It is keyed on a hash of everything it is
+# built from, so editing the data or the code of any of those structures makes
+# the next start rebuild it. periodic.dat is included as well as its source,
+# since an install may ship only a new periodic.dat (see dataset.py).
+here = os.path.dirname(os.path.abspath(__file__))
+snapshot_path = os.path.join(here, 'periodic.snapshot')
+source_files = ('periodic_data.py', 'periodic.dat', 'dataset.py', 'table_geometry.py', 'compound_index.py',
+                'compound_search.py', 'shell_diagram.py', 'snapshot.py')
+MAGIC = b'PTSN'
+VERSION = 1
+
+# Electron counts of the noble gas cores used in shorthand configurations
+noble_cores = {'He': 2, 'Ne': 10, 'Ar': 18, 'Kr': 36, 'Xe': 54, 'Rn': 86}
+subshell = re.compile(r'\[(\w+)\]|(\d)([spdfg])(\d+)')
+
+
+def source_hash():
+    digest = hashlib.sha256()
+    for name in source_files:
+        digest.update(name.encode('utf-8'))
+        try:
+            with open(os.path.join(here, name), 'rb') as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            digest.update(b'missing')
+    digest.update(repr(periodic_table_layout).encode('utf-8'))
+    return digest.hexdigest()
+
+
+# Number of electrons in a configuration such as '[Ar] 3d10 4s2', or None if
+# it cannot be read
+def config_electrons(config):
+    total = 0
+    for part in config.split():
+        match = subshell.fullmatch(part)
+        if match is None:
+            return None
+        core, _, _, count = match.groups()
+        if core:
+            if core not in noble_cores:
+                return None
+            total += noble_cores[core]
+        else:
+            total += int(count)
+    return total
+
+
+def validate_elements(elements):
+    problems = []
+    seen = {}
+    for symbol, info in elements.items():
+        number = info['atomic_number']
+        if number in seen:
+            problems.append(f"{symbol}: atomic number {number} is also used by {seen[number]}")
+        seen[number] = symbol
+        if sum(info['shells']) != number:
+            problems.append(f"{symbol}: shells {list(info['shells'])} hold {sum(info['shells'])} electrons, "
+                            f"atomic number is {number}")
+        electrons = config_electrons(info['electron_config'])
+        if electrons is None:
+            problems.append(f"{symbol}: cannot read electron configuration {info['electron_config']!r}")
+        elif electrons != number:
+            problems.append(f"{symbol}: electron configuration {info['electron_config']!r} holds {electrons} "
+                            f"electrons, atomic number is {number}")
+    return problems
+
+
+def validate_compounds(compounds, elements):
+    problems = []
+    for formula, info in compounds.items():
+        unknown = sorted(set(info['elements']) - set(elements))
+        if unknown:
+            problems.append(f"{formula}: unknown element {', '.join(unknown)}")
+        try:
+            counts = parse_formula(formula)
+        except ValueError:
+            # Names such as 'Glucose' are allowed as keys; the element list is used as is
+            continue
+        if counts != Counter(info['elements']):
+            problems.append(f"{formula}: element list {info['elements']} does not match the formula")
+    return problems
+
+
+def validate_layout(layout, elements):
+    problems = []
+    placed = Counter()
+    for row, cells in enumerate(layout):
+        for col, cell in enumerate(cells):
+            symbol = cell.lstrip(layout_markers)
+            if not symbol:
+                continue
+            if symbol not in elements:
+                problems.append(f"layout row {row + 1}, column {col + 1}: unknown element {symbol}")
+            elif symbol == cell:
+                placed[symbol] += 1
+    for symbol in elements:
+        if placed[symbol] != 1:
+            problems.append(f"{symbol}: placed {placed[symbol]} times in the layout")
+    return problems
+
+
+# Everything wrong with the dataset, as lines; an empty list means it is consistent
+def validate(elements, compounds, layout=periodic_table_layout):
+    return (validate_elements(elements) + validate_compounds(compounds, elements)
+            + validate_layout(layout, elements))
+
+
+class GameData:
+    def __init__(self, elements, compounds):
+        # Plain dicts, so the memory-mapped dataset views are not pickled
+        self.elements = {symbol: dict(elements[symbol]) for symbol in elements}
+        self.compounds = {formula: dict(compounds[formula]) for formula in compounds}
+        self.compound_index = CompoundIndex(self.compounds)
+        self.compound_search = CompoundSearch(self.compounds)
+        self.table = TableGeometry(self.elements, periodic_table_layout, base_cell_size, base_grid_padding,
+                                   base_table_offset_x, shell_panel_size=base_shell_panel_size)
+        # Kept with the data so every start can warn about them, not just the one that built it
+        self.problems = validate(self.elements, self.compounds)
+
+
+# The snapshot's GameData if it was built from the current sources, else None
+def read_snapshot(path, digest):
+    try:
+        with open(path, 'rb') as f:
+            magic, version, snapshot_digest, data = pickle.load(f)
+    except (OSError, EOFError, ValueError, TypeError, AttributeError, ImportError, pickle.UnpicklingError):
+        return None
+    if magic != MAGIC or version != VERSION or snapshot_digest != digest:
+        return None
+    return data
+
+
+def write_snapshot(path, data, digest):
+    # Write to a temporary file first so a starting game never reads a half-written
+    # file. Its name is unique, so kiosks rebuilding at once do not share it.
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((MAGIC, VERSION, digest, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(temp_path, 0o644)  # mkstemp makes it private to this user
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def build_snapshot(path=snapshot_path):
+    # Loaded before hashing, since loading may rebuild periodic.dat
+    elements, compounds = load_local_data()
+    data = GameData(elements, compounds)
+    write_snapshot(path, data, source_hash())
+    return data
+
+
+# Game data for gamebasic.py. Local data comes from the snapshot, which is
+# rebuilt if it is missing or stale; data from a classroom server is indexed
+# on the spot and never cached, since it can change between runs.
+def load_game_data(path=snapshot_path):
+    if server_url:
+        data = GameData(*load_data())
+    else:
+        data = read_snapshot(path, source_hash())
+    if data is None:
+        try:
+            data = build_snapshot(path)
+        except OSError as error:
+            # A read-only install still starts, just without the snapshot
+            print(f"Could not write {path}: {error}")
+            data = GameData(*load_local_data())
+    if data.problems:
+        print(f"The periodic table data has {len(data.problems)} problems; run python snapshot.py to list them")
+    return data
+
+
+# Validate the dataset and rebuild the snapshot: python snapshot.py [--check]
+# --check only validates. Either way the exit status is 1 if anything is wrong.
+if __name__ == '__main__':
+    # Through the module, so the snapshot refers to snapshot.GameData rather than __main__'s
+    import snapshot
+
+    if '--check' in sys.argv[1:]:
+        elements, compounds = load_local_data()
+        problems = snapshot.validate(elements, compounds)
+    else:
+        data = snapshot.build_snapshot()
+        problems = data.problems
+        print(f"Wrote {len(data.elements)} elements and {len(data.compounds)} compounds to {snapshot_path}")
+    for problem in problems:
+        print(problem)
+    if problems:
+        print(f"{len(problems)} problems")
+    sys.exit(1 if problems else 0)
@@ -0,0 +1,138 @@
+import pygame
+
+
+# One image on screen. show() only marks the sprite changed if the image or
+# its position actually differ, so re-showing the same thing every frame is free.
+class Sprite:
+    __slots__ = ('layer', 'image', 'rect', 'visible', 'changed', 'previous')
+
+    def __init__(self, layer):
+        self.layer = layer
+        self.image = None
+        self.rect = None
+        self.visible = False
+        self.changed = False
+        self.previous = None  # Where it was drawn before the first change this frame
+
+    def show(self, image, pos):
+        rect = image.get_rect(topleft=pos)
+        if self.visible and image is self.image and rect == self.rect:
+            return
+        self.mark()
+        self.image = image
+        self.rect = rect
+        self.visible = True
+
+    def hide(self):
+        if self.visible:
+            self.mark()
+            self.visible = False
+
+    # For images whose pixels or alpha changed in place
+    def touch(self):
+        if self.visible:
+            self.mark()
+
+    def mark(self):
+        if not self.changed:
+            self.changed = True
+            self.previous = self.rect if self.visible else None
+
+
+# A variable number of sprites on one layer, e.g. the tiles in the merge area.
+# show() reuses the sprites from last frame, so unchanged items cost nothing.
+class SpriteGroup:
+    def __init__(self, sprite_layer, layer):
+        self.sprite_layer = sprite_layer
+        self.layer = layer
+        self.sprites = []
+
+    # items are (image, pos) pairs; sprites left over from last frame are hidden
+    def show(self, items):
+        count = 0
+        for image, pos in items:
+            if count == len(self.sprites):
+                self.sprites.append(self.sprite_layer.add(self.layer))
+            self.sprites[count].show(image, pos)
+            count += 1
+        for sprite in self.sprites[count:]:
+            sprite.hide()
+
+    def touch(self):
+        for sprite in self.sprites:
+            sprite.touch()
+
+
+# Joins overlapping rects so no pixel is restored or redrawn twice
+def merge_rects(rects):
+    merged = []
+    for rect in rects:
+        i = 0
+        while i < len(merged):
+            if merged[i].colliderect(rect):
+                rect = rect.union(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
+
+
+# Everything drawn over the background, composited like LayeredDirty: each
+# frame only the areas where a sprite appeared, moved, changed or disappeared
+# are restored from the background, and only sprites overlapping those areas
+# are redrawn, clipped to them. The cost follows what changed, not the window
+# size. Works on any renderer from renderers.py; those that must redraw the
+# whole frame (full_redraw) get every sprite on every frame.
+class SpriteLayer:
+    def __init__(self):
+        self.sprites = []
+        self.pending = []  # Areas to repaint whatever the sprites do, e.g. after an expose
+
+    def add(self, layer):
+        sprite = Sprite(layer)
+        # Stable insert, so sprites on one layer draw in the order they were added
+        index = len(self.sprites)
+        while index and self.sprites[index - 1].layer > layer:
+            index -= 1
+        self.sprites.insert(index, sprite)
+        return sprite
+
+    def group(self, layer):
+        return SpriteGroup(self, layer)
+
+    def repaint(self, rect):
+        self.pending.append(pygame.Rect(rect))
+
+    # Composites the changes onto the renderer; returns the areas repainted,
+    # for renderer.present()
+    def draw(self, renderer, background):
+        target = renderer.canvas
+        areas = self.pending
+        self.pending = []
+        for sprite in self.sprites:
+            if sprite.changed:
+                if sprite.previous is not None:
+                    areas.append(sprite.previous)
+                if sprite.visible:
+                    areas.append(sprite.rect)
+                sprite.changed = False
+                sprite.previous = None
+        screen_rect = target.get_rect()
+        if renderer.full_redraw:
+            # The back buffer does not survive present(), so every frame is drawn whole
+            areas = [screen_rect]
+        elif not areas:
+            return []
+        else:
+            areas = [area for area in merge_rects(areas) if area.colliderect(screen_rect)]
+            areas = [area.clip(screen_rect) for area in areas]
+        renderer.restore(background, areas)
+        for sprite in self.sprites:
+            if not sprite.visible:
+                continue
+            for area in areas:
+                clip = sprite.rect.clip(area)
+                if clip:
+                    target.blit(sprite.image, clip.topleft, clip.move(-sprite.rect.x, -sprite.rect.y))
+        return areas
@@ -0,0 +1,82 @@
+import pygame
+
+from shell_diagram import shell_dot_offsets
+
+# Where each element sits on the table. '*' and '#' mark where the lanthanides
+# and actinides are taken out; '*La' and '#Ac' label their rows below and are
+# not elements themselves.
+periodic_table_layout = [
+    ['H', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', 'He'],
+    ['Li', 'Be', '', '', '', '', '', '', '', '', '', '', 'B', 'C', 'N', 'O', 'F', 'Ne'],
+    ['Na', 'Mg', '', '', '', '', '', '', '', '', '', '', 'Al', 'Si', 'P', 'S', 'Cl', 'Ar'],
+    ['K', 'Ca', 'Sc', 'Ti', 'V', 'Cr', 'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn', 'Ga', 'Ge', 'As', 'Se', 'Br', 'Kr'],
+    ['Rb', 'Sr', 'Y', 'Zr', 'Nb', 'Mo', 'Tc', 'Ru', 'Rh', 'Pd', 'Ag', 'Cd', 'In', 'Sn', 'Sb', 'Te', 'I', 'Xe'],
+    ['Cs', 'Ba', 'La', 'Hf', 'Ta', 'W', 'Re', 'Os', 'Ir', 'Pt', 'Au', 'Hg', 'Tl', 'Pb', 'Bi', 'Po', 'At', 'Rn'],
+    ['Fr', 'Ra', 'Ac', 'Rf', 'Db', 'Sg', 'Bh', 'Hs', 'Mt', 'Ds', 'Rg', 'Cn', 'Nh', 'Fl', 'Mc', 'Lv', 'Ts', 'Og'],
+    ['', '', '*', '', '', '', '', '', '', '', '', '', '', '', '', '', '', ''],
+    ['', '', '#', '', '', '', '', '', '', '', '', '', '', '', '', '', '', ''],
+    ['', '', '*La', 'Ce', 'Pr', 'Nd', 'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb', 'Lu', ''],
+    ['', '', '#Ac', 'Th', 'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm', 'Md', 'No', 'Lr', ''],
+]
+layout_markers = '*#'
+
+# Element cell size and layout on the 1280x720 design canvas, in pixels
+base_cell_size = 53  # Size of each element cell
+base_grid_padding = 4  # Padding between cells
+base_table_offset_x = 80  # Horizontal offset for the entire periodic table
+base_shell_panel_size = (180, 100)  # Size of the electron shell panel
+
+
+# One element of the table with everything the renderer needs precomputed
+class Element:
+    __slots__ = ('symbol', 'name', 'color', 'atomic_number', 'mass', 'electron_config',
+                 'shells', 'row', 'col', 'rect', 'shell_dots')
+
+    def __init__(self, symbol, info):
+        self.symbol = symbol
+        self.name = info['name']
+        self.color = tuple(info['color'])
+        self.atomic_number = info['atomic_number']
+        self.mass = info['mass']
+        self.electron_config = info['electron_config']
+        self.shells = tuple(info['shells'])
+        self.row = None
+        self.col = None
+        self.rect = None
+        self.shell_dots = ()
+
+
+# Cell rects, element records and a flat hit-test grid for one table layout
+class TableGeometry:
+    def __init__(self, elements, layout, cell_size, grid_padding, offset_x, offset_y=0, shell_panel_size=(180, 100)):
+        self.cell_size = cell_size
+        self.grid_padding = grid_padding
+        self.pitch = cell_size + grid_padding
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.rows = len(layout)
+        self.cols = max(len(row) for row in layout)
+        self.records = {symbol: Element(symbol, info) for symbol, info in elements.items()}
+        self.cells = []
+        self.grid = [None] * (self.rows * self.cols)
+        for row, elements_row in enumerate(layout):
+            for col, symbol in enumerate(elements_row):
+                element = self.records.get(symbol)
+                if element is None:
+                    continue
+                element.row = row
+                element.col = col
+                element.rect = pygame.Rect(col * self.pitch + grid_padding + offset_x,
+                                           row * self.pitch + grid_padding + offset_y,
+                                           cell_size, cell_size)
+                self.cells.append(element)
+                self.grid[row * self.cols + col] = element
+        for element in self.records.values():
+            element.shell_dots = shell_dot_offsets(element.shells, *shell_panel_size)
+
+    def element_at(self, pos):
+        col = (pos[0] - self.offset_x) // self.pitch
+        row = (pos[1] - self.offset_y) // self.pitch
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.grid[row * self.cols + col]
+        return None
@@ -0,0 +1,77 @@
+from compound_index import CompoundIndex, MergePool
+
+compounds = {
+    'H2O': {'elements': ['H', 'H', 'O'], 'name': 'Water'},
+    'H2O2': {'elements': ['H', 'H', 'O', 'O'], 'name': 'Hydrogen Peroxide'},
+    'CO2': {'elements': ['C', 'O', 'O'], 'name': 'Carbon Dioxide'},
+    'CH4': {'elements': ['C', 'H', 'H', 'H', 'H'], 'name': 'Methane'},
+    'NaCl': {'elements': ['Na', 'Cl'], 'name': 'Sodium Chloride'},
+    # An isomer of nothing above, sharing a multiset with the next entry
+    'C2H6O': {'elements': ['C', 'C', 'H', 'H', 'H', 'H', 'H', 'H', 'O'], 'name': 'Ethanol'},
+    'CH3OCH3': {'elements': ['C', 'C', 'H', 'H', 'H', 'H', 'H', 'H', 'O'], 'name': 'Dimethyl Ether'},
+}
+index = CompoundIndex(compounds)
+
+
+def test_react_exact_match_in_any_order():
+    assert index.react(['O', 'H', 'H']) == ('H2O', 1)
+    assert index.react({'Cl': 1, 'Na': 1}) == ('NaCl', 1)
+
+
+def test_react_whole_multiples():
+    assert index.react({'H': 4, 'O': 2}) == ('H2O', 2)
+    assert index.react({'C': 3, 'O': 6}) == ('CO2', 3)
+
+
+def test_react_prefers_exact_match_over_multiple():
+    # H2O2 is also 2 x HO, but HO is not a compound; H4O4 is 2 x H2O2, not 4 x HO
+    assert index.react({'H': 2, 'O': 2}) == ('H2O2', 1)
+    assert index.react({'H': 4, 'O': 4}) == ('H2O2', 2)
+
+
+def test_react_isomers_take_the_first_in_table_order():
+    assert index.react({'C': 2, 'H': 6, 'O': 1}) == ('C2H6O', 1)
+
+
+def test_react_no_compound():
+    assert index.react({'H': 3, 'O': 1}) == (None, 0)
+    assert index.react({'Xx': 1}) == (None, 0)
+    assert index.react({}) == (None, 0)
+
+
+def test_reachable():
+    assert index.reachable({}) == set(compounds)
+    assert index.reachable({'H': 2}) == {'H2O', 'H2O2', 'CH4', 'C2H6O', 'CH3OCH3'}
+    assert index.reachable({'H': 2, 'O': 2}) == {'H2O', 'H2O2', 'C2H6O', 'CH3OCH3'}
+    assert index.reachable({'C': 1, 'O': 2}) == {'CO2', 'C2H6O', 'CH3OCH3'}
+    assert index.reachable({'Na': 1, 'O': 1}) == set()
+    assert index.reachable({'Xx': 1}) == set()
+
+
+def test_reachable_agrees_with_react_on_multiples():
+    # More atoms than one copy needs can still grow into whole multiples
+    assert index.react({'Na': 2, 'Cl': 2}) == ('NaCl', 2)
+    assert index.reachable({'Na': 2, 'Cl': 2}) == {'NaCl'}
+    assert index.reachable({'H': 7}) == {'H2O', 'H2O2', 'CH4', 'C2H6O', 'CH3OCH3'}
+
+
+def test_buildable():
+    found = dict(index.buildable({'H': 5, 'O': 3, 'C': 1}))
+    assert found == {'H2O': 2, 'H2O2': 1, 'CO2': 1, 'CH4': 1}
+    assert index.buildable({'Na': 1}) == []
+
+
+def test_buildable_limit():
+    assert len(index.buildable({'H': 5, 'O': 3, 'C': 1}, limit=2)) == 2
+
+
+def test_merge_pool_counts():
+    pool = MergePool()
+    pool.add('H')
+    pool.add('O')
+    pool.add('H', 3)
+    assert dict(pool.items()) == {'H': 4, 'O': 1}
+    assert len(pool) == 5
+    assert pool.last == 'H'
+    pool.clear()
+    assert not pool and pool.last is None
@@ -0,0 +1,37 @@
+import pytest
+
+from compound_search import CompoundSearch, parse_formula
+
+
+@pytest.mark.parametrize('formula, expected', [
+    ('H2O', {'H': 2, 'O': 1}),
+    ('NaCl', {'Na': 1, 'Cl': 1}),
+    ('C2H5OH', {'C': 2, 'H': 6, 'O': 1}),
+    ('Ca(OH)2', {'Ca': 1, 'O': 2, 'H': 2}),
+    ('K4[Fe(CN)6]', {'K': 4, 'Fe': 1, 'C': 6, 'N': 6}),
+    ('CuSO4·5H2O', {'Cu': 1, 'S': 1, 'O': 9, 'H': 10}),
+    ('CaSO4.2H2O', {'Ca': 1, 'S': 1, 'O': 6, 'H': 4}),
+])
+def test_parse_formula(formula, expected):
+    assert parse_formula(formula) == expected
+
+
+@pytest.mark.parametrize('formula', ['Ca(OH', 'CaOH)2', 'h2o', 'H2O!'])
+def test_parse_formula_rejects_malformed(formula):
+    with pytest.raises(ValueError):
+        parse_formula(formula)
+
+
+def test_fuzzy_matches_a_misspelt_word_of_a_longer_name():
+    search = CompoundSearch({
+        'NaCl': {'elements': ['Na', 'Cl'], 'name': 'Sodium Chloride'},
+        'CO2': {'elements': ['C', 'O', 'O'], 'name': 'Carbon Dioxide'},
+        'HCl': {'elements': ['H', 'Cl'], 'name': 'Hydrochloric Acid'},
+        'CH4': {'elements': ['C', 'H', 'H', 'H', 'H'], 'name': 'Methane'},
+    })
+    assert search.fuzzy('sodum') == ['NaCl']
+    assert search.fuzzy('dioxde') == ['CO2']
+    assert search.fuzzy('xqzv') == []
+    assert search.search('carbn') == ['CO2']
+    assert search.search('hydrochloric acd') == ['HCl']
+    assert search.search('hydrochloric dioxde') == []
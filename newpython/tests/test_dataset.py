@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from dataset import Dataset, load_dataset, open_dataset, source_digest, write_dataset
+
+elements = {
+    'H': {'name': 'Hydrogen', 'color': (204, 255, 229), 'atomic_number': 1, 'mass': 1.008,
+          'electron_config': '1s1', 'shells': [1]},
+    'Og': {'name': 'Oganesson', 'color': (229, 204, 255), 'atomic_number': 118, 'mass': 294,
+           'electron_config': '[Rn] 7s2 5f14 6d10 7p6', 'shells': [2, 8, 18, 32, 32, 18, 8]},
+    'He': {'name': 'Hélium', 'color': (229, 204, 255), 'atomic_number': 2, 'mass': 4.003,
+           'electron_config': '1s2', 'shells': [2]},
+}
+compounds = {
+    'H2O': {'elements': ['H', 'H', 'O'], 'name': 'Water', 'uses': 'Solvent', 'properties': 'Liquid'},
+    'NaCl': {'elements': ['Na', 'Cl'], 'name': 'Salt', 'uses': '', 'properties': 'Crystalline'},
+}
+source = f"elements = {elements!r}\ncompounds = {compounds!r}\n"
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'periodic.dat')
+    write_dataset(path, elements, compounds)
+    read_elements, read_compounds = open_dataset(path)
+    # Key order is the order written, lookups go through the sorted index
+    assert list(read_elements) == ['H', 'Og', 'He']
+    assert {symbol: read_elements[symbol] for symbol in read_elements} == elements
+    assert {formula: read_compounds[formula] for formula in read_compounds} == compounds
+    assert isinstance(read_elements['Og']['mass'], int)
+    assert 'Xx' not in read_elements and 5 not in read_elements
+    with pytest.raises(KeyError):
+        read_compounds['CO2']
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'other.dat'
+    path.write_bytes(b'not a dataset at all, but long enough to have a header' * 4)
+    with pytest.raises(ValueError):
+        Dataset(str(path))
+
+
+def test_load_dataset_rebuilds_after_source_edit(tmp_path):
+    path = str(tmp_path / 'periodic.dat')
+    source_path = tmp_path / 'periodic_data.py'
+    source_path.write_text(source, encoding='utf-8')
+    assert load_dataset(path, str(source_path))[0]['H']['name'] == 'Hydrogen'
+    assert Dataset(path).source_digest == source_digest(str(source_path))
+
+    source_path.write_text(source.replace("'Hydrogen'", "'Protium'"), encoding='utf-8')
+    assert load_dataset(path, str(source_path))[0]['H']['name'] == 'Protium'
+
+
+def test_load_dataset_without_source_uses_dataset(tmp_path):
+    path = str(tmp_path / 'periodic.dat')
+    write_dataset(path, elements, compounds)
+    missing = str(tmp_path / 'missing.py')
+    assert load_dataset(path, missing)[0]['He']['name'] == 'Hélium'
+    os.remove(path)
+    with pytest.raises(FileNotFoundError):
+        load_dataset(path, missing)
@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import pygame
+
+from compound_index import MergePool
+from eventlog import EventRecorder, final_state, read_log
+
+
+def make_game():
+    merge_area = MergePool()
+    merge_area.add('H', 2)
+    merge_area.add('O')
+    return SimpleNamespace(mouse_pos=(-5, 700), merge_area=merge_area, info_area=['Name: Water'])
+
+
+def record(path, frames, game, finish=True):
+    recorder = EventRecorder(path, game, (1920, 1080))
+    for elapsed, events in frames:
+        recorder.frame(elapsed, events)
+    if finish:
+        recorder.finish(game)
+    else:
+        recorder.file.close()
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'session.ptev')
+    frames = [
+        (0, [pygame.event.Event(pygame.MOUSEMOTION, pos=(10, 20), rel=(-3, 4), buttons=(1, 0, 0), touch=False)]),
+        (16, [pygame.event.Event(pygame.FINGERDOWN, touch_id=2 ** 40, finger_id=2 ** 40 + 1, x=0.25, y=0.75,
+                                 dx=0.0, dy=-0.5, pressure=1.0),
+              pygame.event.Event(pygame.MOUSEWHEEL, which=0xFFFFFFFF, x=0, y=-1, flipped=False,
+                                 precise_x=0.0, precise_y=-1.0, touch=True)]),
+        (33, []),
+        (17, [pygame.event.Event(pygame.TEXTINPUT, text='ü' * 40000),
+              pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode='a', scancode=4,
+                                 window=object(), custom_id=2 ** 64 - 1)]),
+    ]
+    game = make_game()
+    record(path, frames, game)
+
+    log = read_log(path)
+    assert log.size == (1920, 1080)
+    assert log.mouse_pos == (-5, 700)
+    assert log.state == final_state(game)
+    assert [elapsed for elapsed, _ in log.frames] == [elapsed for elapsed, _ in frames]
+    for (_, expected), (_, actual) in zip(frames, log.frames):
+        assert [event.type for event in actual] == [event.type for event in expected]
+        for want, got in zip(expected, actual):
+            # Attributes that cannot be replayed, like window objects, are left out
+            assert got.__dict__ == {name: value for name, value in want.__dict__.items() if name != 'window'}
+
+
+def test_cut_short_log_has_no_state(tmp_path):
+    path = str(tmp_path / 'cut.ptev')
+    record(path, [(5, [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(1, 2), button=1)])], make_game(), finish=False)
+    log = read_log(path)
+    assert log.state is None
+    assert log.frames[0][1][0].pos == (1, 2)
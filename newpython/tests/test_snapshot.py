@@ -0,0 +1,62 @@
+import snapshot
+from snapshot import read_snapshot, validate_compounds, validate_elements, validate_layout, write_snapshot
+
+elements = {
+    'H': {'atomic_number': 1, 'electron_config': '1s1', 'shells': [1]},
+    'O': {'atomic_number': 8, 'electron_config': '[He] 2s2 2p4', 'shells': [2, 6]},
+    'Na': {'atomic_number': 11, 'electron_config': '[Ne] 3s1', 'shells': [2, 8, 1]},
+}
+
+
+def test_consistent_elements():
+    assert validate_elements(elements) == []
+
+
+def test_bad_shell_sum():
+    bad = dict(elements, O=dict(elements['O'], shells=[2, 7]))
+    assert validate_elements(bad) == ["O: shells [2, 7] hold 9 electrons, atomic number is 8"]
+
+
+def test_bad_configuration():
+    bad = dict(elements, Na=dict(elements['Na'], electron_config='[Zz] 3s1'))
+    assert validate_elements(bad) == ["Na: cannot read electron configuration '[Zz] 3s1'"]
+
+
+def test_unknown_compound_element():
+    compounds = {'NaCl': {'elements': ['Na', 'Cl']}, 'H2O': {'elements': ['H', 'H', 'O']}}
+    assert validate_compounds(compounds, elements) == ["NaCl: unknown element Cl"]
+
+
+def test_element_list_must_match_formula():
+    compounds = {'H2O': {'elements': ['H', 'O']}, 'Water': {'elements': ['H', 'O']}}
+    assert validate_compounds(compounds, elements) == ["H2O: element list ['H', 'O'] does not match the formula"]
+
+
+def test_layout_symbol_placed_twice():
+    layout = [['H', '', 'O'], ['Na', '*', 'H']]
+    assert validate_layout(layout, elements) == ["H: placed 2 times in the layout"]
+
+
+def test_layout_unknown_and_missing_symbols():
+    layout = [['H', 'Xx'], ['*Na', 'O']]
+    assert validate_layout(layout, elements) == ["layout row 1, column 2: unknown element Xx",
+                                                 "Na: placed 0 times in the layout"]
+
+
+def test_read_snapshot_rejects_stale_digest(tmp_path):
+    path = str(tmp_path / 'periodic.snapshot')
+    write_snapshot(path, {'data': 1}, 'current')
+    assert read_snapshot(path, 'current') == {'data': 1}
+    assert read_snapshot(path, 'edited') is None
+    assert read_snapshot(str(tmp_path / 'missing'), 'current') is None
+    (tmp_path / 'periodic.snapshot').write_bytes(b'not a pickle')
+    assert read_snapshot(path, 'current') is None
+
+
+def test_source_hash_covers_the_dataset(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, 'here', str(tmp_path))
+    (tmp_path / 'periodic.dat').write_bytes(b'first')
+    first = snapshot.source_hash()
+    assert snapshot.source_hash() == first
+    (tmp_path / 'periodic.dat').write_bytes(b'second')
+    assert snapshot.source_hash() != first
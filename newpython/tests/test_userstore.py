@@ -0,0 +1,50 @@
+import sqlite3
+
+from userstore import UserStore
+
+
+def test_usernames_are_unique(tmp_path):
+    store = UserStore(str(tmp_path / 'user.db'))
+    try:
+        assert store.add_user('ada', b'hash1')
+        assert not store.add_user('ada', b'hash2')
+        assert store.get_password_hash('ada') == b'hash1'
+        assert store.add_users([('ada', b'hash3'), ('bob', b'hash4'), ('bob', b'hash5')]) == 1
+        assert store.usernames() == {'ada', 'bob'}
+        assert store.get_password_hash('bob') == b'hash4'
+    finally:
+        store.close()
+
+
+def test_batched_import_and_update(tmp_path):
+    store = UserStore(str(tmp_path / 'user.db'))
+    try:
+        reported = []
+        users = [(f'user{i}', b'old') for i in range(25)]
+        assert store.import_users(iter(users), batch_size=10, progress=reported.append) == 25
+        assert reported == [10, 10, 5]
+        assert store.import_users(users, batch_size=10) == 0
+        assert store.update_passwords([('user3', b'new'), ('user24', b'new')]) == 2
+        assert store.get_password_hash('user3') == b'new'
+        assert store.get_password_hash('user4') == b'old'
+    finally:
+        store.close()
+
+
+def test_old_databases_lose_duplicates_once(tmp_path, capsys):
+    path = str(tmp_path / 'user.db')
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE USERS(username TEXT NOT NULL, password TEXT NOT NULL)')
+    conn.executemany('INSERT INTO USERS VALUES(?, ?)', [('ada', 'first'), ('ada', 'second'), ('bob', 'x')])
+    conn.commit()
+    conn.close()
+
+    UserStore(path).close()
+    assert 'Removed 1 duplicate' in capsys.readouterr().out
+    store = UserStore(path)
+    try:
+        assert capsys.readouterr().out == ''
+        assert store.get_password_hash('ada') == b'first'
+        assert store.usernames() == {'ada', 'bob'}
+    finally:
+        store.close()
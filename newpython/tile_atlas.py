@@ -0,0 +1,41 @@
+import pygame
+
+
+# Every element tile pre-rendered at one cell size into a single surface. Frames
+# blit sub-rects of it instead of drawing rectangles and rendering text, so a
+# tile costs one blit whatever the resolution. Rebuilt only when the cell size
+# (the scale) changes.
+class TileAtlas:
+    def __init__(self, records, cell_size, font, border_color, text_color, columns=18):
+        records = list(records)
+        rows = (len(records) + columns - 1) // columns
+        self.cell_size = cell_size
+        self.image = pygame.Surface((columns * cell_size, max(1, rows) * cell_size))
+        self.rects = {}
+        for i, record in enumerate(records):
+            rect = pygame.Rect((i % columns) * cell_size, (i // columns) * cell_size, cell_size, cell_size)
+            pygame.draw.rect(self.image, record.color, rect)
+            pygame.draw.rect(self.image, border_color, rect, 1)
+            symbol = font.render(record.symbol, True, text_color)
+            self.image.blit(symbol, symbol.get_rect(center=rect.center))
+            self.rects[record.symbol] = rect
+        self.tiles = {}
+        self.converted = False
+
+    # Matches the atlas to the display's pixel format once a window exists; the
+    # atlas may have been built earlier on the launcher's warm-up thread
+    def convert(self):
+        if not self.converted and pygame.display.get_surface() is not None:
+            self.image = self.image.convert()
+            self.tiles = {}
+            self.converted = True
+
+    # One tile as its own surface (sharing the atlas pixels), for sprites
+    def tile(self, symbol):
+        tile = self.tiles.get(symbol)
+        if tile is None:
+            tile = self.tiles[symbol] = self.image.subsurface(self.rects[symbol])
+        return tile
+
+    def blit(self, target, symbol, dest):
+        return target.blit(self.image, dest, self.rects[symbol])
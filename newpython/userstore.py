@@ -0,0 +1,141 @@
+import queue
+import sqlite3
+from contextlib import contextmanager
+
+CREATE_USERS = 'CREATE TABLE IF NOT EXISTS USERS(username TEXT NOT NULL, password TEXT NOT NULL)'
+HAS_USERNAME_INDEX = "SELECT 1 FROM sqlite_master WHERE type='index' AND name='users_username'"
+# Databases created before the unique index may hold repeated usernames; logins
+# always matched the first row, so that is the one kept
+DELETE_DUPLICATES = 'DELETE FROM USERS WHERE rowid NOT IN (SELECT MIN(rowid) FROM USERS GROUP BY username)'
+CREATE_USERNAME_INDEX = 'CREATE UNIQUE INDEX users_username ON USERS(username)'
+
+# Fixed SQL text so each connection's statement cache reuses the prepared statements
+SELECT_PASSWORD = 'SELECT password FROM USERS WHERE username=?'
+SELECT_EXISTS = 'SELECT 1 FROM USERS WHERE username=?'
+INSERT_USER = 'INSERT INTO USERS(username, password) VALUES(?, ?)'
+INSERT_USER_IF_NEW = 'INSERT OR IGNORE INTO USERS(username, password) VALUES(?, ?)'
+UPDATE_PASSWORD = 'UPDATE USERS SET password=? WHERE username=?'
+
+
+# SQLite user table shared by every kiosk pointing at the same file. Connections
+# run in WAL mode so readers never block the writer, and are handed out from a
+# small pool so worker threads do not open a connection per request.
+class UserStore:
+    def __init__(self, path='user.db', pool_size=4, busy_timeout=5.0):
+        self.path = path
+        self.pool = queue.Queue()
+        self.connections = []
+        for _ in range(pool_size):
+            conn = sqlite3.connect(path, timeout=busy_timeout, check_same_thread=False,
+                                   isolation_level=None, cached_statements=64)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.connections.append(conn)
+            self.pool.put(conn)
+        with self.transaction() as conn:
+            conn.execute(CREATE_USERS)
+            # Only databases from before the index need the duplicate scan, and only once
+            if conn.execute(HAS_USERNAME_INDEX).fetchone() is None:
+                removed = conn.execute(DELETE_DUPLICATES).rowcount
+                if removed:
+                    print(f"Removed {removed} duplicate user rows from {path}, keeping the first of each username")
+                conn.execute(CREATE_USERNAME_INDEX)
+
+    @contextmanager
+    def connection(self):
+        conn = self.pool.get()
+        try:
+            yield conn
+        finally:
+            self.pool.put(conn)
+
+    # BEGIN IMMEDIATE takes the write lock up front, so two kiosks registering at
+    # once wait on busy_timeout instead of failing halfway through
+    @contextmanager
+    def transaction(self):
+        with self.connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+
+    def get_password_hash(self, username):
+        with self.connection() as conn:
+            row = conn.execute(SELECT_PASSWORD, (username,)).fetchone()
+        if row is None:
+            return None
+        hashed_password = row[0]
+        if isinstance(hashed_password, str):
+            hashed_password = hashed_password.encode('utf-8')
+        return hashed_password
+
+    def usernames(self):
+        with self.connection() as conn:
+            return {row[0] for row in conn.execute('SELECT username FROM USERS')}
+
+    # username -> stored hash, for every user
+    def password_hashes(self):
+        with self.connection() as conn:
+            return dict(conn.execute('SELECT username, password FROM USERS'))
+
+    def user_exists(self, username):
+        with self.connection() as conn:
+            return conn.execute(SELECT_EXISTS, (username,)).fetchone() is not None
+
+    # Returns False if the username is already taken
+    def add_user(self, username, hashed_password):
+        try:
+            with self.transaction() as conn:
+                conn.execute(INSERT_USER, (username, hashed_password))
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    # Registers several users in one transaction; existing usernames are skipped.
+    # Returns the number of users added.
+    def add_users(self, users):
+        with self.transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(INSERT_USER_IF_NEW, users)
+            return conn.total_changes - before
+
+    # Bulk provisioning: write(batch) runs in its own transaction for every
+    # batch_size rows, so a huge import neither holds the write lock for its whole
+    # run nor pays for a commit per user. progress(count) is called after each
+    # batch. Returns the sum of what write() returned.
+    def write_batches(self, rows, write, batch_size, progress=None):
+        total = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                total += write(batch)
+                if progress is not None:
+                    progress(len(batch))
+                batch = []
+        if batch:
+            total += write(batch)
+            if progress is not None:
+                progress(len(batch))
+        return total
+
+    # Adds (username, hash) rows, skipping usernames that exist; returns the number added
+    def import_users(self, users, batch_size=1000, progress=None):
+        return self.write_batches(users, self.add_users, batch_size, progress)
+
+    # Replaces the hashes of existing users from (username, hash) rows; returns the number of rows
+    def update_passwords(self, updates, batch_size=1000, progress=None):
+        return self.write_batches(updates, self.update_batch, batch_size, progress)
+
+    def update_batch(self, updates):
+        with self.transaction() as conn:
+            conn.executemany(UPDATE_PASSWORD, [(hashed, username) for username, hashed in updates])
+        return len(updates)
+
+    def close(self):
+        for conn in self.connections:
+            conn.close()
+        self.connections = []